@@ -0,0 +1,74 @@
+#
+# Measures the PnP parts distance check scaling
+#
+# usage: python bench_cross_check.py [max_parts] [--python]
+#   --python: pure-Python fallback instead of NumPy
+#
+
+import random
+import sys
+import os
+import time
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+# benchmarked module
+import cross_check
+import text_grid
+
+# -----------------------------------------------------------------------------
+
+def make_pnp(nparts: int, seed: int = 0) -> text_grid.ConfiguredTextGrid:
+    """Parts spread over the board with a constant density: ~1 part per 4x4mm"""
+    rnd = random.Random(seed)
+    side_mm = (nparts ** 0.5) * 4.0
+    pnp = text_grid.ConfiguredTextGrid()
+    pnp.text_grid.rows_raw().append(["Designator", "Comment", "X", "Y", "Layer"])
+    for n in range(nparts):
+        pnp.text_grid.rows_raw().append([
+            f"R{n+1}", "10k",
+            f"{rnd.uniform(0, side_mm):.3f}mm", f"{rnd.uniform(0, side_mm):.3f}mm",
+            rnd.choice(("TopLayer", "BottomLayer"))
+        ])
+    pnp.text_grid.nrows = len(pnp.text_grid.rows_raw())
+    pnp.text_grid.ncols = 5
+    pnp.designator_col = "Designator"
+    pnp.comment_col = "Comment"
+    pnp.coord_x_col = "X"
+    pnp.coord_y_col = "Y"
+    pnp.layer_col = "Layer"
+    pnp.last_row = -1
+    return pnp
+
+def make_bom(pnp: text_grid.ConfiguredTextGrid) -> text_grid.ConfiguredTextGrid:
+    bom = text_grid.ConfiguredTextGrid()
+    bom.text_grid.rows_raw().append(["Designator", "Comment", "", ""])
+    for row in pnp.text_grid.rows_raw()[1:]:
+        bom.text_grid.rows_raw().append([row[0], row[1], "", ""])
+    bom.text_grid.nrows = len(bom.text_grid.rows_raw())
+    bom.text_grid.ncols = 4
+    bom.designator_col = "Designator"
+    bom.comment_col = "Comment"
+    bom.last_row = -1
+    return bom
+
+def run(max_parts: int):
+    print(f"{'parts':>8} | {'conflicts':>9} | {'time [s]':>8} | {'us/part':>7}")
+    for nparts in (1_000, 2_000, 5_000, 10_000, 20_000, 50_000, 100_000):
+        if nparts > max_parts:
+            break
+        pnp = make_pnp(nparts)
+        bom = make_bom(pnp)
+        t_start = time.perf_counter()
+        ccr = cross_check.compare(bom, pnp, 3.0, False)
+        elapsed = time.perf_counter() - t_start
+        print(f"{nparts:>8} | {len(ccr.parts_coord_conflicts):>9} | {elapsed:>8.3f} | {elapsed / nparts * 1e6:>7.1f}")
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if "--python" in sys.argv:
+        cross_check.numpy = None
+    print(f"engine: {'Python' if cross_check.numpy is None else 'NumPy'}")
+    run(int(args[0]) if args else 100_000)
@@ -0,0 +1,83 @@
+#
+# Compares the CSV reader with the former parse-inspect-reparse reader,
+# on the double quoted and the apostrophe quoted PnP-like files
+#
+# usage: python bench_csv_reader.py [nrows]
+#
+
+import csv
+import sys
+import os
+import random
+import tempfile
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+from timing import timed
+
+# benchmarked module
+import csv_reader
+from text_grid import TextGrid
+
+# -----------------------------------------------------------------------------
+
+def make_csv(path: str, nrows: int, quote_char: str, seed: int = 0):
+    rnd = random.Random(seed)
+    q = quote_char
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"{q}Designator{q},{q}Comment{q},{q}Layer{q},{q}Footprint{q},{q}Center-X(mm){q},{q}Center-Y(mm){q},{q}Rotation{q}\n")
+        for n in range(nrows):
+            f.write(f"{q}R{n+1}{q},{q}{rnd.randint(1, 99)}k, 1%{q},{q}TopLayer{q},{q}0603{q},"
+                    f"{q}{rnd.uniform(0, 300):.3f}{q},{q}{rnd.uniform(0, 200):.3f}{q},{q}{rnd.choice((0, 90, 180, 270))}{q}\n")
+
+def __read_csv_reparse(file, tg: TextGrid, delim: str, quote_char: str = '"'):
+    """The former reader: the whole file parsed, then re-parsed with ' as a quotechar"""
+    max_cols = 0
+    reader = csv.reader(file, delimiter=delim, quotechar=quote_char)
+    for row_cells in reader:
+        if getattr(csv_reader, "__check_row_valid")(row_cells):
+            row_cells = [cell.strip() for cell in row_cells]
+            max_cols = max(max_cols, len(row_cells))
+            tg.rows_raw().append(row_cells)
+
+    apostr_as_quotechar = False
+    if quote_char != "'" and max_cols > 1 and len(tg.rows_raw()) > 2:
+        for (c, r1_cell) in enumerate(tg.rows_raw()[1]):
+            if r1_cell.startswith("'") and r1_cell.endswith("'"):
+                r2_cell = tg.rows_raw()[2][c]
+                if r2_cell.startswith("'") and r2_cell.endswith("'"):
+                    apostr_as_quotechar = True
+                    break
+
+    if apostr_as_quotechar:
+        tg.rows_raw().clear()
+        file.seek(0)
+        return __read_csv_reparse(file, tg, delim, "'")
+    return max_cols
+
+def read_csv_reparse(path: str, delim: str) -> TextGrid:
+    tg = TextGrid()
+    with open(path, "r", encoding="utf-8") as f:
+        max_cols = __read_csv_reparse(f, tg, delim)
+    tg.nrows = len(tg.rows_raw())
+    tg.ncols = max_cols
+    tg.align_number_of_columns()
+    return tg
+
+def run(nrows: int):
+    print(f"{'quotechar':>9} | {'rows':>7} | {'before [s]':>10} | {'after [s]':>9}")
+
+    for quote_char in ('"', "'"):
+        path = os.path.join(tempfile.gettempdir(), f"boomer_bench_{nrows}_{ord(quote_char)}.csv")
+        if not os.path.isfile(path):
+            make_csv(path, nrows, quote_char)
+
+        t_before, tg_before = timed(read_csv_reparse, path, ",")
+        t_after, tg_after = timed(csv_reader.read_csv, path, ",")
+        assert tg_after.rows_raw() == tg_before.rows_raw()
+        print(f"{quote_char:>9} | {tg_after.nrows:>7} | {t_before:>10.2f} | {t_after:>9.2f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
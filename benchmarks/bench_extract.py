@@ -0,0 +1,58 @@
+#
+# Measures extraction of the parts from the BOM/PnP grids
+#
+# usage: python bench_extract.py [nparts]
+#
+
+import sys
+import os
+import time
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+# benchmarked module
+import cross_check
+import text_grid
+
+from bench_cross_check import make_pnp, make_bom
+
+# -----------------------------------------------------------------------------
+
+def to_columnar(cfg: text_grid.ConfiguredTextGrid) -> text_grid.ConfiguredTextGrid:
+    ctg = text_grid.ColumnarTextGrid()
+    ctg.rows_raw().extend(cfg.text_grid.rows_raw())
+    ctg.nrows = cfg.text_grid.nrows
+    ctg.ncols = cfg.text_grid.ncols
+    ctg.align_number_of_columns()
+    cfg.text_grid = ctg
+    return cfg
+
+def run(nparts: int, repeat: int = 5):
+    extract_bom = cross_check.extract_bom_parts
+    extract_pnp = cross_check.extract_pnp_parts
+
+    print(f"{'grid':>8} | {'parts':>8} | {'BOM [ms]':>8} | {'PnP [ms]':>8} | {'us/row':>6}")
+    for columnar in (False, True):
+        pnp = make_pnp(nparts)
+        bom = make_bom(pnp)
+        if columnar:
+            pnp = to_columnar(pnp)
+            bom = to_columnar(bom)
+
+        bom_time = pnp_time = float("inf")
+        for _ in range(repeat):
+            t_start = time.perf_counter()
+            extract_bom(bom)
+            t_bom = time.perf_counter()
+            extract_pnp(pnp)
+            t_pnp = time.perf_counter()
+            bom_time = min(bom_time, t_bom - t_start)
+            pnp_time = min(pnp_time, t_pnp - t_bom)
+
+        grid_name = "columnar" if columnar else "list"
+        print(f"{grid_name:>8} | {nparts:>8} | {bom_time * 1e3:>8.1f} | {pnp_time * 1e3:>8.1f} | {pnp_time / nparts * 1e6:>6.2f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
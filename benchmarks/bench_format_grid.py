@@ -0,0 +1,79 @@
+#
+# Compares the grid formatter with the former one (cell formatted twice, strings built with +=),
+# for the 25k..100k rows PnP-like grids: whole grid and a small window of rows
+#
+# usage: python bench_format_grid.py [max_nrows]
+#
+
+import random
+import sys
+import os
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+from timing import timed
+
+# benchmarked module
+from text_grid import ColumnarTextGrid, TextGrid
+
+# -----------------------------------------------------------------------------
+
+def make_grid(grid_type: type, nrows: int, seed: int = 0) -> TextGrid:
+    rnd = random.Random(seed)
+    tg = grid_type()
+    tg.rows_raw().append(["Designator", "Comment", "Layer", "Footprint", "Center-X(mm)", "Center-Y(mm)", "Rotation"])
+    for n in range(nrows):
+        tg.rows_raw().append([f"R{n+1}", f"{rnd.randint(1, 99)}k, 1%", "TopLayer", "0603",
+                              f"{rnd.uniform(0, 300):.3f}", f"{rnd.uniform(0, 200):.3f}", str(rnd.choice((0, 90, 180, 270)))])
+    tg.nrows = nrows + 1
+    tg.ncols = 7
+    tg.align_number_of_columns()
+    return tg
+
+def format_grid_before(tg: TextGrid, first_row: int, last_row: int = -1) -> str:
+    """The former formatter"""
+    columns_width = [0 for _ in range(tg.ncols+1)]
+    for r, row in enumerate(tg.rows_raw()):
+        if r >= first_row:
+            for c, cell in enumerate(row):
+                cell = tg.format_cell(cell)
+                columns_width[c] = max(columns_width[c], len(cell))
+
+    grid_formatted = ""
+    last_row = len(tg.rows_raw()) if last_row == -1 else last_row
+    for r, row in enumerate(tg.rows_raw()):
+        if r >= first_row and r <= last_row:
+            row_formatted = "{:0>3} | ".format(r+1)
+            for c, cell in enumerate(row):
+                cell = tg.format_cell(cell)
+                fill = " " * max(columns_width[c] - len(cell), 0)
+                row_formatted += cell + f"{fill} | "
+            grid_formatted += row_formatted + "\n"
+    return grid_formatted
+
+def format_grid_cold(tg: TextGrid, first_row: int, last_row: int = -1) -> str:
+    """The `format_grid()` with the column widths computed again, not taken from the cache"""
+    columns_width = tg.compute_columns_width(first_row)
+    last_row = len(tg.rows_raw()) if last_row == -1 else last_row
+    return "".join(line + "\n" for line in tg.format_rows(first_row, last_row + 1, columns_width))
+
+def run(max_nrows: int):
+    print(f"{'grid':>8} | {'rows':>7} | {'window':>6} | {'before [s]':>10} | {'after [s]':>9} | {'cached widths [s]':>17} | {'after [us/row]':>14}")
+
+    for grid_type in (TextGrid, ColumnarTextGrid):
+        for nrows in (max_nrows // 4, max_nrows // 2, max_nrows):
+            tg = make_grid(grid_type, nrows)
+            # whole grid, then 50 rows in the middle of the grid
+            for (first_row, last_row) in ((0, -1), (nrows // 2, nrows // 2 + 49)):
+                t_before, text_before = timed(format_grid_before, tg, first_row, last_row)
+                t_after, text_after = timed(format_grid_cold, tg, first_row, last_row)
+                t_cached, text_cached = timed(tg.format_grid, first_row, last_row)
+                assert text_after == text_before and text_cached == text_before
+                window = "all" if last_row == -1 else str(last_row - first_row + 1)
+                us_per_row = t_after * 1e6 / nrows
+                print(f"{grid_type.__name__[:8]:>8} | {nrows:>7} | {window:>6} | {t_before:>10.3f} | {t_after:>9.3f} | {t_cached:>17.4f} | {us_per_row:>14.2f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,48 @@
+#
+# Reading the BOM, PnP and PnP2 files of the synthetic board (see datasets.py):
+# one after another, vs all at once on the thread pool and on the process pool
+#
+# usage: python bench_load.py [parts] [formats]
+#
+#   python bench_load.py 20000 csv,xlsx,ods
+#
+
+import sys
+import os
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+import datasets
+from timing import timed
+
+# benchmarked module
+import grid_loader
+
+# -----------------------------------------------------------------------------
+
+def run(nparts: int, formats: list[str]):
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'format':>6} | {'rows':>7} | {'one by one [s]':>14} | {'threads [s]':>11} | {'processes [s]':>13}")
+    for fmt in formats:
+        ds = datasets.make_dataset(nparts, fmt, two_files=True)
+        profile = ds.profile()
+        times = []
+        for pool in grid_loader.LOAD_POOLS:
+            executor = grid_loader.make_executor(pool)
+            try:
+                if executor:
+                    # workers started before the timing
+                    executor.submit(len, "").result()
+                (seconds, (bom, pnp)) = timed(grid_loader.load_files, ds.bom_path, ds.pnp_path, ds.pnp2_path,
+                                              profile, False, None, executor)
+            finally:
+                if executor:
+                    executor.shutdown()
+            times.append(seconds)
+        print(f"{fmt:>6} | {bom.nrows + pnp.nrows:>7} | {times[0]:>14.3f} | {times[1]:>11.3f} | {times[2]:>13.3f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000,
+        sys.argv[2].split(",") if len(sys.argv) > 2 else ["csv", "xlsx", "ods"])
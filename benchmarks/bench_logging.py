@@ -0,0 +1,103 @@
+#
+# Measures the logging overhead of the cross-check with 10k distance conflicts (every conflict is logged):
+# synchronous file/console handlers vs the queue-based logger, at DEBUG and INFO level
+#
+# usage: python bench_logging.py [conflicts]
+#
+
+import gc
+import logging
+import sys
+import os
+import tempfile
+import time
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+# benchmarked module
+import cross_check
+import logger
+import text_grid
+
+# -----------------------------------------------------------------------------
+
+def make_pnp(nconflicts: int) -> text_grid.ConfiguredTextGrid:
+    """Pairs of parts 1mm apart, the pairs 10mm apart: one conflict per pair"""
+    pnp = text_grid.ConfiguredTextGrid()
+    pnp.text_grid.rows_raw().append(["Designator", "Comment", "X", "Y", "Layer"])
+    side = int(nconflicts ** 0.5) + 1
+    for n in range(nconflicts):
+        (x, y) = ((n % side) * 10.0, (n // side) * 10.0)
+        pnp.text_grid.rows_raw().append([f"R{2*n+1}", "10k", f"{x:.3f}", f"{y:.3f}", "Top"])
+        pnp.text_grid.rows_raw().append([f"R{2*n+2}", "10k", f"{x + 1:.3f}", f"{y:.3f}", "Top"])
+    pnp.text_grid.nrows = len(pnp.text_grid.rows_raw())
+    pnp.text_grid.ncols = 5
+    pnp.designator_col = "Designator"
+    pnp.comment_col = "Comment"
+    pnp.coord_x_col = "X"
+    pnp.coord_y_col = "Y"
+    pnp.layer_col = "Layer"
+    pnp.last_row = -1
+    return pnp
+
+def make_bom(pnp: text_grid.ConfiguredTextGrid) -> text_grid.ConfiguredTextGrid:
+    bom = text_grid.ConfiguredTextGrid()
+    bom.text_grid.rows_raw().append(["Designator", "Comment"])
+    for row in pnp.text_grid.rows_raw()[1:]:
+        bom.text_grid.rows_raw().append([row[0], row[1]])
+    bom.text_grid.nrows = len(bom.text_grid.rows_raw())
+    bom.text_grid.ncols = 2
+    bom.designator_col = "Designator"
+    bom.comment_col = "Comment"
+    bom.last_row = -1
+    return bom
+
+def config_sync(logs_dir: str):
+    """The former configuration: file and console handlers called by the logging thread"""
+    logger.config(False, logging.DEBUG, logs_dir)
+    logger.shutdown()
+    log = getattr(logger, "__logger")
+    for handler in list(log.handlers):
+        log.removeHandler(handler)
+    formatter = logging.Formatter(fmt='%(asctime)s %(levelname)s: %(message)s', datefmt='%H:%M:%S')
+    for handler in (logging.FileHandler(os.path.join(logs_dir, "sync.log"), encoding="utf-8"), logging.StreamHandler()):
+        handler.setFormatter(formatter)
+        log.addHandler(handler)
+
+def timed_compare(bom, pnp) -> (float, float, int):
+    """Returns the cross-check time, the time until all the logs are written, number of conflicts"""
+    gc.disable()
+    try:
+        t_start = time.perf_counter()
+        ccr = cross_check.compare(bom, pnp, 3.0, False)
+        t_check = time.perf_counter() - t_start
+        logger.shutdown()
+        t_written = time.perf_counter() - t_start
+    finally:
+        gc.enable()
+    return (t_check, t_written, len(ccr.parts_coord_conflicts))
+
+def run(nconflicts: int):
+    pnp = make_pnp(nconflicts)
+    bom = make_bom(pnp)
+    logs_dir = tempfile.mkdtemp(prefix="boomer_bench_logs_")
+    # console output is measured, but not shown
+    sys.stderr = open(os.devnull, "w")
+
+    print(f"{'logger':>16} | {'conflicts':>9} | {'cross-check [s]':>15} | {'logs written [s]':>16}")
+    for (name, configure) in (
+        ("sync, DEBUG", lambda: config_sync(logs_dir)),
+        ("queue, DEBUG", lambda: logger.config(False, logging.DEBUG, logs_dir)),
+        ("queue, INFO", lambda: logger.config(False, logging.INFO, logs_dir)),
+    ):
+        results = []
+        for _ in range(3):
+            configure()
+            results.append(timed_compare(bom, pnp))
+        (t_check, t_written, nfound) = min(results)
+        print(f"{name:>16} | {nfound:>9} | {t_check:>15.3f} | {t_written:>16.3f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
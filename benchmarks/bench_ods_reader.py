@@ -0,0 +1,70 @@
+#
+# Compares the ODS reader engines: content.xml stream vs odfpy document model
+#
+# usage: python bench_ods_reader.py [nrows]
+#
+
+import sys
+import os
+import random
+import tempfile
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+from timing import timed
+
+from odf import opendocument, table, text
+
+# benchmarked module
+import ods_reader
+
+# -----------------------------------------------------------------------------
+
+def make_ods(path: str, nrows: int, seed: int = 0):
+    """BOM-like sheet, with the trailing empty cells and rows like the LibreOffice saves them"""
+    rnd = random.Random(seed)
+    doc = opendocument.OpenDocumentSpreadsheet()
+    tab = table.Table(name="BOM")
+
+    def add_row(cells: list[str]):
+        tr = table.TableRow()
+        for cell in cells:
+            tc = table.TableCell()
+            tc.addElement(text.P(text=cell))
+            tr.addElement(tc)
+        tr.addElement(table.TableCell(numbercolumnsrepeated=1016))
+        tab.addElement(tr)
+
+    add_row(["Designator", "Comment", "Footprint", "Quantity", "Description", "MPN", "Supplier", "Price"])
+    for n in range(nrows):
+        add_row([
+            f"R{n+1}", rnd.choice(("10k", "1k", "100R", "4k7")), rnd.choice(("0402", "0603", "0805")), "1",
+            "Resistor thick film", f"RC0603FR-07{n}L", "Digikey", f"{rnd.uniform(0.001, 0.1):.4f}"
+        ])
+    tr = table.TableRow(numberrowsrepeated=1048000)
+    tr.addElement(table.TableCell(numbercolumnsrepeated=1024))
+    tab.addElement(tr)
+
+    doc.spreadsheet.addElement(tab)
+    doc.save(path)
+
+def run(nrows: int):
+    path = os.path.join(tempfile.gettempdir(), f"boomer_bench_{nrows}.ods")
+    if not os.path.isfile(path):
+        print(f"Generating {path}...")
+        make_ods(path, nrows)
+
+    t_odfpy, tg_odfpy = timed(ods_reader.read_ods_sheet, path, engine="odfpy", repeat=1)
+    t_stream, tg_stream = timed(ods_reader.read_ods_sheet, path, engine="stream", repeat=1)
+    # the same grid
+    assert (tg_stream.nrows, tg_stream.ncols) == (tg_odfpy.nrows, tg_odfpy.ncols)
+    assert tg_stream.rows_raw() == tg_odfpy.rows_raw()
+
+    print(f"{'engine':>8} | {'rows':>7} | {'cols':>4} | {'time [s]':>8}")
+    print(f"{'odfpy':>8} | {tg_odfpy.nrows:>7} | {tg_odfpy.ncols:>4} | {t_odfpy:>8.2f}")
+    print(f"{'stream':>8} | {tg_stream.nrows:>7} | {tg_stream.ncols:>4} | {t_stream:>8.2f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
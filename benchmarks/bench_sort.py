@@ -0,0 +1,72 @@
+#
+# Compares sorting of the cross-check result lists: natsort.natsorted() of every list
+# vs the designator keys computed once per cross-check
+#
+# usage: python bench_sort.py [ndesignators]
+#
+
+import random
+import sys
+import os
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+from timing import timed
+
+# the former sort
+import natsort
+
+# benchmarked module
+import cross_check
+
+# -----------------------------------------------------------------------------
+
+def make_result(ndesignators: int, seed: int = 0) -> cross_check.CrossCheckResult:
+    """Every designator in one of the lists, and in ~4 distance conflicts"""
+    rnd = random.Random(seed)
+    designators = [f"{rnd.choice(('R', 'C', 'C', 'U', 'D', 'TP'))}{n + 1}" for n in range(ndesignators)]
+    rnd.shuffle(designators)
+    ccr = cross_check.CrossCheckResult()
+    for dsgn in designators:
+        kind = rnd.randrange(3)
+        if kind == 0:
+            ccr.bom_parst_missing_in_pnp.append((dsgn, "10k"))
+        elif kind == 1:
+            ccr.pnp_parst_missing_in_bom.append((dsgn, "100n"))
+        else:
+            ccr.parts_comment_mismatch.append((dsgn, "100nF", "100n", "C0603"))
+    # every pair once, like the distance check gives
+    ccr.parts_coord_conflicts = [
+        (dsgn, other, rnd.uniform(0, 3)) for dsgn in designators for other in rnd.sample(designators, 2)
+    ]
+    return ccr
+
+def sort_natsort(ccr: cross_check.CrossCheckResult):
+    return [natsort.natsorted(lst) for lst in (ccr.bom_parst_missing_in_pnp, ccr.pnp_parst_missing_in_bom,
+                                               ccr.parts_comment_mismatch, ccr.parts_coord_conflicts)]
+
+def sort_keys(ccr: cross_check.CrossCheckResult):
+    keys = cross_check.DesignatorKeys()
+    by_designator = lambda item: keys[item[0]]
+    return [
+        sorted(ccr.bom_parst_missing_in_pnp, key=by_designator),
+        sorted(ccr.pnp_parst_missing_in_bom, key=by_designator),
+        sorted(ccr.parts_comment_mismatch, key=by_designator),
+        sorted(ccr.parts_coord_conflicts, key=lambda item: (keys[item[0]], keys[item[1]])),
+    ]
+
+def run(ndesignators: int):
+    ccr = make_result(ndesignators)
+    (t_natsort, lists_natsort) = timed(sort_natsort, ccr)
+    (t_keys, lists_keys) = timed(sort_keys, ccr)
+    assert lists_keys == lists_natsort
+
+    nitems = sum(map(len, lists_keys))
+    print(f"{'sort':>15} | {'designators':>11} | {'items':>7} | {'time [s]':>8}")
+    print(f"{'natsorted':>15} | {ndesignators:>11} | {nitems:>7} | {t_natsort:>8.3f}")
+    print(f"{'designator keys':>15} | {ndesignators:>11} | {nitems:>7} | {t_keys:>8.3f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
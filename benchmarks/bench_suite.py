@@ -0,0 +1,145 @@
+#
+# Benchmark suite on the synthetic boards (see datasets.py) of 1k/10k/100k parts:
+# times every reader (BOM, PnP in mm/mils, single and two-file PnP),
+# the `cross_check.compare()` and the `report_generator.prepare_html_report()`.
+# Results are saved as JSON, to be compared with the results of another commit.
+#
+# usage: python bench_suite.py [--sizes 1000,10000,100000] [--formats csv,xls,xlsx,ods]
+#                              [--repeat 3] [--output results.json] [--baseline old_results.json]
+#
+#   default output: results/<commit>.json
+#   --baseline: prints the time ratio against the results of another run
+#
+
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import sys
+import os
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+import datasets
+from timing import timed
+
+# benchmarked modules
+import cross_check
+import grid_loader
+import report_generator
+
+# -----------------------------------------------------------------------------
+
+SIZES = (1_000, 10_000, 100_000)
+# (coordinates in mils, two PnP files)
+VARIANTS = ((False, False), (True, False), (False, True), (True, True))
+MIN_DISTANCE = 3.0
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=benchmarks_path,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+class Suite:
+    def __init__(self, repeat: int, baseline: dict):
+        self.repeat = repeat
+        self.baseline = baseline
+        # {benchmark name : {"seconds": ..., other values}}
+        self.results: dict[str, dict] = {}
+        print(f"{'benchmark':<40} | {'rows':>7} | {'time [s]':>8} | {'baseline':>8} | {'ratio':>5}")
+
+    def add(self, name: str, seconds: float, **values):
+        self.results[name] = {"seconds": round(seconds, 6), **values}
+        line = f"{name:<40} | {values.get('rows', ''):>7} | {seconds:>8.3f}"
+        if name in self.baseline:
+            base = self.baseline[name]["seconds"]
+            line += f" | {base:>8.3f} | {seconds / base if base else 0.0:>5.2f}"
+        print(line, flush=True)
+
+    def run(self, name: str, func, *args, describe=lambda result: {}):
+        """Times the func, `describe` returns the values stored with the time"""
+        (seconds, result) = timed(func, *args, repeat=self.repeat)
+        self.add(name, seconds, **describe(result))
+        return result
+
+    def skip(self, name: str, reason: str):
+        self.results[name] = {"skipped": reason}
+        print(f"{name:<40} | skipped: {reason}", flush=True)
+
+def bench_size(suite: Suite, nparts: int, formats: list[str]):
+    # the cross-check and the report do not depend on the file format: performed once per variant
+    compared = set()
+    rows = lambda grid: {"rows": grid.nrows}
+
+    for fmt in formats:
+        for (mils, two_files) in VARIANTS:
+            variant = f"{nparts}/{'mils' if mils else 'mm'}/{'2 files' if two_files else '1 file'}"
+            try:
+                ds = datasets.make_dataset(nparts, fmt, mils, two_files)
+            except ValueError as e:
+                suite.skip(f"read.pnp/{fmt}/{variant}", str(e))
+                continue
+
+            profile = ds.profile()
+            # BOM does not depend on the PnP variant
+            if f"read.bom/{fmt}/{nparts}" not in suite.results:
+                bom = suite.run(f"read.bom/{fmt}/{nparts}", grid_loader.load_bom, ds.bom_path, profile, describe=rows)
+            pnp = suite.run(f"read.pnp/{fmt}/{variant}", grid_loader.load_pnp, ds.pnp_path, ds.pnp2_path, profile, describe=rows)
+
+            if variant in compared:
+                continue
+            compared.add(variant)
+            bom_cfg = grid_loader.configure_bom(bom, profile)
+            pnp_cfg = grid_loader.configure_pnp(pnp, profile)
+            ccresult = suite.run(f"compare/{variant}", cross_check.compare, bom_cfg, pnp_cfg, MIN_DISTANCE, mils,
+                                 describe=lambda ccr: {"findings": ccr.findings_count()})
+            pnp_names = (os.path.basename(ds.pnp_path), os.path.basename(ds.pnp2_path))
+            suite.run(f"report.html/{variant}", report_generator.prepare_html_report,
+                      os.path.basename(ds.bom_path), pnp_names, MIN_DISTANCE, ccresult,
+                      describe=lambda html: {"bytes": len(html)})
+
+def main():
+    parser = argparse.ArgumentParser(description="BOOMER benchmark suite")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="numbers of parts, comma separated")
+    parser.add_argument("--formats", default=",".join(datasets.FORMATS), help="file formats, comma separated")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    parser.add_argument("--output", help="results JSON file; default: results/<commit>.json")
+    parser.add_argument("--baseline", help="results JSON file to compare with")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    formats = args.formats.split(",")
+    for fmt in formats:
+        if fmt not in datasets.FORMATS:
+            parser.error(f"unknown format '{fmt}'")
+
+    commit = git_commit()
+    suite = Suite(args.repeat, baseline)
+    for nparts in map(int, args.sizes.split(",")):
+        bench_size(suite, nparts, formats)
+
+    output = args.output or os.path.join(benchmarks_path, "results", f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "commit": commit,
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": cross_check.numpy is not None,
+            "repeat": args.repeat,
+            "results": suite.results,
+        }, f, indent=2)
+    print(f"Results saved to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#
+# BOM with a long tail of notes rows after the parts: the whole file read,
+# vs only the rows of the parts - the row window pushed into the reader
+#
+# usage: python bench_window.py [parts] [tail rows] [formats]
+#
+#   python bench_window.py 1000 50000 csv,xls,xlsx,ods
+#
+
+import sys
+import os
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+import datasets
+from timing import timed
+
+# benchmarked module
+import grid_loader
+from text_grid import RowWindow
+
+# -----------------------------------------------------------------------------
+
+def make_bom(nparts: int, ntail: int, fmt: str) -> tuple[str, int]:
+    """Returns the file path and the grid row of the last part"""
+    rows = datasets.bom_rows(datasets.make_parts(nparts))
+    last_row = len(rows) - 1
+    rows.extend([f"Note {n + 1}", "assembly and legal notes", f"rev {n % 7}", ""] for n in range(ntail))
+
+    path = os.path.join(datasets.DATA_DIR, f"bom_tail_{nparts}_{ntail}.{fmt}")
+    if not os.path.isfile(path):
+        os.makedirs(datasets.DATA_DIR, exist_ok=True)
+        print(f"Generating {path}...")
+        datasets.WRITERS[fmt](path + ".tmp." + fmt, rows)
+        os.replace(path + ".tmp." + fmt, path)
+    return (path, last_row)
+
+def run(nparts: int, ntail: int, formats: list[str]):
+    print(f"{'format':>6} | {'rows':>7} | {'whole file [s]':>14} | {'window rows':>11} | {'window [s]':>10} | {'speedup':>7}")
+    for fmt in formats:
+        try:
+            (path, last_row) = make_bom(nparts, ntail, fmt)
+        except ValueError as e:
+            print(f"{fmt:>6} | skipped: {e}")
+            continue
+
+        (t_all, grid) = timed(grid_loader.read_grid, path)
+        (t_window, grid_window) = timed(grid_loader.read_grid, path, False, ",", "", RowWindow(0, last_row))
+        assert grid_window.rows_raw() == grid.rows_raw()[:last_row + 1]
+        print(f"{fmt:>6} | {grid.nrows:>7} | {t_all:>14.3f} | {grid_window.nrows:>11} | {t_window:>10.3f} | {t_all / t_window:>6.1f}x")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50_000,
+        sys.argv[3].split(",") if len(sys.argv) > 3 else list(datasets.FORMATS))
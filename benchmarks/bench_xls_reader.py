@@ -0,0 +1,97 @@
+#
+# Compares the XLS reader with the former cell-by-cell reader,
+# on the examples/ .xls files scaled up by repeating their rows
+#
+# usage: python bench_xls_reader.py [nrows]
+#
+
+import glob
+import sys
+import os
+import tempfile
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+from timing import timed
+
+import xlrd
+# writing .xls: pip install xlwt
+import xlwt
+
+# benchmarked module
+import xls_reader
+from text_grid import TextGrid
+
+# -----------------------------------------------------------------------------
+
+def scale_xls(src_path: str, dst_path: str, nrows: int):
+    """Writes the sheet 0 rows repeatedly, until `nrows` written"""
+    book = xlrd.open_workbook(filename=src_path)
+    sheet = book.sheet_by_index(0)
+    wbook = xlwt.Workbook()
+    wsheet = wbook.add_sheet("BOM")
+    for r_idx in range(nrows):
+        src_row = r_idx % sheet.nrows
+        for c_idx, (ctype, value) in enumerate(zip(sheet.row_types(src_row), sheet.row_values(src_row))):
+            if ctype in (xlrd.XL_CELL_NUMBER, xlrd.XL_CELL_TEXT):
+                wsheet.write(r_idx, c_idx, value)
+    wbook.save(dst_path)
+
+def read_xls_sheet_cells(path: str) -> TextGrid:
+    """The former reader: whole workbook, cell by cell"""
+    book = xlrd.open_workbook(filename=path)
+    sheet = book.sheet_by_index(0)
+    tg = TextGrid()
+
+    for r_idx in range(sheet.nrows):
+        row_cells = []
+        for c_idx in range(sheet.ncols):
+            cellobj = sheet.cell(r_idx, c_idx)
+            cell_val = "" if (cellobj.value is None) else cellobj.value
+
+            if cellobj.ctype in (xlrd.XL_CELL_NUMBER, xlrd.XL_CELL_TEXT):
+                if isinstance(cell_val, float) and int(cell_val) == cell_val:
+                    cell_val = int(cell_val)
+                    cell_val = repr(cell_val)
+                elif isinstance(cell_val, float):
+                    cell_val = repr(cell_val)
+                elif isinstance(cell_val, str):
+                    try:
+                        cell_val_fl = float(cell_val)
+                        if int(cell_val_fl) == cell_val_fl:
+                            cell_val = int(cell_val_fl)
+                        else:
+                            cell_val = cell_val_fl
+                        cell_val = repr(cell_val)
+                    except Exception:
+                        pass
+            cell_val = cell_val.replace("\n", " ⏎ ")
+            row_cells.append(cell_val.strip())
+        if getattr(xls_reader, "__check_row_valid")(row_cells):
+            tg.rows_raw().append(row_cells)
+
+    tg.nrows = len(tg.rows_raw())
+    tg.ncols = sheet.ncols
+    tg.align_number_of_columns()
+    return tg
+
+def run(nrows: int):
+    examples_path = os.path.join(os.path.dirname(benchmarks_path), "examples")
+    print(f"{'file':>24} | {'rows':>6} | {'before [s]':>10} | {'after [s]':>9}")
+
+    for src_path in sorted(glob.glob(os.path.join(examples_path, "*", "*.xls"))):
+        name = os.path.basename(src_path)
+        path = os.path.join(tempfile.gettempdir(), f"boomer_bench_{nrows}_{name}")
+        if not os.path.isfile(path):
+            scale_xls(src_path, path, nrows)
+
+        t_before, tg_before = timed(read_xls_sheet_cells, path, repeat=1)
+        t_after, tg_after = timed(xls_reader.read_xls_sheet, path, repeat=1)
+        assert tg_after.rows_raw() == tg_before.rows_raw()
+        print(f"{name[:24]:>24} | {tg_after.nrows:>6} | {t_before:>10.2f} | {t_after:>9.2f}")
+
+if __name__ == "__main__":
+    # .xls sheet is limited to 65536 rows
+    run(min(int(sys.argv[1]) if len(sys.argv) > 1 else 60_000, 65_536))
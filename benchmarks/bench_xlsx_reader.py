@@ -0,0 +1,85 @@
+#
+# Compares the streaming (read-only) XLSX reader with the former full-mode reader
+#
+# usage: python bench_xlsx_reader.py [nrows]
+#
+
+import datetime
+import sys
+import os
+import random
+import tempfile
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+from timing import timed
+
+import openpyxl
+
+# benchmarked module
+import xlsx_reader
+from text_grid import TextGrid, RowWindow
+
+# -----------------------------------------------------------------------------
+
+def make_xlsx(path: str, nrows: int, seed: int = 0):
+    """BOM-like sheet, with the numeric cells"""
+    rnd = random.Random(seed)
+    # not the write-only mode: it does not store the sheet dimensions, like Excel does
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Designator", "Comment", "Footprint", "Quantity", "Description", "MPN", "Supplier", "Price"])
+    for n in range(nrows):
+        sheet.append([
+            f"R{n+1}", rnd.choice(("10k", "1k", "100R", "4k7")), rnd.choice(("0402", "0603", "0805")), 1,
+            "Resistor thick film\nAEC-Q200", f"RC0603FR-07{n}L", "Digikey", rnd.uniform(0.001, 0.1)
+        ])
+    workbook.save(path)
+
+def read_xlsx_sheet_full(path: str) -> TextGrid:
+    """The former reader: workbook loaded in the full mode"""
+    workbook = openpyxl.load_workbook(path)
+    sheet = workbook.active
+    tg = TextGrid()
+
+    for row in sheet.iter_rows(min_row=1, max_col=sheet.max_column, max_row=sheet.max_row, values_only=True):
+        row_cells = []
+        for cell in row:
+            if cell is None:
+                cell = ""
+            else:
+                if isinstance(cell, float) or isinstance(cell, int):
+                    if isinstance(cell, float) and int(cell) == float(cell):
+                        cell = int(cell)
+                    cell = repr(cell)
+                elif isinstance(cell, datetime.datetime):
+                    cell = str(cell)
+            cell = cell.replace("\n", " ⏎ ")
+            row_cells.append(cell.strip())
+        tg.rows_raw().append(row_cells)
+
+    tg.nrows = len(tg.rows_raw())
+    tg.ncols = sheet.max_column
+    tg.align_number_of_columns()
+    return tg
+
+def run(nrows: int):
+    path = os.path.join(tempfile.gettempdir(), f"boomer_bench_{nrows}_dim.xlsx")
+    if not os.path.isfile(path):
+        print(f"Generating {path}...")
+        make_xlsx(path, nrows)
+
+    t_full, tg_full = timed(read_xlsx_sheet_full, path, repeat=1)
+    t_stream, tg_stream = timed(xlsx_reader.read_xlsx_sheet, path, repeat=1)
+    t_last, _ = timed(xlsx_reader.read_xlsx_sheet, path, False, RowWindow(0, 1000), repeat=1)
+    assert tg_stream.rows_raw() == tg_full.rows_raw()
+
+    print(f"{'reader':>22} | {'rows':>7} | {'time [s]':>8}")
+    print(f"{'full':>22} | {tg_full.nrows:>7} | {t_full:>8.2f}")
+    print(f"{'streaming':>22} | {tg_stream.nrows:>7} | {t_stream:>8.2f}")
+    print(f"{'streaming, 1k rows':>22} | {1001:>7} | {t_last:>8.2f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,237 @@
+#
+# Deterministic, synthetic BOM and PnP files for the benchmarks:
+# every supported format (csv/xls/xlsx/ods), coordinates in mm or mils,
+# PnP as a single file with the layer column, or as top + bottom files.
+#
+# The same (nparts, seed) always gives the same parts; files are generated once,
+# in the temp directory, and reused by the next runs.
+#
+
+import configparser
+import csv
+import os
+import random
+import sys
+import tempfile
+import zipfile
+from xml.sax.saxutils import escape
+
+# adding src path to search list
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(benchmarks_path), "src"))
+
+from project import Profile
+
+# -----------------------------------------------------------------------------
+
+# bump when the generated content changes, so the old files are not reused
+DATA_VERSION = 1
+DATA_DIR = os.path.join(tempfile.gettempdir(), f"boomer_bench_data_v{DATA_VERSION}")
+
+FORMATS = ("csv", "xls", "xlsx", "ods")
+# .xls sheet limit
+XLS_MAX_ROWS = 65536
+MM_PER_MIL = 0.0254
+
+# designator prefix: (comments, footprints)
+PART_KINDS = {
+    "R": (("10k", "1k", "100R", "4k7", "47k", "0R"), ("0402", "0603", "0805")),
+    "C": (("100n", "1u", "10u", "22p", "4u7"), ("0402", "0603", "1206")),
+    "D": (("BAT54", "LED red", "LED green"), ("SOD123", "0603")),
+    "U": (("LM358", "NE555", "STM32F103C8T6"), ("SOIC8", "LQFP48")),
+}
+
+class Part:
+    def __init__(self, designator: str, comment: str, footprint: str, x_mm: float, y_mm: float, layer: str):
+        self.designator = designator
+        self.comment = comment
+        self.footprint = footprint
+        self.x_mm = x_mm
+        self.y_mm = y_mm
+        self.layer = layer
+
+def make_parts(nparts: int, seed: int = 0) -> list[Part]:
+    """Parts spread over the board with a constant density: ~1 part per 4x4mm"""
+    rnd = random.Random(seed)
+    side_mm = (nparts ** 0.5) * 4.0
+    counters = dict.fromkeys(PART_KINDS, 0)
+    parts = []
+    for _ in range(nparts):
+        prefix = rnd.choices(tuple(PART_KINDS), weights=(50, 35, 10, 5))[0]
+        counters[prefix] += 1
+        (comments, footprints) = PART_KINDS[prefix]
+        parts.append(Part(f"{prefix}{counters[prefix]}", rnd.choice(comments), rnd.choice(footprints),
+                          round(rnd.uniform(0, side_mm), 3), round(rnd.uniform(0, side_mm), 3),
+                          rnd.choice(("TopLayer", "BottomLayer"))))
+    return parts
+
+# the findings of the cross-check, at a constant rate
+def __missing_in_bom(n: int) -> bool:
+    return n % 199 == 198
+
+def __missing_in_pnp(n: int) -> bool:
+    return n % 211 == 210
+
+def __pnp_comment(n: int, part: Part) -> str:
+    return part.comment.upper() if n % 97 == 96 else part.comment
+
+def bom_rows(parts: list[Part]) -> list[list]:
+    """BOM with the parts grouped by the comment and footprint, up to 10 designators in a row"""
+    groups: dict[tuple[str, str], list[str]] = {}
+    for n, part in enumerate(parts):
+        if not __missing_in_bom(n):
+            groups.setdefault((part.comment, part.footprint), []).append(part.designator)
+
+    rows = [["Designator", "Comment", "Footprint", "Quantity"]]
+    for (comment, footprint), designators in groups.items():
+        for i in range(0, len(designators), 10):
+            chunk = designators[i:i + 10]
+            rows.append([",".join(chunk), comment, footprint, len(chunk)])
+    return rows
+
+def pnp_rows(parts: list[Part], mils: bool, layer: str = "") -> list[list]:
+    """
+    PnP rows, coordinates in mm or mils;
+    layer="": all the parts with the layer column, otherwise only the parts of given layer, without the layer column
+    """
+    unit = "mil" if mils else "mm"
+    header = ["Designator", "Comment", "Layer", "Footprint", f"Center-X({unit})", f"Center-Y({unit})", "Rotation"]
+    if layer:
+        header.remove("Layer")
+    rows = [header]
+    for n, part in enumerate(parts):
+        if __missing_in_pnp(n) or (layer and part.layer != layer):
+            continue
+        (x, y) = (round(part.x_mm / MM_PER_MIL, 1), round(part.y_mm / MM_PER_MIL, 1)) if mils else (part.x_mm, part.y_mm)
+        row = [part.designator, __pnp_comment(n, part), part.layer, part.footprint, x, y, 90 * (n % 4)]
+        if layer:
+            del row[2]
+        rows.append(row)
+    return rows
+
+# -----------------------------------------------------------------------------
+
+def write_csv(path: str, rows: list[list]):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        csv.writer(f, quoting=csv.QUOTE_MINIMAL).writerows(rows)
+
+def write_xlsx(path: str, rows: list[list]):
+    import openpyxl
+    # not the write-only mode: it does not store the sheet dimensions, like Excel does
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+def write_xls(path: str, rows: list[list]):
+    # writing .xls: pip install xlwt
+    import xlwt
+    if len(rows) > XLS_MAX_ROWS:
+        raise ValueError(f".xls sheet is limited to {XLS_MAX_ROWS} rows")
+    workbook = xlwt.Workbook()
+    sheet = workbook.add_sheet("Sheet1")
+    for r, row in enumerate(rows):
+        for c, cell in enumerate(row):
+            sheet.write(r, c, cell)
+    workbook.save(path)
+
+def write_ods(path: str, rows: list[list]):
+    """Minimal .ods written directly: odfpy takes minutes for the 100k rows"""
+    ns = ('xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+          'xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0" '
+          'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"')
+    content = [f'<?xml version="1.0" encoding="UTF-8"?>\n<office:document-content {ns} office:version="1.2">'
+               '<office:body><office:spreadsheet><table:table table:name="Sheet1">']
+    for row in rows:
+        content.append("<table:table-row>")
+        for cell in row:
+            if isinstance(cell, str):
+                content.append(f'<table:table-cell office:value-type="string"><text:p>{escape(cell)}</text:p></table:table-cell>')
+            else:
+                content.append(f'<table:table-cell office:value-type="float" office:value="{cell}"><text:p>{cell}</text:p></table:table-cell>')
+        content.append("</table:table-row>")
+    content.append("</table:table></office:spreadsheet></office:body></office:document-content>")
+
+    manifest = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<manifest:manifest xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0" manifest:version="1.2">'
+                '<manifest:file-entry manifest:full-path="/" manifest:media-type="application/vnd.oasis.opendocument.spreadsheet"/>'
+                '<manifest:file-entry manifest:full-path="content.xml" manifest:media-type="text/xml"/>'
+                '</manifest:manifest>')
+    with zipfile.ZipFile(path, "w") as ods_zip:
+        # the mimetype goes first, not compressed
+        ods_zip.writestr("mimetype", "application/vnd.oasis.opendocument.spreadsheet", zipfile.ZIP_STORED)
+        ods_zip.writestr("META-INF/manifest.xml", manifest, zipfile.ZIP_DEFLATED)
+        ods_zip.writestr("content.xml", "".join(content), zipfile.ZIP_DEFLATED)
+
+WRITERS = {
+    "csv": write_csv,
+    "xls": write_xls,
+    "xlsx": write_xlsx,
+    "ods": write_ods,
+}
+
+# -----------------------------------------------------------------------------
+
+class Dataset:
+    """BOM and PnP files of one board, with the profile describing them"""
+
+    def __init__(self, name: str, bom_path: str, pnp_path: str, pnp2_path: str, mils: bool):
+        self.name = name
+        self.bom_path = bom_path
+        self.pnp_path = pnp_path
+        self.pnp2_path = pnp2_path
+        self.mils = mils
+
+    def profile(self) -> Profile:
+        profile = Profile(configparser.ConfigParser())
+        profile.name = self.name
+        profile.bom_designator_col = "Designator"
+        profile.bom_comment_col = "Comment"
+        profile.pnp_designator_col = "Designator"
+        profile.pnp_comment_col = "Comment"
+        profile.pnp_footprint_col = "Footprint"
+        unit = "mil" if self.mils else "mm"
+        profile.pnp_coord_x_col = f"Center-X({unit})"
+        profile.pnp_coord_y_col = f"Center-Y({unit})"
+        # two files: the layer column is added while merging them, named after the first row's layer
+        profile.pnp_layer_col = "top" if self.pnp2_path else "Layer"
+        profile.pnp_coord_unit_mils = self.mils
+        return profile
+
+def make_dataset(nparts: int, fmt: str, mils: bool = False, two_files: bool = False,
+                 seed: int = 0, data_dir: str = DATA_DIR) -> Dataset:
+    """
+    Returns the dataset, generating the files not existing yet;
+    ValueError if the format cannot store that many rows (.xls)
+    """
+    write = WRITERS[fmt]
+    os.makedirs(data_dir, exist_ok=True)
+    name = f"{nparts}_{'mils' if mils else 'mm'}{'_2f' if two_files else ''}_s{seed}"
+    bom_path = os.path.join(data_dir, f"bom_{nparts}_s{seed}.{fmt}")
+    pnp_path = os.path.join(data_dir, f"pnp_{name}.{fmt}")
+    pnp2_path = os.path.join(data_dir, f"pnp2_{name}.{fmt}") if two_files else ""
+
+    parts = None
+    def get_parts() -> list[Part]:
+        nonlocal parts
+        if parts is None:
+            parts = make_parts(nparts, seed)
+        return parts
+
+    def generate(path: str, make_rows):
+        if os.path.isfile(path):
+            return
+        print(f"Generating {path}...")
+        # written under a temporary name: interrupted generation leaves no broken file
+        tmp_path = path + ".tmp." + fmt
+        write(tmp_path, make_rows(get_parts()))
+        os.replace(tmp_path, path)
+
+    generate(bom_path, bom_rows)
+    if two_files:
+        generate(pnp_path, lambda parts: pnp_rows(parts, mils, "TopLayer"))
+        generate(pnp2_path, lambda parts: pnp_rows(parts, mils, "BottomLayer"))
+    else:
+        generate(pnp_path, lambda parts: pnp_rows(parts, mils))
+    return Dataset(f"{fmt}_{name}", bom_path, pnp_path, pnp2_path, mils)
@@ -15,12 +15,14 @@ import sys
 import time
 import klembord
 
-import xls_reader
-import xlsx_reader
-import csv_reader
-import ods_reader
+import background
+import check_pipeline
+import file_watcher
+import grid_cache
+import grid_preview
 import text_grid
-import cross_check
+import grid_loader
+import perf
 import report_generator
 from column_selector import ColumnsSelector, ColumnsSelectorResult
 from project import *
@@ -38,6 +40,25 @@ APP_DATE = "(c) 2023-2026"
 # global instance
 proj = Project()
 
+# files read and parsed, kept for the next load
+grids_cache = None
+# BOM, PnP and PnP2 files read at once
+load_executor = None
+
+def create_loaders():
+    """
+    Creates the `grids_cache` and the `load_executor`; called by the `CtkApp`, not on import:
+    the "process" pool workers import this module again
+    """
+    global grids_cache, load_executor
+    grids_cache = grid_cache.GridCache(
+        store_dir=os.path.join(logger.get_logs_directory(), "grid_cache") if proj.grid_cache_store else None)
+    try:
+        load_executor = grid_loader.make_executor(proj.load_pool)
+    except ValueError as e:
+        logger.warning(f"[common] load_pool: {e}")
+        load_executor = grid_loader.make_executor("thread")
+
 # -----------------------------------------------------------------------------
 
 class ProjectProfileFrame(customtkinter.CTkFrame):
@@ -185,6 +206,11 @@ class ProjectFrame(customtkinter.CTkFrame):
                                                         checkbox_width=18, checkbox_height=18)
         self.config_logs.chx_color_logs.grid(row=1, column=0, pady=5, padx=5, sticky="w")
 
+        self.config_logs.opt_log_level = customtkinter.CTkOptionMenu(self.config_logs, values=list(logger.LEVELS),
+                                                                     width=100, command=self.opt_log_level_event)
+        self.config_logs.opt_log_level.set(proj.log_level)
+        self.config_logs.opt_log_level.grid(row=2, column=0, pady=5, padx=5, sticky="w")
+
     def clear_previews(self):
         self.opt_pnp_var.set("")
         self.opt_pnp2_var.set("")
@@ -195,17 +221,8 @@ class ProjectFrame(customtkinter.CTkFrame):
     def find_pnp_files(self, bom_path: str):
         if os.path.isfile(bom_path):
             # load all files from the BOM directory to the PnP list
-            bom_dir = os.path.dirname(bom_path)
-            logger.debug(f"Search PnP in: {bom_dir}")
             self.opt_pnp_var.set("")
-            self.pnp_names = [""]
-            for de in os.scandir(bom_dir):
-                # logger.debug("PnP path: " + de.path)
-                # take only the file name
-                pnp_fname = os.path.basename(de.path)
-                if pnp_fname != os.path.basename(bom_path):
-                    if not pnp_fname.lower().endswith(".html"):
-                        self.pnp_names.append(pnp_fname)
+            self.pnp_names = [""] + grid_loader.find_pnp_files(bom_path)
             self.opt_pnp_fname.configure(values=self.pnp_names, state=tkinter.NORMAL)
             self.opt_pnp2_fname.configure(values=self.pnp_names, state=tkinter.NORMAL)
             # self.config_frame.configure(state=tkinter.NORMAL)
@@ -213,6 +230,7 @@ class ProjectFrame(customtkinter.CTkFrame):
     def opt_bom_event(self, bom_path: str):
         # sourcery skip: extract-method, use-fstring-for-concatenation
         logger.debug(f"Open BOM: {bom_path}")
+        self.app.jobs.cancel()
         self.clear_previews()
 
         # reset entire project
@@ -258,6 +276,7 @@ class ProjectFrame(customtkinter.CTkFrame):
 
     def button_browse_event(self):  # sourcery skip: de-morgan, extract-method
         logger.debug("Browse BOM")
+        self.app.jobs.cancel()
         self.clear_previews()
 
         # https://docs.python.org/3/library/dialog.html
@@ -307,6 +326,11 @@ class ProjectFrame(customtkinter.CTkFrame):
         # logger.debug(f"CHBX event: {Config.instance().color_logs}")
         proj.save()
 
+    def opt_log_level_event(self, level: str):
+        logger.set_level(level)
+        proj.log_level = level
+        proj.save()
+
     def config_frames_load_profile(self):
         self.bom_config.load_profile()
         self.pnp_config.load_profile()
@@ -334,58 +358,33 @@ class BOMView(customtkinter.CTkFrame):
 
         super().__init__(master, **kwargs)
 
-        self.textbox = customtkinter.CTkTextbox(self,
-                                                font=customtkinter.CTkFont(size=12, family="Consolas"),
-                                                activate_scrollbars=True,
-                                                wrap='none')
-        self.textbox.grid(row=0, column=0, columnspan=3, padx=10, pady=10, sticky="nsew")
-        # self.textbox.tag_config('highlight', background='white', foreground='red')
+        self.preview_box = ui_helpers.GridPreviewBox(self, fg_color="transparent")
+        self.preview_box.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
-        self.entry_search = customtkinter.CTkEntry(self, placeholder_text="search...")
-        self.entry_search.grid(row=1, column=0, padx=5, pady=5, sticky="wens")
-
-        self.btn_search = customtkinter.CTkButton(self, text="Find", command=self.button_find_event)
-        self.btn_search.grid(row=1, column=1, pady=5, padx=5, sticky="we")
-
-        self.lbl_occurences = customtkinter.CTkLabel(self, text="Found: 0")
-        self.lbl_occurences.grid(row=1, column=2, pady=5, padx=5, sticky="")
-
-    def load_bom(self, path: str, **kwargs):
+    def load_bom(self, path: str):
+        """Reads the file in the background"""
         self.clear_preview()
-
-        if not os.path.isfile(path):
-            raise FileNotFoundError(f"File '{path}' does not exists")
-
-        path_lower = path.lower()
-        if path_lower.endswith("xls"):
-            proj.bom_grid = xls_reader.read_xls_sheet(path)
-        elif path_lower.endswith("xlsx"):
-            proj.bom_grid = xlsx_reader.read_xlsx_sheet(path)
-        elif path_lower.endswith("ods"):
-            proj.bom_grid = ods_reader.read_ods_sheet(path)
-        elif path_lower.endswith("csv"):
-            delim = proj.profile.bom_delimiter
-            proj.bom_grid = csv_reader.read_csv(path, delim)
-        else:
-            raise RuntimeError("Unknown file type")
-
+        self.app.jobs.submit("Loading BOM", lambda token, progress: self.read_bom(path), self.show_bom,
+                             lambda e: logger.error(f"Cannot load BOM: {e}"))
+
+    @staticmethod
+    def read_bom(path: str) -> tuple[text_grid.TextGrid, grid_preview.GridPreview]:
+        """Returns the grid and its preview; runs on the worker thread"""
+        with perf.run("load BOM"):
+            grid = grid_loader.load_bom(path, proj.profile, proj.columnar_grids, grids_cache)
+            return (grid, grid_preview.GridPreview(grid, proj.profile.bom_first_row, proj.profile.bom_last_row))
+
+    def show_bom(self, bom: tuple[text_grid.TextGrid, grid_preview.GridPreview]):
+        (proj.bom_grid, bom_preview) = bom
         logger.info(f"BOM: {proj.bom_grid.nrows} rows x {proj.bom_grid.ncols} cols")
-
-        bom_txt_grid = proj.bom_grid.format_grid(proj.profile.bom_first_row, proj.profile.bom_last_row)
-        self.textbox.insert("0.0", bom_txt_grid)
+        self.preview_box.set_preview(bom_preview)
         proj.bom_grid_dirty = False
 
     def clear_preview(self):
-        self.textbox.delete("0.0", tkinter.END)
-
-    def button_find_event(self):
-        txt = self.entry_search.get()
-        logger.info(f"Find '{txt}'")
-        cnt = ui_helpers.textbox_find_text(self.textbox, txt)
-        self.lbl_occurences.configure(text=f"Found: {cnt}")
+        self.preview_box.clear()
 
 # -----------------------------------------------------------------------------
 
@@ -470,6 +469,7 @@ class BOMConfig(customtkinter.CTkFrame):
     def opt_separator_event(self, new_sep: str):
         logger.info(f"  BOM separator: {new_sep}")
         proj.profile.bom_separator = new_sep
+        proj.profile.bom_quotechar = ""
         self.btn_save.configure(state=tkinter.NORMAL)
         self.button_load_event()
 
@@ -539,10 +539,7 @@ class BOMConfig(customtkinter.CTkFrame):
     def button_load_event(self):
         logger.debug("Load BOM...")
         self.btn_columns.configure(state=tkinter.NORMAL)
-        try:
-            self.bom_view.load_bom(proj.bom_path)
-        except Exception as e:
-            logger.error(f"Cannot load BOM: {e}")
+        self.bom_view.load_bom(proj.bom_path)
 
 # -----------------------------------------------------------------------------
 
@@ -553,91 +550,33 @@ class PnPView(customtkinter.CTkFrame):
 
         super().__init__(master, **kwargs)
 
-        self.textbox = customtkinter.CTkTextbox(self,
-                                                font=customtkinter.CTkFont(size=12, family="Consolas"),
-                                                activate_scrollbars=True,
-                                                wrap='none')
-        self.textbox.grid(row=0, column=0, columnspan=3, padx=10, pady=10, sticky="nsew")
+        self.preview_box = ui_helpers.GridPreviewBox(self, fg_color="transparent")
+        self.preview_box.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
-        self.entry_search = customtkinter.CTkEntry(self, placeholder_text="search...")
-        self.entry_search.grid(row=1, column=0, padx=5, pady=5, sticky="wens")
-
-        self.btn_search = customtkinter.CTkButton(self, text="Find", command=self.button_find_event)
-        self.btn_search.grid(row=1, column=1, pady=5, padx=5, sticky="we")
-
-        self.lbl_occurences = customtkinter.CTkLabel(self, text="Found: 0")
-        self.lbl_occurences.grid(row=1, column=2, pady=5, padx=5, sticky="")
-
     def load_pnp(self, path: str, path2: str):
-        # sourcery skip: extract-method, use-fstring-for-formatting
+        """Reads the file(s) in the background"""
         self.clear_preview()
-
-        if not os.path.isfile(path):
-            raise FileNotFoundError(f"File '{path}' does not exists")
-
-        # check if optional second PnP file exists
-        if path2 != "" and not os.path.isfile(path2):
-            raise FileNotFoundError(f"File '{path2}' does not exists")
-
-        path_lower = path.lower()
-        if path_lower.endswith("xls"):
-            proj.pnp_grid = xls_reader.read_xls_sheet(path)
-        elif path_lower.endswith("xlsx"):
-            proj.pnp_grid = xlsx_reader.read_xlsx_sheet(path)
-        elif path_lower.endswith("ods"):
-            proj.pnp_grid = ods_reader.read_ods_sheet(path)
-        else: # assume CSV
-            delim = proj.profile.pnp_delimiter
-            proj.pnp_grid = csv_reader.read_csv(path, delim)
-
-        log_f = logger.info if proj.pnp_grid.nrows > 0 else logger.warning
-        log_f(f"PnP: {proj.pnp_grid.nrows} rows x {proj.pnp_grid.ncols} cols")
-
-        # load the optional second PnP file
-        if path2 != "":
-            path2_lower = path2.lower()
-            if path2_lower.endswith("xls"):
-                pnp2_grid = xls_reader.read_xls_sheet(path2)
-            elif path2_lower.endswith("xlsx"):
-                pnp2_grid = xlsx_reader.read_xlsx_sheet(path)
-            elif path2_lower.endswith("ods"):
-                pnp2_grid = ods_reader.read_ods_sheet(path2)
-            else: # assume CSV
-                delim = proj.profile.pnp_delimiter
-                pnp2_grid = csv_reader.read_csv(path2, delim)
-
-            log_f = logger.info if pnp2_grid.nrows > 0 else logger.warning
-            log_f("PnP2: {} rows x {} cols".format(pnp2_grid.nrows, pnp2_grid.ncols))
-
-            # merge
-            if pnp2_grid.ncols != proj.pnp_grid.ncols:
-                raise ValueError("PnP has {} columns, but PnP2 has {} columns".format(
-                    proj.pnp_grid.ncols, pnp2_grid.ncols
-                ))
-
-            # add a layer column (only for 2 separate files)
-            for row in proj.pnp_grid.rows_raw():
-                row.append("top")
-            for row in pnp2_grid.rows_raw():
-                row.append("bot")
-
-            proj.pnp_grid.nrows += pnp2_grid.nrows
-            proj.pnp_grid.rows_raw().extend(pnp2_grid.rows_raw())
-
-        pnp_txt_grid = proj.pnp_grid.format_grid(proj.profile.pnp_first_row, proj.profile.pnp_last_row)
-        self.textbox.insert("0.0", pnp_txt_grid)
+        self.app.jobs.submit("Loading PnP", lambda token, progress: self.read_pnp(path, path2), self.show_pnp,
+                             lambda e: logger.error(f"Cannot load PnP: {e}"))
+
+    @staticmethod
+    def read_pnp(path: str, path2: str) -> tuple[text_grid.TextGrid, grid_preview.GridPreview]:
+        """Returns the grid and its preview; runs on the worker thread"""
+        with perf.run("load PnP"):
+            # PnP and PnP2 read at once
+            (_, grid) = grid_loader.load_files("", path, path2, proj.profile, proj.columnar_grids, grids_cache,
+                                               load_executor)
+            return (grid, grid_preview.GridPreview(grid, proj.profile.pnp_first_row, proj.profile.pnp_last_row))
+
+    def show_pnp(self, pnp: tuple[text_grid.TextGrid, grid_preview.GridPreview]):
+        (proj.pnp_grid, pnp_preview) = pnp
+        self.preview_box.set_preview(pnp_preview)
         proj.pnp_grid_dirty = False
 
     def clear_preview(self):
-        self.textbox.delete("0.0", tkinter.END)
-
-    def button_find_event(self):
-        txt = self.entry_search.get()
-        logger.info(f"Find '{txt}'")
-        cnt = ui_helpers.textbox_find_text(self.textbox, txt)
-        self.lbl_occurences.configure(text=f"Found: {cnt}")
+        self.preview_box.clear()
 
 # -----------------------------------------------------------------------------
 
@@ -724,6 +663,7 @@ class PnPConfig(customtkinter.CTkFrame):
     def opt_separator_event(self, new_sep: str):
         logger.info(f"  PnP separator: {new_sep}")
         proj.profile.pnp_separator = new_sep
+        proj.profile.pnp_quotechar = ""
         self.btn_save.configure(state=tkinter.NORMAL)
         self.button_load_event()
 
@@ -808,10 +748,7 @@ class PnPConfig(customtkinter.CTkFrame):
         self.btn_columns.configure(state=tkinter.NORMAL)
         pnp_path = os.path.join(os.path.dirname(proj.bom_path), proj.pnp_fname)
         pnp2_path = "" if proj.pnp2_fname == "" else os.path.join(os.path.dirname(proj.bom_path), proj.pnp2_fname)
-        try:
-            self.pnp_view.load_pnp(pnp_path, pnp2_path)
-        except Exception as e:
-            logger.error(f"Cannot load PnP: {e}")
+        self.pnp_view.load_pnp(pnp_path, pnp2_path)
 
 # -----------------------------------------------------------------------------
 
@@ -843,8 +780,12 @@ class ReportView(customtkinter.CTkFrame):
             </pre>
             <p> The summary <b>is</b>: None</p>
         """
+        # the full report file; the `report_html` shows only its summary
+        self.report_path = ""
+        # cross-check stages results, reused by the next cross-check
+        self.pipeline = check_pipeline.CheckPipeline()
         self.htmlview = ui_helpers.HTMLScrolledTextWithPPM(self, wrap='none', html=self.report_html, menuitems="c")
-        self.htmlview.grid(row=0, column=0, columnspan=5, padx=10, pady=10, sticky="nsew")
+        self.htmlview.grid(row=0, column=0, columnspan=6, padx=10, pady=10, sticky="nsew")
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -864,98 +805,168 @@ class ReportView(customtkinter.CTkFrame):
         self.lbl_occurences = customtkinter.CTkLabel(self, text="Found: 0")
         self.lbl_occurences.grid(row=1, column=4, pady=5, padx=5, sticky="")
 
+        # BOM/PnP files changes trigger the cross-check
+        self.watcher = file_watcher.FileWatcher(self.after, self.files_changed_event)
+        self.watch_var = customtkinter.BooleanVar(value=proj.watch_files)
+        self.chx_watch = customtkinter.CTkCheckBox(self, text="Watch files",
+                                                   command=self.checkbox_watch_event,
+                                                   variable=self.watch_var,
+                                                   checkbox_width=18, checkbox_height=18)
+        self.chx_watch.grid(row=1, column=5, pady=5, padx=5, sticky="")
+        if proj.watch_files:
+            self.watcher.watch(self.watched_paths())
+
     def clear_preview(self):
         self.report_html = ""
+        self.report_path = ""
         self.htmlview.delete("0.0", tkinter.END)
 
-    def button_crosscheck_event(self):
-        logger.info("Performing cross-check...")
-        self.clear_preview()
-
-        if proj.bom_grid and proj.bom_grid_dirty:
-            # reload file if manual load was successful
-            try:
-                logger.info("Reload BOM...")
-                self.bom_view.load_bom(proj.bom_path)
-            except Exception as e:
-                logger.error(f"Cannot load BOM: {e}")
-                return
-
-        if proj.pnp_grid and proj.pnp_grid_dirty:
-            # reload file if manual load was successful
-            try:
-                logger.info("Reload PnP...")
-                pnp_path = os.path.join(os.path.dirname(proj.bom_path), proj.pnp_fname)
-                pnp2_path = "" if proj.pnp2_fname == "" else os.path.join(os.path.dirname(proj.bom_path), proj.pnp2_fname)
-                self.pnp_view.load_pnp(pnp_path, pnp2_path)
-            except Exception as e:
-                logger.error(f"Cannot load PnP: {e}")
-                return
+    @staticmethod
+    def read_files(bom_path: str, pnp_path: str, pnp2_path: str) -> tuple[tuple, tuple]:
+        """Returns the BOM and PnP grids with their previews; runs on the worker thread"""
+        with perf.run("load files"):
+            (bom_grid, pnp_grid) = grid_loader.load_files(bom_path, pnp_path, pnp2_path, proj.profile,
+                                                          proj.columnar_grids, grids_cache, load_executor)
+            return ((bom_grid, grid_preview.GridPreview(bom_grid, proj.profile.bom_first_row, proj.profile.bom_last_row)),
+                    (pnp_grid, grid_preview.GridPreview(pnp_grid, proj.profile.pnp_first_row, proj.profile.pnp_last_row)))
+
+    @staticmethod
+    def watched_paths() -> list[str]:
+        if proj.bom_path == "":
+            return []
+        pnp_dir = os.path.dirname(proj.bom_path)
+        return [proj.bom_path,
+                os.path.join(pnp_dir, proj.pnp_fname) if proj.pnp_fname else "",
+                os.path.join(pnp_dir, proj.pnp2_fname) if proj.pnp2_fname else ""]
+
+    def checkbox_watch_event(self):
+        proj.watch_files = self.watch_var.get()
+        proj.save()
+        if proj.watch_files:
+            self.watcher.watch(self.watched_paths())
+        else:
+            self.watcher.stop()
 
-        bom_cols_ok = proj.profile.check_bom_columns()
-        if not bom_cols_ok[0]:
-            MessageBox(app=self.app, dialog_type="o",
-                        message=bom_cols_ok[1],
-                        callback=lambda btn: btn)
+    def files_changed_event(self, paths: list[str]):
+        if self.app.jobs.busy:
+            # loading or checking: try when finished
+            self.after(file_watcher.DEBOUNCE_MS, lambda: self.files_changed_event(paths))
             return
-
-        pnp_cols_ok = proj.profile.check_pnp_columns()
-        if not pnp_cols_ok[0]:
-            MessageBox(app=self.app, dialog_type="o",
-                        message=pnp_cols_ok[1],
-                        callback=lambda btn: btn)
+        # the loaded grids are out-of-date: reloaded by the cross-check (unchanged files come from the cache)
+        watched = [os.path.abspath(path) if path else "" for path in self.watched_paths()]
+        if not watched:
             return
+        if watched[0] in paths:
+            proj.bom_grid_dirty = True
+        if any(path in paths for path in watched[1:] if path):
+            proj.pnp_grid_dirty = True
+        self.button_crosscheck_event(auto=True)
 
-        bom_cfg = text_grid.ConfiguredTextGrid()
-        bom_cfg.text_grid = proj.bom_grid
-        bom_cfg.has_column_headers = proj.profile.bom_has_column_headers
-        bom_cfg.designator_col = proj.profile.bom_designator_col
-        bom_cfg.comment_col = proj.profile.bom_comment_col
-        bom_cfg.first_row = proj.profile.bom_first_row
-        bom_cfg.last_row = proj.profile.bom_last_row
-
-        pnp_cfg = text_grid.ConfiguredTextGrid()
-        pnp_cfg.text_grid = proj.pnp_grid
-        pnp_cfg.has_column_headers = proj.profile.pnp_has_column_headers
-        pnp_cfg.designator_col = proj.profile.pnp_designator_col
-        pnp_cfg.comment_col = proj.profile.pnp_comment_col
-        pnp_cfg.first_row = proj.profile.pnp_first_row
-        pnp_cfg.last_row = proj.profile.pnp_last_row
-        pnp_cfg.coord_x_col = proj.profile.pnp_coord_x_col
-        pnp_cfg.coord_y_col = proj.profile.pnp_coord_y_col
-        pnp_cfg.layer_col = proj.profile.pnp_layer_col
-        pnp_cfg.footprint_col = proj.profile.pnp_footprint_col
+    def button_crosscheck_event(self, auto: bool = False):
+        """auto: triggered by the files watcher - columns errors are only logged"""
+        logger.info("Performing cross-check...")
 
-        try:
-            ccresult = cross_check.compare(bom_cfg, pnp_cfg, proj.get_min_distance(), proj.profile.pnp_coord_unit_mils)
-            pnps = (proj.pnp_fname, proj.pnp2_fname)
-            self.report_html = report_generator.prepare_html_report(proj.get_name(), pnps, proj.get_min_distance(), ccresult)
+        for cols_ok in (proj.profile.check_bom_columns(), proj.profile.check_pnp_columns()):
+            if not cols_ok[0]:
+                if auto:
+                    logger.warning(cols_ok[1])
+                else:
+                    MessageBox(app=self.app, dialog_type="o",
+                                message=cols_ok[1],
+                                callback=lambda btn: btn)
+                return
+
+        self.clear_preview()
+        if proj.watch_files:
+            # the project could have been changed since the watching started
+            self.watcher.watch(self.watched_paths())
+
+        # reload files if manual load was successful
+        reload_bom = proj.bom_grid and proj.bom_grid_dirty
+        reload_pnp = proj.pnp_grid and proj.pnp_grid_dirty
+        bom_path = proj.bom_path
+        pnp_path = os.path.join(os.path.dirname(proj.bom_path), proj.pnp_fname)
+        pnp2_path = "" if proj.pnp2_fname == "" else os.path.join(os.path.dirname(proj.bom_path), proj.pnp2_fname)
+        pnps = (proj.pnp_fname, proj.pnp2_fname)
+        min_distance = proj.get_min_distance()
+        report_path = report_generator.get_report_path(proj.bom_path, ".html")
+        # mark as potentially dirty, meaning that the files could have been changed manually
+        # since the last cross-check was performed so the local copy is out-of-date
+        proj.bom_grid_dirty = True
+        proj.pnp_grid_dirty = True
+
+        def crosscheck(token: background.CancelToken, progress) -> tuple:
+            with perf.run("cross-check") as stats:
+                (bom, pnp) = (None, None)
+                try:
+                    if reload_bom and reload_pnp:
+                        progress("Reload BOM and PnP...")
+                        (bom, pnp) = self.read_files(bom_path, pnp_path, pnp2_path)
+                        token.check()
+                except background.JobCancelled:
+                    raise
+                except Exception as e:
+                    raise RuntimeError(f"Cannot load files: {e}")
+
+                try:
+                    if reload_bom and not bom:
+                        progress("Reload BOM...")
+                        bom = self.bom_view.read_bom(bom_path)
+                        token.check()
+                except background.JobCancelled:
+                    raise
+                except Exception as e:
+                    raise RuntimeError(f"Cannot load BOM: {e}")
+
+                try:
+                    if reload_pnp and not pnp:
+                        progress("Reload PnP...")
+                        pnp = self.pnp_view.read_pnp(pnp_path, pnp2_path)
+                        token.check()
+                except background.JobCancelled:
+                    raise
+                except Exception as e:
+                    raise RuntimeError(f"Cannot load PnP: {e}")
+
+                try:
+                    progress("Cross-check...")
+                    bom_cfg = grid_loader.configure_bom(bom[0] if bom else proj.bom_grid, proj.profile)
+                    pnp_cfg = grid_loader.configure_pnp(pnp[0] if pnp else proj.pnp_grid, proj.profile)
+                    # only the stages of changed files or settings are performed
+                    ccresult = self.pipeline.check(bom_cfg, pnp_cfg, min_distance, proj.profile.pnp_coord_unit_mils)
+                    token.check()
+                    progress("Report...")
+                    # full report streamed to the file, the widget shows only the summary
+                    report_html = self.pipeline.report(report_path, proj.get_name(), pnps, min_distance, ccresult, stats)
+                except background.JobCancelled:
+                    raise
+                except Exception as e:
+                    raise RuntimeError(f"Report generator error: {e}")
+                return (bom, pnp, report_html)
+
+        def crosscheck_done(result: tuple):
+            (bom, pnp, self.report_html) = result
+            self.report_path = report_path
+            if bom:
+                self.bom_view.show_bom(bom)
+            if pnp:
+                self.pnp_view.show_pnp(pnp)
             self.htmlview.set_html(self.report_html)
-            self.save_report_to_file()
-        except Exception as e:
-            logger.error(f"Report generator error: {e}")
-        finally:
-            # mark as potentially dirty, meaning that the files could have been changed manually
-            # since the last cross-check was performed so the local copy is out-of-date
             proj.bom_grid_dirty = True
             proj.pnp_grid_dirty = True
 
-    def save_report_to_file(self):
-        report_dir = os.path.dirname(proj.bom_path)
-        report_fname = os.path.splitext(os.path.basename(proj.bom_path))[0]
-        report_fname += "_report.html"
-        report_path = os.path.join(report_dir, report_fname)
-        logger.debug("Saving to .html file...")
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write('<html>\n<body>\n')
-            f.write(self.report_html)
-            f.write('</body>\n</html>\n')
-            logger.info(f"Report saved to: {report_path}")
+        self.app.jobs.submit("Cross-check", crosscheck, crosscheck_done, lambda e: logger.error(f"{e}"))
 
     def button_copyhtml_event(self):
         logger.debug("Copy as HTML")
-        plain_txt = self.htmlview.get("0.0", tkinter.END)
-        klembord.set_with_rich_text(text=plain_txt, html=self.report_html)
+        if self.report_path and os.path.isfile(self.report_path):
+            # the full report, not the summary shown
+            report_html = report_generator.read_html_report_file(self.report_path)
+            plain_txt = report_generator.html_report_text(report_html)
+        else:
+            report_html = self.report_html
+            plain_txt = self.htmlview.get("0.0", tkinter.END)
+        klembord.set_with_rich_text(text=plain_txt, html=report_html)
 
     def button_find_event(self):
         txt = self.entry_search.get()
@@ -969,9 +980,12 @@ class CtkApp(customtkinter.CTk):
     def __init__(self):
         logger.info('Ctk app is starting')
         super().__init__()
+        create_loaders()
 
         self.title(f"{APP_NAME}")
         self.geometry("1200x600")
+        # files loading, cross-check: performed on the worker thread
+        self.jobs = background.JobRunner(self.after)
         self.grid_columnconfigure(0, weight=1)
 
         # panel with Proj/BOM/PnP/Result
@@ -1020,13 +1034,42 @@ class CtkApp(customtkinter.CTk):
         tab_report.grid_columnconfigure(0, weight=1)
         tab_report.grid_rowconfigure(0, weight=1)
 
+        # status bar
+        status_bar = customtkinter.CTkFrame(self)
+        status_bar.grid(row=2, column=0, padx=5, pady=(0, 5), sticky="we")
+        status_bar.grid_columnconfigure(0, weight=1)
+        self.lbl_status = customtkinter.CTkLabel(status_bar, text="Ready", anchor="w")
+        self.lbl_status.grid(row=0, column=0, padx=5, pady=2, sticky="we")
+        self.btn_cancel = customtkinter.CTkButton(status_bar, text="Cancel", width=80, command=self.jobs.cancel)
+        self.btn_cancel.grid(row=0, column=1, padx=5, pady=2, sticky="e")
+        self.btn_cancel.configure(state=tkinter.DISABLED)
+        self.jobs.on_status = self.update_status
+
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # UI ready
         logger.info('Application ready.')
 
+    def update_status(self, text: str):
+        self.lbl_status.configure(text=text or "Ready")
+        self.btn_cancel.configure(state=tkinter.NORMAL if text else tkinter.DISABLED)
+
+    def on_close(self):
+        self.report_view.watcher.close()
+        self.jobs.shutdown()
+        if load_executor:
+            load_executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(f"UI thread blocked for max {self.jobs.max_block_ms:.0f} ms")
+        self.destroy()
+
 # -----------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    logger.config(proj.color_logs)
+    try:
+        logger.config(proj.color_logs, proj.log_level)
+    except ValueError as e:
+        logger.config(proj.color_logs)
+        logger.warning(f"[common] log_level: {e}")
     logger.info(f"{APP_NAME}   {APP_DATE}")
 
     if (sys.version_info.major < 3) or (sys.version_info.major == 3 and sys.version_info.minor < 9):
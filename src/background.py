@@ -0,0 +1,172 @@
+#
+# 2026-10-18
+#
+
+import concurrent.futures
+import logger
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+# -----------------------------------------------------------------------------
+
+# how often the UI thread checks for the finished jobs
+POLL_INTERVAL_MS = 10
+# longest acceptable UI thread blocking (one frame at 60 FPS)
+UI_BLOCK_BUDGET_MS = 16
+
+class JobCancelled(Exception):
+    """Raised by the `CancelToken.check()` when the job was cancelled"""
+
+class CancelToken:
+    """Cancellation flag shared by the UI thread and the job"""
+
+    def __init__(self):
+        self.__event = threading.Event()
+
+    def cancel(self):
+        self.__event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.__event.is_set()
+
+    def check(self):
+        """Called by the job between its stages"""
+        if self.__event.is_set():
+            raise JobCancelled()
+
+class JobRunner:
+    """
+    Runs the jobs one by one on a worker thread, so the UI thread is never blocked.
+
+    The job is a function `work(token: CancelToken, progress: Callable[[str], None])`;
+    its result is passed to the `on_done()`, exception to the `on_error()`.
+    Both callbacks, and the `on_status()`, are called on the UI thread: the results
+    are posted to a queue, polled with the `schedule` function (Tk's `widget.after`).
+    Cancelled job results are dropped.
+
+    A poll stops processing the events once it has taken UI_BLOCK_BUDGET_MS, the rest of them
+    is processed by the next poll, so the UI events are handled in between.
+    The UI thread blocking is measured as the delay of every poll and the time of every callback;
+    these longer than UI_BLOCK_BUDGET_MS are logged.
+    """
+
+    def __init__(self, schedule: Callable[[int, Callable[[], None]], Any]):
+        self.__schedule = schedule
+        self.__executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="job")
+        self.__events: queue.SimpleQueue = queue.SimpleQueue()
+        self.__token = CancelToken()
+        self.__pending = 0
+        self.__poll_due: Optional[float] = None
+        # called with the job name / progress text, "" when idle
+        self.on_status: Optional[Callable[[str], None]] = None
+        # instrumentation: longest UI thread blocking noticed, [ms]
+        self.max_block_ms = 0.0
+
+    @property
+    def busy(self) -> bool:
+        return self.__pending > 0
+
+    def submit(self, name: str, work: Callable[[CancelToken, Callable[[str], None]], Any],
+               on_done: Callable[[Any], None], on_error: Optional[Callable[[Exception], None]] = None):
+        self.__pending += 1
+        self.__executor.submit(self.__run, name, work, on_done, on_error, self.__token)
+        if self.__poll_due is None:
+            self.__set_status(name)
+            self.__schedule_poll()
+
+    def cancel(self):
+        """Cancels the running and queued jobs"""
+        if self.busy:
+            logger.info("Cancelling...")
+        self.__token.cancel()
+        # jobs submitted later are not affected
+        self.__token = CancelToken()
+
+    def shutdown(self):
+        self.cancel()
+        self.__executor.shutdown(wait=False)
+
+    def poll(self):
+        """Processes the jobs events; runs on the UI thread"""
+        self.__poll_due = None
+        t_poll = time.perf_counter()
+
+        while True:
+            if (time.perf_counter() - t_poll) * 1000 > UI_BLOCK_BUDGET_MS:
+                # let the UI thread handle its events; the rest at the next poll
+                break
+            try:
+                (kind, name, callback, value, token) = self.__events.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "progress":
+                if not token.cancelled:
+                    self.__set_status(value)
+                continue
+
+            self.__pending -= 1
+            if token.cancelled:
+                logger.info(f"{name}: cancelled")
+            elif kind == "done":
+                self.__timed_callback(name, callback, value)
+            elif kind == "error":
+                if callback:
+                    self.__timed_callback(name, callback, value)
+                else:
+                    logger.error(f"{name}: {value}")
+
+        if self.busy:
+            self.__schedule_poll()
+        else:
+            self.__set_status("")
+
+        self.__measure_block("poll", (time.perf_counter() - t_poll) * 1000)
+
+    def __run(self, name: str, work: Callable, on_done: Callable, on_error: Optional[Callable], token: CancelToken):
+        """Runs on the worker thread"""
+        if token.cancelled:
+            self.__events.put(("cancelled", name, None, None, token))
+            return
+
+        progress = lambda text: self.__events.put(("progress", name, None, text, token))
+        progress(name)
+        try:
+            result = work(token, progress)
+            token.check()
+            self.__events.put(("done", name, on_done, result, token))
+        except JobCancelled:
+            self.__events.put(("cancelled", name, None, None, token))
+        except Exception as e:
+            self.__events.put(("error", name, on_error, e, token))
+
+    def __schedule_poll(self):
+        self.__poll_due = time.perf_counter() + POLL_INTERVAL_MS / 1000
+        self.__schedule(POLL_INTERVAL_MS, self.__poll_instrumented)
+
+    def __poll_instrumented(self):
+        # the poll comes late if the UI thread was busy with something else
+        if self.__poll_due is not None:
+            self.__measure_block("UI thread", (time.perf_counter() - self.__poll_due) * 1000)
+        self.poll()
+
+    def __timed_callback(self, name: str, callback: Callable, value: Any):
+        t_start = time.perf_counter()
+        try:
+            callback(value)
+        except Exception as e:
+            # keep polling the other jobs
+            logger.error(f"{name}: {e}")
+        self.__measure_block(name, (time.perf_counter() - t_start) * 1000)
+
+    def __measure_block(self, what: str, block_ms: float):
+        self.max_block_ms = max(self.max_block_ms, block_ms)
+        if block_ms > UI_BLOCK_BUDGET_MS:
+            logger.debug(f"{what}: UI thread blocked for {block_ms:.0f} ms")
+
+    def __set_status(self, text: str):
+        if self.on_status:
+            self.on_status(text)
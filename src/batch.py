@@ -0,0 +1,184 @@
+#
+# 2026-10-18
+#
+
+import concurrent.futures
+import glob
+import logger
+import os
+import perf
+import time
+from typing import Optional
+
+import cross_check
+import grid_loader
+import report_generator
+from project import Profile, Project
+
+# -----------------------------------------------------------------------------
+
+class BatchJob:
+    """Files of a single project to be cross-checked"""
+
+    def __init__(self, bom_path: str, pnp_path: str, pnp2_path: str, profile_name: str):
+        self.bom_path = bom_path
+        self.pnp_path = pnp_path
+        self.pnp2_path = pnp2_path
+        self.profile_name = profile_name
+        # set if the job cannot be performed, eg. PnP file not found
+        self.error = ""
+
+class BatchResult:
+    """Outcome of the BatchJob"""
+
+    def __init__(self, job: BatchJob):
+        self.job = job
+        self.seconds = 0.0
+        self.error = ""
+        self.report_path = ""
+        # number of: BOM parts missing in PnP, PnP parts missing in BOM, comment mismatches, distance conflicts
+        self.counts = (0, 0, 0, 0)
+
+    @property
+    def findings_count(self) -> int:
+        return sum(self.counts)
+
+# -----------------------------------------------------------------------------
+
+def check_files(proj: Project, bom_path: str, pnp_path: str, pnp2_path: str, min_distance: float,
+                executor: Optional[concurrent.futures.Executor] = None) -> cross_check.CrossCheckResult:
+    """Reads the files using the `proj.profile` (concurrently, with the `executor`), and compares them"""
+    (bom_grid, pnp_grid) = grid_loader.load_files(bom_path, pnp_path, pnp2_path, proj.profile, executor=executor)
+    return cross_check.compare(grid_loader.configure_bom(bom_grid, proj.profile),
+                               grid_loader.configure_pnp(pnp_grid, proj.profile),
+                               min_distance, proj.profile.pnp_coord_unit_mils)
+
+def load_project(config_path: str, profile_name: str) -> Project:
+    """Raises ValueError if the profile is not found or incomplete"""
+    Profile.CONFIG_FILE_NAME = config_path
+    proj = Project()
+    if profile_name not in proj.cfg_get_profiles():
+        raise ValueError(f"Profile '{profile_name}' not found in '{config_path}'")
+    proj.profile.load(profile_name)
+
+    for (cols_ok, msg) in (proj.profile.check_bom_columns(), proj.profile.check_pnp_columns()):
+        if not cols_ok:
+            raise ValueError(msg.replace("\n", " "))
+    return proj
+
+def configured_jobs(config_path: str) -> list[BatchJob]:
+    """All the projects from the config file"""
+    Profile.CONFIG_FILE_NAME = config_path
+    proj = Project()
+    jobs = []
+    for bom_path in proj.get_projects(remove_missing=False):
+        section = proj.get_section(f"project.{bom_path}")
+        bom_dir = os.path.dirname(bom_path)
+        pnp2_fname = section.get("pnp2", "")
+        jobs.append(BatchJob(bom_path,
+                             os.path.join(bom_dir, section.get("pnp", "")),
+                             os.path.join(bom_dir, pnp2_fname) if pnp2_fname else "",
+                             section.get("profile", "")))
+    return jobs
+
+def glob_jobs(pattern: str, profile_name: str) -> list[BatchJob]:
+    """BOM files matching the pattern (** allowed), with the PnP files found in the BOM directory"""
+    jobs = []
+    for bom_path in sorted(glob.glob(pattern, recursive=True)):
+        if not os.path.isfile(bom_path):
+            continue
+        bom_dir = os.path.dirname(bom_path)
+        try:
+            (pnp_fname, pnp2_fname) = grid_loader.guess_pnp_files(bom_path)
+            jobs.append(BatchJob(bom_path,
+                                 os.path.join(bom_dir, pnp_fname),
+                                 os.path.join(bom_dir, pnp2_fname) if pnp2_fname else "",
+                                 profile_name))
+        except ValueError as e:
+            # reported as a failed job
+            job = BatchJob(bom_path, "", "", profile_name)
+            job.error = str(e)
+            jobs.append(job)
+    return jobs
+
+def run_job(job: BatchJob, config_path: str, min_distance: float = None) -> BatchResult:
+    """
+    Loads and compares the files, saves the <BOM>_report.html;
+    executed in the worker process, so never raises
+    """
+    result = BatchResult(job)
+    t_start = time.perf_counter()
+
+    try:
+        if job.error:
+            raise ValueError(job.error)
+        logger.info(f"Checking '{job.bom_path}'")
+
+        with perf.run(os.path.basename(job.bom_path)) as stats:
+            proj = load_project(config_path, job.profile_name)
+            if min_distance is None:
+                min_distance = proj.get_min_distance()
+            ccresult = check_files(proj, job.bom_path, job.pnp_path, job.pnp2_path, min_distance)
+
+            result.counts = (len(ccresult.bom_parst_missing_in_pnp), len(ccresult.pnp_parst_missing_in_bom),
+                             len(ccresult.parts_comment_mismatch), len(ccresult.parts_coord_conflicts))
+            pnp_names = (os.path.basename(job.pnp_path), os.path.basename(job.pnp2_path))
+            result.report_path = report_generator.get_report_path(job.bom_path, ".html")
+            report_generator.write_html_report_file(result.report_path, os.path.basename(job.bom_path), pnp_names,
+                                                    min_distance, ccresult, stats)
+    except Exception as e:
+        result.error = str(e) or type(e).__name__
+
+    result.seconds = time.perf_counter() - t_start
+    return result
+
+def run_batch(jobs: list[BatchJob], config_path: str, max_jobs: int = 1, min_distance: float = None) -> list[BatchResult]:
+    """
+    Runs the jobs in `max_jobs` processes (1: in the current process);
+    results are in the order of `jobs`
+    """
+    if max_jobs <= 1 or len(jobs) <= 1:
+        return [run_job(job, config_path, min_distance) for job in jobs]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_jobs) as executor:
+        futures = [executor.submit(run_job, job, config_path, min_distance) for job in jobs]
+        results = []
+        for (job, future) in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # the worker process crashed
+                result = BatchResult(job)
+                result.error = f"Worker failed: {e}"
+                results.append(result)
+        return results
+
+def format_summary(results: list[BatchResult], total_seconds: float) -> str:
+    header = ("BOM", "PnP", "BOM miss", "PnP miss", "Comment", "Distance", "Time [s]")
+    rows = []
+    for res in results:
+        pnp = os.path.basename(res.job.pnp_path)
+        if res.job.pnp2_path:
+            pnp += " + " + os.path.basename(res.job.pnp2_path)
+        if res.error:
+            counts = ("-", "-", "-", "-")
+        else:
+            counts = tuple(str(cnt) for cnt in res.counts)
+        rows.append((res.job.bom_path, pnp) + counts + (f"{res.seconds:.2f}",))
+
+    widths = [max(len(row[c]) for row in [header] + rows) for c in range(len(header))]
+    lines = []
+    for row in [header] + rows:
+        # text columns aligned left, numbers right
+        cells = [row[c].ljust(widths[c]) if c < 2 else row[c].rjust(widths[c]) for c in range(len(row))]
+        lines.append(" | ".join(cells))
+    lines.insert(1, "-+-".join("-" * w for w in widths))
+
+    for res in results:
+        if res.error:
+            lines.append(f"ERROR {res.job.bom_path}: {res.error}")
+
+    nfailed = sum(1 for res in results if res.error)
+    nfindings = sum(1 for res in results if not res.error and res.findings_count > 0)
+    lines.append(f"Projects: {len(results)}, with problems: {nfindings}, failed: {nfailed}, total time: {total_seconds:.2f} s")
+    return "\n".join(lines)
@@ -0,0 +1,138 @@
+# BOM & PnP verifier - command line interface
+#
+# Performs the same cross-check as the app.py, without the UI,
+# eg. on the build server:
+#
+#   python src/boomer.py check --bom BOM.xlsx --pnp PnP.csv --profile my-profile --json report.json
+#   python src/boomer.py batch --jobs 8
+#
+# Exit code: 0 - no problems found, 1 - problems found, 2 - error (batch: in any project)
+#
+# Keep the imports light: tkinter/customtkinter are never imported,
+# the readers and the checker are imported when the check is performed.
+
+import argparse
+import os
+import sys
+
+import logger
+
+# -----------------------------------------------------------------------------
+
+EXIT_OK = 0
+EXIT_FINDINGS = 1
+EXIT_ERROR = 2
+
+def __make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="boomer", description="BOM vs PnP cross checker")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print the logs, save them in the logs/ folder")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    check = commands.add_parser("check", help="cross-check the BOM and PnP files, save the report")
+    check.add_argument("--bom", required=True, help="BOM file")
+    check.add_argument("--pnp", required=True, help="PnP file")
+    check.add_argument("--pnp2", default="", help="optional second PnP file (bottom layer)")
+    check.add_argument("--profile", required=True, help="profile name from the config file")
+    check.add_argument("--config", default="boomer.ini", help="config file (default: %(default)s)")
+    check.add_argument("--min-distance", type=float, default=None,
+                       help="min. distance between components [mm] (default: from the config file)")
+    check.add_argument("--html", default=None, help="HTML report path")
+    check.add_argument("--json", default=None, help="JSON report path")
+
+    batch = commands.add_parser("batch", help="cross-check all the projects from the config file, or the BOMs found")
+    batch.add_argument("--boms", default="",
+                       help="BOM files pattern, eg. 'boards/**/*BOM*.xlsx'; PnP files are found in the BOM directory")
+    batch.add_argument("--profile", default="", help="profile name, required with --boms")
+    batch.add_argument("--config", default="boomer.ini", help="config file (default: %(default)s)")
+    batch.add_argument("--min-distance", type=float, default=None,
+                       help="min. distance between components [mm] (default: from the config file)")
+    batch.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                       help="number of worker processes (default: %(default)s)")
+    return parser
+
+def __check(args: argparse.Namespace) -> int:
+    import batch
+    import grid_loader
+    import perf
+    import report_generator
+
+    if not os.path.isfile(args.config):
+        logger.error(f"Config file '{args.config}' not found")
+        return EXIT_ERROR
+
+    with perf.run(os.path.basename(args.bom)) as stats:
+        proj = batch.load_project(args.config, args.profile)
+        min_distance = proj.get_min_distance() if args.min_distance is None else args.min_distance
+        # BOM and PnP files read at once
+        executor = grid_loader.make_executor(proj.load_pool)
+        try:
+            ccresult = batch.check_files(proj, args.bom, args.pnp, args.pnp2, min_distance, executor)
+        finally:
+            if executor:
+                executor.shutdown()
+
+        bom_name = os.path.basename(args.bom)
+        pnp_names = (os.path.basename(args.pnp), os.path.basename(args.pnp2))
+        # without any path given, HTML report is saved next to the BOM, like the app does
+        html_path = args.html
+        if html_path is None and args.json is None:
+            html_path = report_generator.get_report_path(args.bom, ".html")
+
+        if html_path:
+            report_generator.write_html_report_file(html_path, bom_name, pnp_names, min_distance, ccresult, stats)
+            print(f"HTML report: {html_path}")
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                f.write(report_generator.prepare_json_report(bom_name, pnp_names, min_distance, ccresult, stats))
+            print(f"JSON report: {args.json}")
+
+    print(f"BOM parts missing in the PnP: {len(ccresult.bom_parst_missing_in_pnp)}")
+    print(f"PnP parts missing in the BOM: {len(ccresult.pnp_parst_missing_in_bom)}")
+    print(f"BOM and PnP comment mismatch: {len(ccresult.parts_comment_mismatch)}")
+    print(f"PnP overlapping components:   {len(ccresult.parts_coord_conflicts)}")
+    return EXIT_FINDINGS if ccresult.findings_count() > 0 else EXIT_OK
+
+def __batch(args: argparse.Namespace) -> int:
+    import batch
+    import time
+
+    if not os.path.isfile(args.config):
+        logger.error(f"Config file '{args.config}' not found")
+        return EXIT_ERROR
+
+    if args.boms:
+        if not args.profile:
+            logger.error("--profile is required with --boms")
+            return EXIT_ERROR
+        jobs = batch.glob_jobs(args.boms, args.profile)
+    else:
+        jobs = batch.configured_jobs(args.config)
+
+    if not jobs:
+        logger.error("No projects to check")
+        return EXIT_ERROR
+
+    t_start = time.perf_counter()
+    results = batch.run_batch(jobs, args.config, args.jobs, args.min_distance)
+    print(batch.format_summary(results, time.perf_counter() - t_start))
+
+    if any(res.error for res in results):
+        return EXIT_ERROR
+    return EXIT_FINDINGS if any(res.findings_count > 0 for res in results) else EXIT_OK
+
+def main(argv: list[str] = None) -> int:
+    args = __make_parser().parse_args(argv)
+    if args.verbose:
+        logger.config(False)
+
+    try:
+        if args.command == "check":
+            return __check(args)
+        elif args.command == "batch":
+            return __batch(args)
+    except Exception as e:
+        logger.error(f"Cross-check failed: {e}")
+    return EXIT_ERROR
+
+if __name__ == "__main__":
+    sys.exit(main())
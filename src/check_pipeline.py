@@ -0,0 +1,117 @@
+#
+# 2026-10-18
+#
+
+import collections
+import io
+import logger
+from typing import Any, Callable, Optional
+
+import cross_check
+import perf
+import report_generator
+from text_grid import ConfiguredTextGrid
+
+# -----------------------------------------------------------------------------
+
+class CheckPipeline:
+    """
+    Cross-check performed as the cached stages:
+
+        extract.bom ─┬─ missing ──── render
+        extract.pnp ─┼─ comments ──┘   │
+                     └─ distances ─────┘
+
+    Every stage result is kept with the fingerprint of the stage inputs, and reused while the fingerprint
+    does not change: a BOM-only edit does not recompute the PnP distances, a different comment column
+    does not recompute the distances.
+    The grids are fingerprinted by identity: the GridCache returns the same, never modified grid
+    for an unchanged file, so the files reading is the first, cached stage.
+    The render stage caches only the summary sections: the report header ("Generated" time)
+    and the performance stats are written anew by every run, and so is the report file.
+    Results are shared between the runs, and must not be modified.
+    """
+
+    STAGES = ("extract.bom", "extract.pnp", "missing", "comments", "distances", "render")
+
+    def __init__(self):
+        # {stage : (fingerprint, result)}
+        self.__results: dict[str, tuple[tuple, Any]] = {}
+        # number of times every stage was computed
+        self.computed = collections.Counter()
+
+    @staticmethod
+    def grid_fingerprint(grid: ConfiguredTextGrid, *columns: str) -> tuple:
+        """The grid and its `columns` configuration"""
+        return (grid.text_grid, grid.text_grid.nrows, grid.text_grid.ncols, grid.has_column_headers,
+                grid.first_row, grid.last_row) + tuple(getattr(grid, column) for column in columns)
+
+    def stage(self, name: str, fingerprint: tuple, compute: Callable[[], Any]) -> Any:
+        """Returns the result cached for the `fingerprint`, or computes it"""
+        cached = self.__results.get(name)
+        if cached is not None and cached[0] == fingerprint:
+            perf.count("stages reused")
+            return cached[1]
+
+        result = compute()
+        self.__results[name] = (fingerprint, result)
+        self.computed[name] += 1
+        return result
+
+    def clear(self):
+        self.__results.clear()
+
+    @perf.timed("check")
+    def check(self, bom: ConfiguredTextGrid, pnp: ConfiguredTextGrid, min_distance: float = 3.0,
+              coord_unit_mils: bool = True) -> cross_check.CrossCheckResult:
+        """The same as `cross_check.compare()`, recomputing only the stages of changed inputs"""
+        cross_check.check_grids(bom, pnp)
+
+        bom_fp = self.grid_fingerprint(bom, "designator_col", "comment_col")
+        pnp_fp = self.grid_fingerprint(pnp, "designator_col", "comment_col", "coord_x_col", "coord_y_col",
+                                       "layer_col", "footprint_col")
+        # the distances do not depend on the comments
+        pnp_coords_fp = self.grid_fingerprint(pnp, "designator_col", "coord_x_col", "coord_y_col", "layer_col")
+
+        with perf.stage("check.extract"):
+            bom_parts = self.stage("extract.bom", bom_fp, lambda: cross_check.extract_bom_parts(bom))
+            pnp_parts = self.stage("extract.pnp", pnp_fp, lambda: cross_check.extract_pnp_parts(pnp))
+        perf.count("bom parts", len(bom_parts))
+        perf.count("pnp parts", len(pnp_parts))
+
+        # designators sort keys of this run: the designators of the old files are not kept
+        keys = cross_check.DesignatorKeys()
+        result = cross_check.CrossCheckResult()
+        (result.bom_parst_missing_in_pnp, result.pnp_parst_missing_in_bom) = self.stage(
+            "missing", (bom_fp, pnp_fp),
+            lambda: cross_check.find_missing_parts(bom_parts, pnp_parts, keys))
+        result.parts_comment_mismatch = self.stage(
+            "comments", (bom_fp, pnp_fp),
+            lambda: cross_check.find_comment_mismatch(bom_parts, pnp_parts, keys))
+        result.parts_coord_conflicts = self.stage(
+            "distances", (pnp_coords_fp, min_distance, coord_unit_mils),
+            lambda: cross_check.find_coord_conflicts(pnp_parts, min_distance, coord_unit_mils, keys))
+        return result
+
+    def report(self, path: str, bom_name: str, pnp_names: tuple[str, str], min_distance: float,
+               ccresult: cross_check.CrossCheckResult, perf_stats: Optional[perf.PerfStats] = None) -> str:
+        """
+        Writes the full HTML report to the `path` file, returns the summary-only report;
+        the summary sections are reused while the results do not change
+        """
+        report_generator.write_html_report_file(path, bom_name, pnp_names, min_distance, ccresult, perf_stats)
+        logger.info(f"Report saved to: {path}")
+
+        fingerprint = (min_distance, ccresult.bom_parst_missing_in_pnp, ccresult.pnp_parst_missing_in_bom,
+                       ccresult.parts_comment_mismatch, ccresult.parts_coord_conflicts)
+
+        def render() -> str:
+            output = io.StringIO()
+            report_generator.write_html_report_sections(output, min_distance, ccresult, summary_only=True)
+            return output.getvalue()
+
+        output = io.StringIO()
+        report_generator.write_html_report_header(output, bom_name, pnp_names)
+        output.write(self.stage("render", fingerprint, render))
+        report_generator.write_html_report_perf(output, perf_stats)
+        return output.getvalue()
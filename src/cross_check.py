@@ -1,7 +1,14 @@
 import logger
-import natsort
 import math
+import perf
 import re
+from typing import Optional
+
+try:
+    # optional: vectorized distance check
+    import numpy
+except ImportError:
+    numpy = None
 
 from text_grid import *
 
@@ -21,6 +28,11 @@ class CrossCheckResult:
         self.parts_coord_conflicts: list[(str, str, float)] = []
         """Triplets (part1_designator : part2_designator : distance_mm)"""
 
+    def findings_count(self) -> int:
+        """Total number of the problems found"""
+        return len(self.bom_parst_missing_in_pnp) + len(self.pnp_parst_missing_in_bom) + \
+            len(self.parts_comment_mismatch) + len(self.parts_coord_conflicts)
+
 # -----------------------------------------------------------------------------
 
 def __extract_grid(grid: ConfiguredTextGrid, grid_name: str) -> dict[str, (str, str, str, str, str)]:
@@ -49,245 +61,328 @@ def __extract_grid(grid: ConfiguredTextGrid, grid_name: str) -> dict[str, (str,
             if type(grid.coord_y_col) is not int:
                 raise ValueError(f"{grid_name} y column id must be an int")
 
-    coord_x_col_idx = coord_y_col_idx = layer_col_idx = footprint_col_idx = -1
+    # column indexes resolved once, using the column headers map
+    columns = grid.resolve_columns(grid_name == "PnP")
 
     if grid.has_column_headers:
-        # find the designator column index basing on a column title
-        designator_col_idx = next(
-            (
-                i
-                for i in range(grid.text_grid.ncols)
-                if grid.text_grid.rows_raw()[grid.first_row][i] == grid.designator_col
-            ),
-            -1,
-        )
-        # find the comment column index basing on a column title
-        comment_col_idx = next(
-            (
-                i
-                for i in range(grid.text_grid.ncols)
-                if grid.text_grid.rows_raw()[grid.first_row][i] == grid.comment_col
-            ),
-            -1,
-        )
-
-        if grid_name == "PnP":
-            # find the x column index basing on a column title
-            coord_x_col_idx = next(
-                (
-                    i
-                    for i in range(grid.text_grid.ncols)
-                    if grid.text_grid.rows_raw()[grid.first_row][i] == grid.coord_x_col
-                ),
-                -1,
-            )
-            # find the y column index basing on a column title
-            coord_y_col_idx = next(
-                (
-                    i
-                    for i in range(grid.text_grid.ncols)
-                    if grid.text_grid.rows_raw()[grid.first_row][i] == grid.coord_y_col
-                ),
-                -1,
-            )
-            # find the layer column index basing on a column title
-            layer_col_idx = next(
-                (
-                    i
-                    for i in range(grid.text_grid.ncols)
-                    if grid.text_grid.rows_raw()[grid.first_row][i] == grid.layer_col
-                ),
-                -1,
-            )
-            # find the footprint column index basing on a column title
-            if grid.footprint_col: # optional
-                footprint_col_idx = next(
-                    (
-                        i
-                        for i in range(grid.text_grid.ncols)
-                        if grid.text_grid.rows_raw()[grid.first_row][i] == grid.footprint_col
-                    ),
-                    -1,
-                )
-
-        if designator_col_idx == -1:
+        if columns[0] == -1:
             raise ValueError(f"{grid_name} designator column not found")
-        if comment_col_idx == -1:
+        if columns[1] == -1:
             raise ValueError(f"{grid_name} comment column not found")
 
-        logger.debug(f"{grid_name} designator '{grid.designator_col}' found at column {designator_col_idx}")
-        logger.debug(f"{grid_name} comment '{grid.comment_col}' found at column {comment_col_idx}")
+        logger.debug(f"{grid_name} designator '{grid.designator_col}' found at column {columns[0]}")
+        logger.debug(f"{grid_name} comment '{grid.comment_col}' found at column {columns[1]}")
         if grid_name == "PnP":
-            logger.debug(f"{grid_name} footprint '{grid.footprint_col}' found at column {footprint_col_idx}")
-    else:
-        designator_col_idx = grid.designator_col
-        comment_col_idx = grid.comment_col
-        if grid_name == "PnP":
-            coord_x_col_idx = grid.coord_x_col
-            coord_y_col_idx = grid.coord_y_col
-            layer_col_idx = -1 # the last one
-            if grid.footprint_col:
-                footprint_col_idx = grid.footprint_col
+            logger.debug(f"{grid_name} footprint '{grid.footprint_col}' found at column {-1 if columns[5] is None else columns[5]}")
 
     output: dict[str, (str, str, str, str, str)] = {}
-    first_row = grid.first_row + (1 if grid.has_column_headers else 0)
-    last_row = grid.text_grid.nrows if grid.last_row == -1 else grid.last_row
+    last_row = grid.data_rows_range()[1]
 
     if last_row > grid.text_grid.nrows:
         raise ValueError(f"{grid_name} last row > number of rows")
 
-    for row in range(first_row, last_row):
-        dsgn = grid.text_grid.rows_raw()[row][designator_col_idx]
-        cmnt = grid.text_grid.rows_raw()[row][comment_col_idx]
-        if coord_x_col_idx > -1 and coord_y_col_idx > -1:
-            cx = grid.text_grid.rows_raw()[row][coord_x_col_idx]
-            cy = grid.text_grid.rows_raw()[row][coord_y_col_idx]
-        else:
-            cx = cy = ""
-
-        if grid_name == "PnP":
-            if layer_col_idx >= 0:
-                # layer column specified
-                lr = grid.text_grid.rows_raw()[row][layer_col_idx]
-            else:
-                # two separate files loaded for Top and Bottom
-                lr = grid.text_grid.rows_raw()[row][-1]
-
-            if footprint_col_idx >= 0:
-                # footprint column specified
-                fp = grid.text_grid.rows_raw()[row][footprint_col_idx]
-            else:
-                fp = ""
-        else:
-            # in BOM these columns does not exists
-            lr = ""
-            fp = ""
-
+    for (dsgn, cmnt, cx, cy, lr, fp) in grid.project_rows(columns):
         # in BOM, designator column used to have a number of items
-        dsgn = dsgn.split(',')
-        # logger.debug(f"designators: '{dsgn}'")
-        for d in dsgn:
-            d = d.strip()
-            output[d] = (cmnt, cx, cy, lr, fp)
+        for d in dsgn.split(','):
+            output[d.strip()] = (cmnt, cx, cy, lr, fp)
 
     return output
 
-def __extract_bom_parts(bom: ConfiguredTextGrid) -> dict[str, (str, str, str, str, str)]:
+def extract_bom_parts(bom: ConfiguredTextGrid) -> dict[str, (str, str, str, str, str)]:
     """Extracts BOM parts from the grid.
     @return A dictionary mapping designators to their properties.
     @retval (Comment, Coord-X, Coord-Y, Layer, Footprint)
     """
     return __extract_grid(bom, "BOM")
 
-def __extract_pnp_parts(pnp: ConfiguredTextGrid) -> dict[str, (str, str, str, str, str)]:
+def extract_pnp_parts(pnp: ConfiguredTextGrid) -> dict[str, (str, str, str, str, str)]:
     """Extracts PnP parts from the grid.
     @return A dictionary mapping designators to their properties.
     @retval (Comment, Coord-X, Coord-Y, Layer, Footprint)
     """
     return __extract_grid(pnp, "PnP")
 
-def __txt_to_mm(coord: tuple[str, str], coord_unit_mils: bool) -> tuple[float, float]:
-    MIL_PER_MM = 1000/25.4
+MIL_PER_MM = 1000/25.4
+
+# candidate pairs per one vectorized block of distance calculations
+PAIRS_BLOCK_SIZE = 1 << 18
+
+# everything, but the number and the line separator
+__NOT_NUMBER_RE = re.compile(r"[^\d\.,\n]")
+
+def __strip_units(cells: list[str]) -> list[str]:
+    """Leaves only the digits, dots and commas of every cell"""
+    # 15.1mm -> 15.1
+    # 4312mils -> 4312
+    # single regex pass over entire column
+    values = __NOT_NUMBER_RE.sub("", "\n".join(cells)).split("\n")
+    if len(values) != len(cells):
+        # multi-line cell: one by one
+        values = [__NOT_NUMBER_RE.sub("", cell.replace("\n", "")) for cell in cells]
+    return values
+
+def __decode_coords(coords_x: list[str], coords_y: list[str], coord_unit_mils: bool) -> tuple[list[float], list[float]]:
+    """Converts the X/Y columns text to millimeters, all at once.
+    Part with invalid X or Y text gets the (0, 0) coordinates.
+    """
+    values_x = __strip_units(coords_x)
+    values_y = __strip_units(coords_y)
 
     try:
-        # 15.1mm -> 15.1
-        # 4312mils -> 4312
-        x = re.sub("[^\d\.,]", "", coord[0])
-        x = float(x)
-        y = re.sub("[^\d\.,]", "", coord[1])
-        y = float(y)
-
-        if coord_unit_mils:
-            return (x / MIL_PER_MM, y / MIL_PER_MM)
+        if numpy is None:
+            raise ValueError()
+        xs = numpy.array(values_x, dtype=numpy.float64)
+        ys = numpy.array(values_y, dtype=numpy.float64)
+    except ValueError:
+        # at least one invalid cell (or no NumPy): convert one-by-one
+        xs = [0.0] * len(values_x)
+        ys = [0.0] * len(values_y)
+        for i, (x, y) in enumerate(zip(values_x, values_y)):
+            try:
+                xs[i] = float(x)
+                ys[i] = float(y)
+            except ValueError:
+                logger.warning("Conversion error at: %s:%s", coords_x[i], coords_y[i])
+                xs[i] = ys[i] = 0.0
+        if numpy is not None:
+            xs = numpy.array(xs, dtype=numpy.float64)
+            ys = numpy.array(ys, dtype=numpy.float64)
+
+    if coord_unit_mils:
+        if numpy is None:
+            xs = [x / MIL_PER_MM for x in xs]
+            ys = [y / MIL_PER_MM for y in ys]
         else:
-            return (x, y)
-    except Exception as e:
-        logger.warning(f"Conversion error at: {coord[0]}:{coord[1]}")
-        return (0, 0)
+            xs = xs / MIL_PER_MM
+            ys = ys / MIL_PER_MM
+
+    return (xs, ys)
+
+def __layer_distances_py(xs: list[float], ys: list[float], layer_parts: list[int], min_distance: float,
+                         cell_size: float) -> list[(int, int, float)]:
+    """Returns (part_a, part_b, distance) of the layer parts closer than `min_distance`; part_a < part_b"""
+    # {(cell_x, cell_y) : [part index, ...]}
+    cells: dict[(int, int), list[int]] = {}
+    for idx in layer_parts:
+        cell = (math.floor(xs[idx] / cell_size), math.floor(ys[idx] / cell_size))
+        cells.setdefault(cell, []).append(idx)
 
-def __check_distances(pnp_parts: dict[str, (str, str, str, str, str)], min_distance: float, coord_unit_mils: bool) -> list[(str, str, float)]:
-    # decoded coords cache
-    decoded_coords: dict[str, (float, float)] = {}
-    parts_checked: dict[str, list[str]] = {}
     output = []
+    pairs_tested = 0
+    for idx_a in layer_parts:
+        cell_x, cell_y = math.floor(xs[idx_a] / cell_size), math.floor(ys[idx_a] / cell_size)
+        xa, ya = xs[idx_a], ys[idx_a]
+        for nx in (cell_x - 1, cell_x, cell_x + 1):
+            for ny in (cell_y - 1, cell_y, cell_y + 1):
+                for idx_b in cells.get((nx, ny), ()):
+                    # test every pair only once
+                    if idx_b > idx_a:
+                        pairs_tested += 1
+                        dist = ((xa - xs[idx_b])**2.0) + ((ya - ys[idx_b])**2.0)
+                        dist = math.sqrt(dist)
+                        if dist < min_distance:
+                            output.append((idx_a, idx_b, dist))
+    perf.count("pairs tested", pairs_tested)
+    return output
+
+def __layer_distances_np(xs: "numpy.ndarray", ys: "numpy.ndarray", layer_parts: list[int], min_distance: float,
+                         cell_size: float) -> list[(int, int, float)]:
+    """NumPy variant of the `__layer_distances_py()`"""
+    parts = numpy.array(layer_parts, dtype=numpy.int64)
+    x = xs[parts]
+    y = ys[parts]
+
+    # cell of each part as a single number; the 1 cell margin keeps the neighbour cells numbers valid
+    cell_x = numpy.floor(x / cell_size).astype(numpy.int64)
+    cell_y = numpy.floor(y / cell_size).astype(numpy.int64)
+    cell_x -= cell_x.min() - 1
+    cell_y -= cell_y.min() - 1
+    width = int(cell_y.max()) + 2
+    cell_key = cell_x * width + cell_y
+    by_cell = numpy.argsort(cell_key, kind="stable")
+    sorted_keys = cell_key[by_cell]
+
+    out_a = []
+    out_b = []
+    out_dist = []
+    pairs_tested = 0
+    for nx in (-1, 0, 1):
+        for ny in (-1, 0, 1):
+            # range of parts (in the `by_cell` order) placed in the neighbour cell of every part
+            neighbour_key = cell_key + (nx * width + ny)
+            first = numpy.searchsorted(sorted_keys, neighbour_key, "left")
+            counts = numpy.searchsorted(sorted_keys, neighbour_key, "right") - first
+            counts_total = numpy.cumsum(counts)
+
+            # split into blocks of ~PAIRS_BLOCK_SIZE candidate pairs
+            block_begin = 0
+            while block_begin < len(parts):
+                pairs_before = int(counts_total[block_begin - 1]) if block_begin > 0 else 0
+                block_end = int(numpy.searchsorted(counts_total, pairs_before + PAIRS_BLOCK_SIZE, "right"))
+                block_end = max(block_end, block_begin + 1)
+
+                block_counts = counts[block_begin:block_end]
+                npairs = int(block_counts.sum())
+                if npairs > 0:
+                    # every candidate pair: a - part in this block, b - part in the neighbour cell
+                    a = numpy.repeat(numpy.arange(block_begin, block_end), block_counts)
+                    pair_offset = numpy.arange(npairs) - numpy.repeat(numpy.cumsum(block_counts) - block_counts, block_counts)
+                    b = by_cell[numpy.repeat(first[block_begin:block_end], block_counts) + pair_offset]
+                    # test every pair only once
+                    valid = parts[b] > parts[a]
+                    a = a[valid]
+                    b = b[valid]
+                    pairs_tested += len(a)
+                    dist = numpy.sqrt(numpy.square(x[a] - x[b]) + numpy.square(y[a] - y[b]))
+                    close = dist < min_distance
+                    out_a.append(parts[a[close]])
+                    out_b.append(parts[b[close]])
+                    out_dist.append(dist[close])
+                block_begin = block_end
+
+    perf.count("pairs tested", pairs_tested)
+    if not out_a:
+        return []
+    return list(zip(numpy.concatenate(out_a).tolist(), numpy.concatenate(out_b).tolist(), numpy.concatenate(out_dist).tolist()))
 
-    for key_a in pnp_parts:
-        for key_b in pnp_parts:
-            # compare only components from the same layer
-            if key_b != key_a and pnp_parts[key_a][3] == pnp_parts[key_b][3]:
-                # check if B vs A already performed
-                if key_a in parts_checked.get(key_b, []):
-                    # logger.debug(f"Skip {key_a} vs {key_b}")
-                    continue
-                else:
-                    if lst := parts_checked.get(key_a):
-                        lst.append(key_b)
-                    else:
-                        parts_checked[key_a] = [key_b]
-
-                # x
-                if coord := decoded_coords.get(key_a):
-                    coord_a = coord
-                else:
-                    coord_a = __txt_to_mm((pnp_parts[key_a][1], pnp_parts[key_a][2]), coord_unit_mils)
-                    decoded_coords[key_a] = coord_a
-                # y
-                if coord := decoded_coords.get(key_b):
-                    coord_b = coord
-                else:
-                    coord_b = __txt_to_mm((pnp_parts[key_b][1], pnp_parts[key_b][2]), coord_unit_mils)
-                    decoded_coords[key_b] = coord_b
-
-                dist = ((coord_a[0] - coord_b[0])**2.0) + ((coord_a[1] - coord_b[1])**2.0)
-                dist = math.sqrt(dist)
-                if dist < min_distance:
-                    logger.debug(f"{key_a}({coord_a[0]:.1f}, {coord_a[1]:.1f}) <--> {key_b}({coord_b[0]:.1f}, {coord_b[1]:.1f}) = {dist:0.1f}mm")
-                    output.append((key_a, key_b, dist))
+def __check_distances(pnp_parts: dict[str, (str, str, str, str, str)], min_distance: float, coord_unit_mils: bool) -> list[(str, str, float)]:
+    """Returns (designator_a, designator_b, distance_mm) for every pair of parts
+    from the same layer, with centers closer than `min_distance`.
+    `designator_a` always precedes `designator_b` in the `pnp_parts` order.
+    """
+    output = []
+    if min_distance <= 0 or not pnp_parts:
+        return output
+
+    keys = list(pnp_parts)
+    parts = pnp_parts.values()
+    with perf.stage("check.decode"):
+        xs, ys = __decode_coords([part[1] for part in parts], [part[2] for part in parts], coord_unit_mils)
+
+    # {layer : [part index, ...]}
+    layers: dict[str, list[int]] = {}
+    for idx, part in enumerate(parts):
+        layers.setdefault(part[3], []).append(idx)
+
+    # uniform grid hash: parts closer than `min_distance` always fall into the same or adjacent cells;
+    # the cell is slightly enlarged so that rounding of (coord / cell) cannot push them 2 cells apart
+    cell_size = min_distance * (1 + 1e-9)
+    layer_distances = __layer_distances_py if numpy is None else __layer_distances_np
+    conflicts = []
+    with perf.stage("check.distances"):
+        for layer_parts in layers.values():
+            conflicts.extend(layer_distances(xs, ys, layer_parts, min_distance, cell_size))
+        # keep the order of the plain N x N comparison
+        conflicts.sort()
+    perf.count("conflicts", len(conflicts))
+
+    for (idx_a, idx_b, dist) in conflicts:
+        key_a = keys[idx_a]
+        key_b = keys[idx_b]
+        logger.debug("%s(%.1f, %.1f) <--> %s(%.1f, %.1f) = %.1fmm", key_a, xs[idx_a], ys[idx_a], key_b, xs[idx_b], ys[idx_b], dist)
+        output.append((key_a, key_b, dist))
     return output
 
-def __compare(bom_parts: dict[str, (str, str, str, str, str)],
-              pnp_parts: dict[str, (str, str, str, str, str)],
-              min_distance: float, coord_unit_mils: bool) -> CrossCheckResult:
-    result = CrossCheckResult()
+# -----------------------------------------------------------------------------
+
+__DIGITS = re.compile(r"(\d+)")
+
+def natural_key(text: str) -> tuple:
+    """
+    Natural sort key, the same as the natsort package gives:
+    "R10" -> ("R", 10), "C1A" -> ("C", 1, "A"), "10" -> ("", 10)
+    """
+    chunks = __DIGITS.split(text)
+    # chunks alternate: text, number, text, ...; the trailing empty text is dropped
+    if chunks[-1] == "":
+        chunks.pop()
+    chunks[1::2] = map(int, chunks[1::2])
+    return tuple(chunks)
+
+class DesignatorKeys(dict):
+    """
+    Symbol table of a single cross-check: designator -> sort key, computed once per designator
+    and reused by every sorted list. Designators of the same natural key (R01, R1) are ordered by the text.
+    """
+
+    def __missing__(self, designator: str) -> tuple:
+        key = self[designator] = (natural_key(designator), designator)
+        return key
+
+# the cross-check stages; `keys` shared by the stages of one cross-check
+
+def find_missing_parts(bom_parts: dict[str, (str, str, str, str, str)],
+                       pnp_parts: dict[str, (str, str, str, str, str)],
+                       keys: Optional[DesignatorKeys] = None) -> tuple[list[(str, str)], list[(str, str)]]:
+    """Returns (designator, comment) of the BOM parts missing in the PnP, and of the PnP parts missing in the BOM"""
+    keys = DesignatorKeys() if keys is None else keys
+    by_designator = lambda item: keys[item[0]]
 
     # check for items present in BOM, but missing in the PnP
+    bom_missing = []
     for designator in bom_parts:
         if designator and (designator not in pnp_parts):
-            result.bom_parst_missing_in_pnp.append((designator, bom_parts[designator][0] or "?"))
-    # sort naturally: https://pypi.org/project/natsort/
-    result.bom_parst_missing_in_pnp = natsort.natsorted(result.bom_parst_missing_in_pnp)
-
+            bom_missing.append((designator, bom_parts[designator][0] or "?"))
     # check for items present in PnP, but missing in the BOM
+    pnp_missing = []
     for designator in pnp_parts:
         if designator and (designator not in bom_parts):
-            result.pnp_parst_missing_in_bom.append((designator, pnp_parts[designator][0]))
-    result.pnp_parst_missing_in_bom = natsort.natsorted(result.pnp_parst_missing_in_bom)
-
-    # check for comments mismatch
+            pnp_missing.append((designator, pnp_parts[designator][0]))
+
+    # sort naturally, like the https://pypi.org/project/natsort/ does
+    with perf.stage("check.sort"):
+        bom_missing.sort(key=by_designator)
+        pnp_missing.sort(key=by_designator)
+    return (bom_missing, pnp_missing)
+
+def find_comment_mismatch(bom_parts: dict[str, (str, str, str, str, str)],
+                          pnp_parts: dict[str, (str, str, str, str, str)],
+                          keys: Optional[DesignatorKeys] = None) -> list[(str, str, str, str)]:
+    """Returns (designator, BOM comment, PnP comment, PnP footprint) of the parts with different comments"""
+    keys = DesignatorKeys() if keys is None else keys
+    mismatch = []
     for designator in bom_parts:
         if designator in pnp_parts:
             if bom_parts[designator][0] != pnp_parts[designator][0]:
-                result.parts_comment_mismatch.append((designator, bom_parts[designator][0], pnp_parts[designator][0], pnp_parts[designator][4]))
-    result.parts_comment_mismatch = natsort.natsorted(result.parts_comment_mismatch)
-
+                mismatch.append((designator, bom_parts[designator][0], pnp_parts[designator][0], pnp_parts[designator][4]))
+    with perf.stage("check.sort"):
+        mismatch.sort(key=lambda item: keys[item[0]])
+    return mismatch
+
+def find_coord_conflicts(pnp_parts: dict[str, (str, str, str, str, str)], min_distance: float, coord_unit_mils: bool,
+                         keys: Optional[DesignatorKeys] = None) -> list[(str, str, float)]:
+    """Returns (designator_a, designator_b, distance_mm) of the parts closer than `min_distance`"""
+    keys = DesignatorKeys() if keys is None else keys
     # check for conflicting PnP coordinates
     logger.info("Calculate parts center distances...")
-    result.parts_coord_conflicts = __check_distances(pnp_parts, min_distance, coord_unit_mils)
-    result.parts_coord_conflicts = natsort.natsorted(result.parts_coord_conflicts)
+    conflicts = __check_distances(pnp_parts, min_distance, coord_unit_mils)
+    with perf.stage("check.sort"):
+        conflicts.sort(key=lambda item: (keys[item[0]], keys[item[1]]))
+    return conflicts
 
-    #
-    return result
+def check_grids(bom: ConfiguredTextGrid, pnp: ConfiguredTextGrid):
+    """Raises ValueError if any grid is missing"""
+    if bom is None or bom.text_grid is None:
+        raise ValueError("BOM data is missing")
+    if pnp is None or pnp.text_grid is None:
+        raise ValueError("PnP data is missing")
 
 # -----------------------------------------------------------------------------
 
-def compare(bom: ConfiguredTextGrid, pnp: ConfiguredTextGrid, min_distance: float, coord_unit_mils: bool) -> CrossCheckResult:
+@perf.timed("check")
+def compare(bom: ConfiguredTextGrid, pnp: ConfiguredTextGrid, min_distance: float = 3.0, coord_unit_mils: bool = True) -> CrossCheckResult:
     """Performs BOM and PnP cross check"""
+    check_grids(bom, pnp)
 
-    if bom is None or bom.text_grid is None:
-        raise ValueError("BOM data is missing")
-    if pnp is None or pnp.text_grid is None:
-        raise ValueError("PnP data is missing")
+    with perf.stage("check.extract"):
+        bom_parts = extract_bom_parts(bom)
+        pnp_parts = extract_pnp_parts(pnp)
+    perf.count("bom parts", len(bom_parts))
+    perf.count("pnp parts", len(pnp_parts))
 
-    bom_parts = __extract_bom_parts(bom)
-    pnp_parts = __extract_pnp_parts(pnp)
-    return __compare(bom_parts, pnp_parts, min_distance, coord_unit_mils)
+    result = CrossCheckResult()
+    keys = DesignatorKeys()
+    (result.bom_parst_missing_in_pnp, result.pnp_parst_missing_in_bom) = find_missing_parts(bom_parts, pnp_parts, keys)
+    result.parts_comment_mismatch = find_comment_mismatch(bom_parts, pnp_parts, keys)
+    result.parts_coord_conflicts = find_coord_conflicts(pnp_parts, min_distance, coord_unit_mils, keys)
+    return result
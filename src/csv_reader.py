@@ -2,27 +2,52 @@
 # 2025-11-28
 #
 
+import codecs
 import csv
+import itertools
 import logger
+from typing import Iterable, Optional
 
-from text_grid import TextGrid
+from text_grid import TextGrid, ColumnarTextGrid, RowWindow
 
 # -----------------------------------------------------------------------------
 
+# number of bytes read from the file beginning to detect the dialect
+SNIFF_SIZE = 64 * 1024
+
+class CsvDialect:
+    """
+    CSV file properties, detected before the file is parsed
+    """
+
+    def __init__(self, delimiter: str, quotechar: str = '"', encoding: str = "utf-8"):
+        self.delimiter = delimiter
+        self.quotechar = quotechar
+        self.encoding = encoding
+
+    def __repr__(self) -> str:
+        return f"CsvDialect(delimiter={self.delimiter!r}, quotechar={self.quotechar!r}, encoding={self.encoding!r})"
+
 def __check_row_valid(row_cells: list[str]) -> bool:
     # ignore rows with empty cells 'A,B,C' or cell 'A' with a long horizontal line
     row_valid = (len(row_cells) > 3) and (row_cells[0] or row_cells[1] or row_cells[2])
     row_valid = row_valid and not row_cells[0].startswith("___")
     return row_valid
 
-def __read_sp(rows: list[str], tg: TextGrid):
+def __read_sp(rows: Iterable[str], tg: TextGrid, window: RowWindow):
     max_cols = 0
+    end = window.end()
     for row in rows:
         # split row by any number of following whitespaces
         row_cells = row.split()
         if not __check_row_valid(row_cells):
             continue
 
+        if len(tg.rows_raw()) < window.first:
+            # before the window: not converted
+            tg.rows_raw().append(row_cells[:RowWindow.SKIPPED_ROW_CELLS])
+            continue
+
         max_cols = max(max_cols, len(row_cells))
         row_cells_processed = []
         # merge quoted cells into single one,
@@ -44,62 +69,124 @@ def __read_sp(rows: list[str], tg: TextGrid):
                 row_cells_processed.append(cell.strip())
 
         tg.rows_raw().append(row_cells_processed)
+        if len(tg.rows_raw()) == end:
+            logger.debug(f"  Last row {end} reached")
+            break
     return max_cols
 
-def __read_csv(file, tg: TextGrid, delim: str, quote_char: str = '"'):
+def __read_csv(file, tg: TextGrid, delim: str, quote_char: str, window: RowWindow):
     max_cols = 0
+    end = window.end()
     reader = csv.reader(file, delimiter=delim, quotechar=quote_char)
     for row_cells in reader:
         if __check_row_valid(row_cells):
+            if len(tg.rows_raw()) < window.first:
+                # before the window: not converted
+                tg.rows_raw().append([cell.strip() for cell in row_cells[:RowWindow.SKIPPED_ROW_CELLS]])
+                continue
+
             row_cells = [cell.strip() for cell in row_cells]
             max_cols = max(max_cols, len(row_cells))
             tg.rows_raw().append(row_cells)
+            if len(tg.rows_raw()) == end:
+                # the rest of the file is not read
+                logger.debug(f"  Last row {end} reached")
+                break
+    return max_cols
 
-    # check if cell starts and ends with the apostrophe
-    apostr_as_quotechar = False
-    if quote_char != "'" and max_cols > 1 and len(tg.rows_raw()) > 2:
-        for (c, r1_cell) in enumerate(tg.rows_raw()[1]):
-            if r1_cell.startswith("'") and r1_cell.endswith("'"):
-                r2_cell = tg.rows_raw()[2][c]
-                if r2_cell.startswith("'") and r2_cell.endswith("'"):
-                    apostr_as_quotechar = True
-                    break
-
-    if apostr_as_quotechar:
-        tg.rows_raw().clear()
-        file.seek(0)
-        logger.debug("  Reload CSV with ' as a quotechar")
-        return __read_csv(file, tg, delim, "'")
+def __detect_encoding(sample: bytes) -> str:
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if sample.startswith(codecs.BOM_UTF16_LE) or sample.startswith(codecs.BOM_UTF16_BE):
+        return "utf-16"
+    return "utf-8"
+
+def __detect_delimiter(lines: list[str]) -> str:
+    try:
+        return csv.Sniffer().sniff("\n".join(lines), delimiters=",;\t").delimiter
+    except csv.Error:
+        logger.warning("  CSV delimiter not detected, using ','")
+        return ","
+
+def __is_apostrophe_quoted(cell: str) -> bool:
+    return len(cell) > 1 and cell.startswith("'") and cell.endswith("'")
+
+def __detect_quotechar(lines: list[str], delim: str) -> str:
+    rows = []
+    for row_cells in csv.reader(lines, delimiter=delim, quotechar='"'):
+        if __check_row_valid(row_cells):
+            rows.append([cell.strip() for cell in row_cells])
+            if len(rows) > 2:
+                break
+
+    # check if cell starts and ends with the apostrophe, in the rows 1 and 2
+    if len(rows) > 2:
+        for (c, r1_cell) in enumerate(rows[1]):
+            if __is_apostrophe_quoted(r1_cell) and c < len(rows[2]) and __is_apostrophe_quoted(rows[2][c]):
+                return "'"
+    return '"'
+
+def sniff_csv(path: str, delim: str, quotechar: str = "") -> CsvDialect:
+    """
+    Detects the file dialect reading only the first SNIFF_SIZE bytes.
 
-    return max_cols
+    delim='*auto': one of ','  ';'  '\t' is detected
+    quotechar='': the double quote or the apostrophe is detected
+    """
+
+    with open(path, "rb") as f:
+        sample = f.read(SNIFF_SIZE)
+        truncated = len(f.read(1)) > 0
+
+    encoding = __detect_encoding(sample)
+    lines = sample.decode(encoding, errors="replace").splitlines()
+    if truncated and len(lines) > 1:
+        # the last line is incomplete
+        lines.pop()
+
+    if delim == "*auto":
+        delim = __detect_delimiter(lines)
+    if quotechar == "":
+        quotechar = '"' if delim.startswith("*") else __detect_quotechar(lines, delim)
+    return CsvDialect(delim, quotechar, encoding)
 
-def read_csv(path: str, delim: str) -> TextGrid:
+def read_csv(path: str, delim: str, columnar: bool = False, quotechar: str = "",
+             window: Optional[RowWindow] = None) -> TextGrid:
     """
-    Reads entire CSV/text file.
+    Reads entire CSV/text file, or only the `window` rows.
 
-    Delim may be: ' '  ','  ';'  '\t'  '*fw'  '*re'
+    Delim may be: ' '  ','  ';'  '\t'  '*sp'  '*fw'  '*re'  '*auto'
+    columnar=True: returns the memory-efficient ColumnarTextGrid
+    quotechar='': detected from the file beginning; the dialect used is stored in `TextGrid.dialect`
     """
 
     assert path is not None
     assert isinstance(delim, str)
     logger.info(f"Reading file '{path}', delim='{delim}'")
-    tg = TextGrid()
+    tg = ColumnarTextGrid() if columnar else TextGrid()
     max_cols = 0
 
-    with open(path, "r", encoding="utf-8") as f:
-        if delim == "*sp":
-            rows = f.read().splitlines()
-            max_cols = __read_sp(rows, tg)
-        elif delim == "*fw":
+    window = window or RowWindow()
+    dialect = sniff_csv(path, delim, quotechar)
+    if dialect.quotechar != '"':
+        logger.debug(f"  CSV with {dialect.quotechar} as a quotechar")
+
+    with open(path, "r", encoding=dialect.encoding) as f:
+        if dialect.delimiter == "*sp":
+            # the same lines as the f.read().splitlines() gives, read as needed
+            rows = itertools.chain.from_iterable(line.splitlines() for line in f)
+            max_cols = __read_sp(rows, tg, window)
+        elif dialect.delimiter == "*fw":
             # TODO: add reader for fixed-width
             raise ValueError("delimiter *fw not yet implemented")
-        elif delim == "*re":
+        elif dialect.delimiter == "*re":
             # TODO: add reader for reg-ex
             raise ValueError("delimiter *re not yet implemented")
         else:
-            max_cols = __read_csv(f, tg, delim)
+            max_cols = __read_csv(f, tg, dialect.delimiter, dialect.quotechar, window)
 
     tg.nrows = len(tg.rows_raw())
     tg.ncols = max_cols
+    tg.dialect = dialect
     tg.align_number_of_columns()
     return tg
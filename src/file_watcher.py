@@ -0,0 +1,171 @@
+#
+# 2026-10-18
+#
+
+import logger
+import os
+import time
+from typing import Any, Callable, Optional
+
+try:
+    # Linux only: pip install inotify_simple
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
+# -----------------------------------------------------------------------------
+
+# how often the files are checked: inotify events read, or stat() of every file
+POLL_INTERVAL_MS = 200
+# the change is reported when the files have not changed for that long:
+# editors save through the temporary files, renamed, written in chunks
+DEBOUNCE_MS = 1000
+
+def file_signature(path: str) -> Optional[tuple[int, int]]:
+    """(st_mtime_ns, st_size), the same as the GridCache uses; None if the file does not exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+class FileWatcher:
+    """
+    Watches the files for changes; runs on the UI thread, polled with the `schedule` function
+    (Tk's `widget.after`), like the `background.JobRunner`.
+
+    With the inotify available (Linux + inotify_simple), the directories are watched
+    and the files are stat() only after the events naming them; otherwise every file
+    is stat() every POLL_INTERVAL_MS.
+    A burst of writes is coalesced: `on_change(paths)` is called once the changed files
+    have kept the same signature for DEBOUNCE_MS, and all of them exist.
+    """
+
+    def __init__(self, schedule: Callable[[int, Callable[[], None]], Any],
+                 on_change: Callable[[list[str]], None], use_inotify: bool = True,
+                 debounce_ms: int = DEBOUNCE_MS):
+        self.__schedule = schedule
+        self.__on_change = on_change
+        self.debounce_ms = debounce_ms
+        # {path : signature last reported}
+        self.__reported: dict[str, Optional[tuple[int, int]]] = {}
+        # {path : signature seen}, while the changes settle
+        self.__seen: dict[str, Optional[tuple[int, int]]] = {}
+        self.__t_changed = 0.0
+        self.__polling = False
+        self.__active = False
+        self.__inotify = None
+        # {watch descriptor : directory}
+        self.__watches: dict[int, str] = {}
+        self.__inotify_dirty = False
+        if use_inotify and inotify_simple is not None:
+            try:
+                self.__inotify = inotify_simple.INotify()
+            except OSError as e:
+                logger.warning(f"inotify: {e}; files polled")
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self.__inotify else "polling"
+
+    @property
+    def paths(self) -> list[str]:
+        return list(self.__reported)
+
+    def watch(self, paths: list[str]):
+        """Starts watching the `paths` (empty ones are skipped); their current state is not reported"""
+        paths = [os.path.abspath(path) for path in paths if path]
+        if self.__active and paths == self.paths:
+            return
+
+        self.__reported = {path: file_signature(path) for path in paths}
+        self.__seen = dict(self.__reported)
+        self.__active = True
+        if self.__inotify:
+            self.__add_watches()
+        logger.debug(f"Watching ({self.backend}): {', '.join(paths)}")
+        if not self.__polling:
+            self.__polling = True
+            self.__schedule(POLL_INTERVAL_MS, self.poll)
+
+    def stop(self):
+        self.__active = False
+        self.__reported = {}
+        self.__seen = {}
+        if self.__inotify:
+            self.__remove_watches()
+
+    def close(self):
+        self.stop()
+        if self.__inotify:
+            self.__inotify.close()
+            self.__inotify = None
+
+    def poll(self):
+        """Checks the files; re-scheduled while watching"""
+        self.__polling = False
+        if not self.__active:
+            return
+        try:
+            self.check()
+        finally:
+            if self.__active:
+                self.__polling = True
+                self.__schedule(POLL_INTERVAL_MS, self.poll)
+
+    def check(self, now: Optional[float] = None):
+        """Detects the changes, reports them when settled"""
+        now = time.perf_counter() if now is None else now
+        if self.__inotify:
+            self.__read_events()
+            if not self.__inotify_dirty:
+                return
+            self.__inotify_dirty = False
+
+        current = {path: file_signature(path) for path in self.__reported}
+        if current != self.__seen:
+            # still changing: wait for the next quiet period
+            self.__seen = current
+            self.__t_changed = now
+            if self.__inotify:
+                # no more events may come, but the files must be checked again
+                self.__inotify_dirty = True
+            return
+
+        changed = [path for path, sig in current.items() if sig != self.__reported[path]]
+        if not changed:
+            return
+        if (now - self.__t_changed) * 1000 < self.debounce_ms or None in current.values():
+            # not settled, or the file is being replaced
+            if self.__inotify:
+                self.__inotify_dirty = True
+            return
+
+        self.__reported = current
+        logger.info(f"Files changed: {', '.join(os.path.basename(path) for path in changed)}")
+        self.__on_change(changed)
+
+    def __add_watches(self):
+        self.__remove_watches()
+        flags = inotify_simple.flags
+        mask = flags.CLOSE_WRITE | flags.MODIFY | flags.MOVED_TO | flags.CREATE | flags.DELETE | flags.MOVED_FROM
+        for directory in {os.path.dirname(path) for path in self.__reported}:
+            try:
+                self.__watches[self.__inotify.add_watch(directory, mask)] = directory
+            except OSError as e:
+                logger.warning(f"inotify: cannot watch '{directory}': {e}")
+
+    def __remove_watches(self):
+        for wd in self.__watches:
+            try:
+                self.__inotify.rm_watch(wd)
+            except OSError:
+                # directory removed
+                pass
+        self.__watches = {}
+
+    def __read_events(self):
+        for event in self.__inotify.read(timeout=0):
+            directory = self.__watches.get(event.wd)
+            if directory and os.path.join(directory, event.name) in self.__reported:
+                self.__inotify_dirty = True
@@ -0,0 +1,152 @@
+#
+# 2026-10-18
+#
+
+import collections
+import hashlib
+import logger
+import os
+import pickle
+from typing import Callable, Optional
+
+from text_grid import TextGrid
+
+# -----------------------------------------------------------------------------
+
+# bump when the pickled grids change (TextGrid attributes, reader output), so the stored ones are not used
+CACHE_FORMAT_VERSION = 1
+
+class GridCache:
+    """
+    Cache of the TextGrids read from the files.
+
+    A grid is identified by the (path, st_mtime_ns, st_size) of every source file,
+    and the reader options, so an unchanged file costs only a stat() call.
+    Recently used grids are kept in memory; optionally they are also pickled
+    into the `store_dir`, to survive the application restart; the file name contains
+    the CACHE_FORMAT_VERSION.
+    Both are limited, the least recently used grids are dropped first.
+    Cached grids are shared, and must not be modified.
+    """
+
+    def __init__(self, max_entries: int = 4, store_dir: Optional[str] = None, max_store_files: int = 32):
+        self.max_entries = max_entries
+        self.store_dir = store_dir
+        self.max_store_files = max_store_files
+        self.hits = 0
+        self.misses = 0
+        self.__grids: collections.OrderedDict[tuple, TextGrid] = collections.OrderedDict()
+
+    @staticmethod
+    def make_key(paths: tuple[str, ...], options: tuple) -> tuple:
+        """Raises OSError if any file does not exists"""
+        files = []
+        for path in paths:
+            st = os.stat(path)
+            files.append((os.path.abspath(path), st.st_mtime_ns, st.st_size))
+        return (tuple(files), options)
+
+    @staticmethod
+    def with_options(key: tuple, options: tuple) -> tuple:
+        """The key of the same files, read with other `options`"""
+        return (key[0], options)
+
+    def get(self, key: tuple) -> Optional[TextGrid]:
+        grid = self.__grids.get(key)
+        if grid is not None:
+            self.__grids.move_to_end(key)
+            return grid
+
+        grid = self.__store_read(key)
+        if grid is not None:
+            self.__put_memory(key, grid)
+        return grid
+
+    def put(self, key: tuple, grid: TextGrid):
+        self.__put_memory(key, grid)
+        self.__store_write(key, grid)
+
+    def load(self, paths: tuple[str, ...], options: tuple, read_fn: Callable[[], TextGrid]) -> TextGrid:
+        """
+        Returns the cached grid, or the one returned by the `read_fn()`.
+        options: everything, besides the file contents, that makes the grid different
+        """
+        (key, grid) = self.find(paths, options)
+        if grid is None:
+            grid = read_fn()
+            self.put(key, grid)
+        return grid
+
+    def find(self, paths: tuple[str, ...], options: tuple) -> tuple[tuple, Optional[TextGrid]]:
+        """
+        Returns the key and the cached grid, or None - then the grid read should be `put()` with that key;
+        the key is made before the files are read, so the files modified while reading are read again next time
+        """
+        key = self.make_key(paths, options)
+        grid = self.get(key)
+        if grid is not None:
+            self.hits += 1
+            logger.debug(f"  Cached grid of {os.path.basename(paths[0])}")
+        else:
+            self.misses += 1
+        return (key, grid)
+
+    def clear(self):
+        """Clears the memory cache only"""
+        self.__grids.clear()
+
+    def __put_memory(self, key: tuple, grid: TextGrid):
+        self.__grids[key] = grid
+        self.__grids.move_to_end(key)
+        while len(self.__grids) > self.max_entries:
+            self.__grids.popitem(last=False)
+
+    def __store_path(self, key: tuple) -> str:
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.store_dir, f"{digest}.v{CACHE_FORMAT_VERSION}.pickle")
+
+    def __store_read(self, key: tuple) -> Optional[TextGrid]:
+        if self.store_dir is None:
+            return None
+
+        path = self.__store_path(key)
+        try:
+            with open(path, "rb") as f:
+                (stored_key, grid) = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Grid cache: cannot read '{path}': {e}")
+            os.remove(path)
+            return None
+
+        if stored_key != key:
+            return None
+        # least recently used are evicted first
+        os.utime(path)
+        return grid
+
+    def __store_write(self, key: tuple, grid: TextGrid):
+        if self.store_dir is None:
+            return
+
+        try:
+            os.makedirs(self.store_dir, exist_ok=True)
+            path = self.__store_path(key)
+            with open(path + ".tmp", "wb") as f:
+                pickle.dump((key, grid), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(path + ".tmp", path)
+            self.__store_evict()
+        except Exception as e:
+            logger.warning(f"Grid cache: cannot store the grid: {e}")
+
+    def __store_evict(self):
+        files = [
+            os.path.join(self.store_dir, fname)
+            for fname in os.listdir(self.store_dir)
+            if fname.endswith(".pickle")
+        ]
+        if len(files) > self.max_store_files:
+            files.sort(key=os.path.getmtime)
+            for path in files[:len(files) - self.max_store_files]:
+                os.remove(path)
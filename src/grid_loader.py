@@ -0,0 +1,319 @@
+#
+# 2026-10-18
+#
+
+import concurrent.futures
+import logger
+import os
+import perf
+import re
+import time
+from typing import Optional
+
+from grid_cache import GridCache
+from project import Profile
+from text_grid import TextGrid, ConfiguredTextGrid, RowWindow
+
+# -----------------------------------------------------------------------------
+
+# typical PnP file names: "Pick Place for X.csv", "PnP-X.mnt", "PPF_X.txt", "X-centroid.csv"
+PNP_NAME_RE = re.compile(r"pnp|pick.?place|ppf|centroid|\.mn[tb]$", re.IGNORECASE)
+# bottom layer PnP: "X.mnb", "X-bot.csv", "X_bottom.csv"
+PNP_BOTTOM_RE = re.compile(r"bot|\.mnb$", re.IGNORECASE)
+# pools reading the files concurrently, see make_executor()
+LOAD_POOLS = ("none", "thread", "process")
+
+def find_pnp_files(bom_path: str) -> list[str]:
+    """Returns names of the files from the BOM directory, that may be the PnP files"""
+    bom_dir = os.path.dirname(bom_path)
+    logger.debug(f"Search PnP in: {bom_dir}")
+    pnp_names = []
+    for de in os.scandir(bom_dir or "."):
+        # take only the file name
+        pnp_fname = os.path.basename(de.path)
+        if pnp_fname != os.path.basename(bom_path) and de.is_file():
+            if not pnp_fname.lower().endswith((".html", ".json")):
+                pnp_names.append(pnp_fname)
+    pnp_names.sort()
+    return pnp_names
+
+def guess_pnp_files(bom_path: str) -> tuple[str, str]:
+    """
+    Selects the PnP file(s) for the BOM: returns the (pnp_fname, pnp2_fname), pnp2_fname may be empty.
+    Raises ValueError if not found or ambiguous
+    """
+    candidates = [name for name in find_pnp_files(bom_path) if "bom" not in name.lower()]
+    pnp_names = [name for name in candidates if PNP_NAME_RE.search(name)] or candidates
+
+    if len(pnp_names) == 1:
+        return (pnp_names[0], "")
+    if len(pnp_names) == 2:
+        # top layer first
+        pnp_names.sort(key=lambda name: PNP_BOTTOM_RE.search(name) is not None)
+        if PNP_BOTTOM_RE.search(pnp_names[1]) and not PNP_BOTTOM_RE.search(pnp_names[0]):
+            return (pnp_names[0], pnp_names[1])
+    raise ValueError(f"Cannot select the PnP file for '{os.path.basename(bom_path)}' from: {pnp_names}")
+
+def read_grid(path: str, columnar: bool = False, delim: str = ",", quotechar: str = "",
+              window: Optional[RowWindow] = None, any_as_csv: bool = False) -> TextGrid:
+    """
+    Reads the file with a reader selected by the file extension;
+    only the `window` rows are read, if given.
+    any_as_csv=True: not recognized extension is read as CSV, otherwise RuntimeError is raised
+    """
+    with perf.stage("read"):
+        grid = __read_file(path, columnar, delim, quotechar, window, any_as_csv)
+    __count_read(grid)
+    return grid
+
+def __count_read(grid: TextGrid):
+    perf.count("files read")
+    perf.count("rows read", grid.nrows)
+    perf.count("cells read", grid.nrows * grid.ncols)
+
+def __read_file_timed(path: str, columnar: bool, delim: str, quotechar: str, window: Optional[RowWindow],
+                      any_as_csv: bool) -> tuple[TextGrid, float]:
+    """Executed by the pool: the perf stats of the caller thread are not available there"""
+    t_start = time.perf_counter()
+    grid = __read_file(path, columnar, delim, quotechar, window, any_as_csv)
+    return (grid, time.perf_counter() - t_start)
+
+def __read_file(path: str, columnar: bool, delim: str, quotechar: str, window: Optional[RowWindow],
+                any_as_csv: bool) -> TextGrid:
+    # readers imported when needed, as the spreadsheet libraries take 50..250 ms to import
+    path_lower = path.lower()
+    if path_lower.endswith("xls"):
+        import xls_reader
+        return xls_reader.read_xls_sheet(path, columnar, window)
+    elif path_lower.endswith("xlsx"):
+        import xlsx_reader
+        return xlsx_reader.read_xlsx_sheet(path, columnar, window)
+    elif path_lower.endswith("ods"):
+        import ods_reader
+        return ods_reader.read_ods_sheet(path, columnar, window=window)
+    elif path_lower.endswith("csv") or any_as_csv:
+        import csv_reader
+        return csv_reader.read_csv(path, delim, columnar, quotechar, window)
+    else:
+        raise RuntimeError("Unknown file type")
+
+def bom_window(profile: Profile) -> RowWindow:
+    """Rows of the BOM file used by the profile"""
+    return RowWindow(profile.bom_first_row, profile.bom_last_row)
+
+def pnp_window(profile: Profile, path2: str = "") -> RowWindow:
+    """
+    Rows of the PnP file used by the profile;
+    with the second PnP file (path2 != "") the first file is read entirely: the profile rows are the rows
+    of the merged grid, and both files must have the same number of columns
+    """
+    if path2 != "":
+        return RowWindow()
+    return RowWindow(profile.pnp_first_row, profile.pnp_last_row)
+
+def cache_options(columnar: bool, delim: str, quotechar: str, window: RowWindow) -> tuple:
+    """The GridCache options: all the reader arguments, besides the paths"""
+    return (columnar, delim, quotechar, window.key())
+
+def __cache_detected(cache: GridCache, key: tuple, grid: TextGrid, columnar: bool, delim: str, quotechar: str,
+                     window: RowWindow):
+    """
+    The grid read with the quotechar detected is cached also with the detected one:
+    it is remembered in the profile, and used by the next load
+    """
+    if quotechar == "" and grid.dialect and grid.dialect.quotechar:
+        cache.put(cache.with_options(key, cache_options(columnar, delim, grid.dialect.quotechar, window)), grid)
+
+@perf.timed("load.bom")
+def load_bom(path: str, profile: Profile, columnar: bool = False, cache: Optional[GridCache] = None) -> TextGrid:
+    """Reads the BOM file, using the `cache` if given"""
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"File '{path}' does not exists")
+
+    delim = profile.bom_delimiter
+    quotechar = profile.bom_quotechar
+    window = bom_window(profile)
+    grid = None
+
+    if cache:
+        (key, grid) = cache.find((path,), cache_options(columnar, delim, quotechar, window))
+    if grid is None:
+        grid = read_grid(path, columnar, delim, quotechar, window)
+        if cache:
+            cache.put(key, grid)
+            __cache_detected(cache, key, grid, columnar, delim, quotechar, window)
+
+    if grid.dialect:
+        # remembered in the profile, to skip the detection next time
+        profile.bom_quotechar = grid.dialect.quotechar
+    return grid
+
+@perf.timed("load.pnp")
+def load_pnp(path: str, path2: str, profile: Profile, columnar: bool = False, cache: Optional[GridCache] = None) -> TextGrid:
+    """
+    Reads the PnP file, and the optional second PnP file (path2 != "") merged into it,
+    using the `cache` if given
+    """
+    # sourcery skip: extract-method, use-fstring-for-formatting
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"File '{path}' does not exists")
+
+    # check if optional second PnP file exists
+    if path2 != "" and not os.path.isfile(path2):
+        raise FileNotFoundError(f"File '{path2}' does not exists")
+
+    delim = profile.pnp_delimiter
+    quotechar = profile.pnp_quotechar
+    window = pnp_window(profile, path2)
+    grid = None
+
+    if cache:
+        # merged grid is cached, as the PnP files are modified while merging
+        paths = (path,) if path2 == "" else (path, path2)
+        (key, grid) = cache.find(paths, cache_options(columnar, delim, quotechar, window))
+    if grid is None:
+        pnp_grid = read_grid(path, columnar, delim, quotechar, window, any_as_csv=True)
+        # load the optional second PnP file
+        pnp2_grid = read_grid(path2, columnar, delim, quotechar, any_as_csv=True) if path2 != "" else None
+        grid = __merge_pnp(pnp_grid, pnp2_grid)
+        if cache:
+            cache.put(key, grid)
+            __cache_detected(cache, key, grid, columnar, delim, quotechar, window)
+
+    if grid.dialect:
+        # remembered in the profile, to skip the detection next time
+        profile.pnp_quotechar = grid.dialect.quotechar
+    return grid
+
+def __merge_pnp(pnp_grid: TextGrid, pnp2_grid: Optional[TextGrid]) -> TextGrid:
+    """Returns the PnP grid, with the PnP2 grid appended"""
+    log_f = logger.info if pnp_grid.nrows > 0 else logger.warning
+    log_f(f"PnP: {pnp_grid.nrows} rows x {pnp_grid.ncols} cols")
+
+    if pnp2_grid is not None:
+        log_f = logger.info if pnp2_grid.nrows > 0 else logger.warning
+        log_f("PnP2: {} rows x {} cols".format(pnp2_grid.nrows, pnp2_grid.ncols))
+
+        # merge
+        if pnp2_grid.ncols != pnp_grid.ncols:
+            raise ValueError("PnP has {} columns, but PnP2 has {} columns".format(
+                pnp_grid.ncols, pnp2_grid.ncols
+            ))
+
+        # add a layer column (only for 2 separate files)
+        pnp_grid.append_column("top")
+        pnp2_grid.append_column("bot")
+        pnp_grid.extend(pnp2_grid)
+    return pnp_grid
+
+def make_executor(pool: str, max_workers: int = 3) -> Optional[concurrent.futures.Executor]:
+    """
+    Pool for the `load_files()`, one of the LOAD_POOLS:
+    "thread" - the readers overlap only while they wait for the disk, or the parsing library releases the GIL;
+    "process" - the files are parsed in parallel, but the grids are pickled back to the caller;
+    "none" - returns None, files are read one after another.
+    Raises ValueError for the unknown pool
+    """
+    if pool == "thread":
+        return concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="load")
+    if pool == "process":
+        return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+    if pool == "none":
+        return None
+    raise ValueError(f"Unknown load pool '{pool}', expected one of: {', '.join(LOAD_POOLS)}")
+
+@perf.timed("load.files")
+def load_files(bom_path: str, pnp_path: str, pnp2_path: str, profile: Profile, columnar: bool = False,
+               cache: Optional[GridCache] = None,
+               executor: Optional[concurrent.futures.Executor] = None) -> tuple[Optional[TextGrid], TextGrid]:
+    """
+    Reads the BOM and the PnP file(s): all the files not cached are submitted to the `executor` at once,
+    so it takes as long as the longest read, then the PnP files are merged.
+    bom_path="": only the PnP is read, None is returned for the BOM.
+    Without the executor, the files are read one after another
+    """
+    if executor is None:
+        bom_grid = load_bom(bom_path, profile, columnar, cache) if bom_path != "" else None
+        return (bom_grid, load_pnp(pnp_path, pnp2_path, profile, columnar, cache))
+
+    for file_path in (bom_path, pnp_path, pnp2_path):
+        if file_path != "" and not os.path.isfile(file_path):
+            raise FileNotFoundError(f"File '{file_path}' does not exists")
+
+    bom_delim = profile.bom_delimiter
+    pnp_delim = profile.pnp_delimiter
+    bom_win = bom_window(profile)
+    pnp_win = pnp_window(profile, pnp2_path)
+    pnp_paths = (pnp_path,) if pnp2_path == "" else (pnp_path, pnp2_path)
+    (bom_key, bom_grid) = (None, None)
+    (pnp_key, pnp_grid) = (None, None)
+    if cache:
+        if bom_path != "":
+            (bom_key, bom_grid) = cache.find((bom_path,), cache_options(columnar, bom_delim, profile.bom_quotechar,
+                                                                         bom_win))
+        (pnp_key, pnp_grid) = cache.find(pnp_paths, cache_options(columnar, pnp_delim, profile.pnp_quotechar, pnp_win))
+
+    futures: dict[str, concurrent.futures.Future] = {}
+    if bom_path != "" and bom_grid is None:
+        futures["bom"] = executor.submit(__read_file_timed, bom_path, columnar, bom_delim,
+                                         profile.bom_quotechar, bom_win, False)
+    if pnp_grid is None:
+        futures["pnp"] = executor.submit(__read_file_timed, pnp_path, columnar, pnp_delim,
+                                         profile.pnp_quotechar, pnp_win, True)
+        if pnp2_path != "":
+            futures["pnp2"] = executor.submit(__read_file_timed, pnp2_path, columnar, pnp_delim,
+                                              profile.pnp_quotechar, None, True)
+
+    grids: dict[str, TextGrid] = {}
+    try:
+        for (name, future) in futures.items():
+            (grids[name], seconds) = future.result()
+            perf.add_time("read", seconds)
+            __count_read(grids[name])
+    except BaseException:
+        for future in futures.values():
+            future.cancel()
+        raise
+
+    if "bom" in grids:
+        bom_grid = grids["bom"]
+        if cache:
+            cache.put(bom_key, bom_grid)
+            __cache_detected(cache, bom_key, bom_grid, columnar, bom_delim, profile.bom_quotechar, bom_win)
+    if "pnp" in grids:
+        pnp_grid = __merge_pnp(grids["pnp"], grids.get("pnp2"))
+        if cache:
+            # merged grid is cached, as the PnP files are modified while merging
+            cache.put(pnp_key, pnp_grid)
+            __cache_detected(cache, pnp_key, pnp_grid, columnar, pnp_delim, profile.pnp_quotechar, pnp_win)
+
+    # remembered in the profile, to skip the detection next time
+    if bom_grid is not None and bom_grid.dialect:
+        profile.bom_quotechar = bom_grid.dialect.quotechar
+    if pnp_grid.dialect:
+        profile.pnp_quotechar = pnp_grid.dialect.quotechar
+    return (bom_grid, pnp_grid)
+
+def configure_bom(grid: TextGrid, profile: Profile) -> ConfiguredTextGrid:
+    bom_cfg = ConfiguredTextGrid()
+    bom_cfg.text_grid = grid
+    bom_cfg.has_column_headers = profile.bom_has_column_headers
+    bom_cfg.designator_col = profile.bom_designator_col
+    bom_cfg.comment_col = profile.bom_comment_col
+    bom_cfg.first_row = profile.bom_first_row
+    bom_cfg.last_row = profile.bom_last_row
+    return bom_cfg
+
+def configure_pnp(grid: TextGrid, profile: Profile) -> ConfiguredTextGrid:
+    pnp_cfg = ConfiguredTextGrid()
+    pnp_cfg.text_grid = grid
+    pnp_cfg.has_column_headers = profile.pnp_has_column_headers
+    pnp_cfg.designator_col = profile.pnp_designator_col
+    pnp_cfg.comment_col = profile.pnp_comment_col
+    pnp_cfg.first_row = profile.pnp_first_row
+    pnp_cfg.last_row = profile.pnp_last_row
+    pnp_cfg.coord_x_col = profile.pnp_coord_x_col
+    pnp_cfg.coord_y_col = profile.pnp_coord_y_col
+    pnp_cfg.layer_col = profile.pnp_layer_col
+    pnp_cfg.footprint_col = profile.pnp_footprint_col
+    return pnp_cfg
@@ -0,0 +1,71 @@
+#
+# 2026-10-18
+#
+
+import bisect
+import itertools
+from typing import Optional
+
+import perf
+from grid_search import GridSearchIndex
+from text_grid import TextGrid
+
+# -----------------------------------------------------------------------------
+
+class GridPreview:
+    """
+    Spreadsheet-like preview of the TextGrid rows [first_row, last_row];
+    lines are formatted on request, so the preview widget formats and renders
+    only the visible part of the grid, regardless of the file size.
+    Line 0 is the `first_row` of the grid.
+    The search index is built with the preview, eg. on the worker thread.
+    """
+
+    @perf.timed("preview")
+    def __init__(self, grid: TextGrid, first_row: int = 0, last_row: int = -1):
+        nrows = len(grid.rows_raw())
+        self.grid = grid
+        self.first_row = min(max(first_row, 0), nrows)
+        # last_row is included, like in the `TextGrid.format_grid()`
+        self.end_row = nrows if last_row == -1 else min(max(last_row + 1, self.first_row), nrows)
+        self.columns_width = grid.get_columns_width(self.first_row)
+        # position of every cell in the line, after the row number
+        self.cells_pos = list(itertools.accumulate((w + len(" | ") for w in self.columns_width), initial=0))
+        self.search_index = GridSearchIndex(grid, self.first_row, self.end_row)
+
+    def __len__(self) -> int:
+        return self.end_row - self.first_row
+
+    def lines(self, start: int, count: int) -> list[str]:
+        """Returns up to `count` formatted lines, beginning from the line `start`"""
+        start = min(max(start, 0), len(self))
+        end = min(start + max(count, 0), len(self))
+        return self.grid.format_rows(self.first_row + start, self.first_row + end, self.columns_width)
+
+    def line_of_row(self, row_number: int) -> int:
+        """Returns the line showing the row of given number (as displayed, starting from 1), clamped to the preview"""
+        return min(max(row_number - 1 - self.first_row, 0), max(len(self) - 1, 0))
+
+    def column_names(self) -> list[str]:
+        """Returns texts of the first line cells, eg. the column headers"""
+        if len(self) == 0:
+            return []
+        return [TextGrid.format_cell(cell) for cell in self.grid.rows_raw()[self.first_row]]
+
+    def find(self, needle: str, column: Optional[int] = None, match_case: bool = False) -> list[tuple[int, int]]:
+        """
+        Returns (line, position in the line) of every occurrence of the `needle` in the cells;
+        column None - all the columns
+        """
+        hits = []
+        for (line, c, offset) in self.search_index.find(needle, column, match_case):
+            row_number_len = max(len(str(self.first_row + line + 1)), 3)
+            hits.append((line, row_number_len + len(" | ") + self.cells_pos[c] + offset))
+        return hits
+
+    @staticmethod
+    def hits_in_lines(hits: list[tuple[int, int]], start: int, count: int) -> list[tuple[int, int, int]]:
+        """Returns (hit index, line, position) of the sorted `hits` found in the lines [start, start + count)"""
+        first = bisect.bisect_left(hits, (start, 0))
+        end = bisect.bisect_left(hits, (start + count, 0), first)
+        return [(idx, *hits[idx]) for idx in range(first, end)]
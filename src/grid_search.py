@@ -0,0 +1,100 @@
+#
+# 2026-10-18
+#
+
+import bisect
+import collections
+import itertools
+import operator
+from array import array
+from typing import Optional
+
+from text_grid import TextGrid
+
+# -----------------------------------------------------------------------------
+
+# separates the texts in the column blob; never found by the search
+SEPARATOR = "\0"
+
+class ColumnIndex:
+    """
+    Inverted index of a single column: every distinct text is stored once,
+    with the rows it appears in. The texts are concatenated into a blob,
+    so the substring search over all of them is a single `str.find()` loop.
+    """
+
+    def __init__(self, cells: list[str]):
+        # distinct texts in the order of appearance, cell -> text id
+        text_id_of = dict(zip(dict.fromkeys(cells), itertools.count()))
+        text_ids = list(map(text_id_of.__getitem__, cells))
+        counts = collections.Counter(text_ids)
+        texts = list(text_id_of)
+        # rows sorted by the text id (stable: rows of a text are in ascending order);
+        # rows of the text `i` are rows[starts[i]:starts[i+1]]
+        self.rows = array('I', sorted(range(len(cells)), key=text_ids.__getitem__))
+        self.starts = array('I', itertools.accumulate(map(counts.__getitem__, range(len(texts))), initial=0))
+
+        # text `i` is blob[offsets[i]:offsets[i+1]-1]
+        self.offsets = self.__make_offsets(texts)
+        self.blob = SEPARATOR.join(texts) + SEPARATOR
+        self.lower_blob = self.blob.lower()
+        # lower() may change the text length: then the lower-case texts have their own offsets
+        self.lower_offsets = self.offsets
+        if len(self.lower_blob) != len(self.blob):
+            self.lower_offsets = self.__make_offsets([text.lower() for text in texts])
+
+    @staticmethod
+    def __make_offsets(texts: list[str]) -> array:
+        offsets = array('I', map(operator.add, itertools.accumulate(map(len, texts), initial=0), itertools.count()))
+        offsets.pop()
+        return offsets
+
+    def rows_of_text(self, text_id: int) -> array:
+        return self.rows[self.starts[text_id]:self.starts[text_id + 1]]
+
+    def find(self, needle: str, match_case: bool) -> list[tuple[int, int]]:
+        """Returns (text id, offset in the text) of every occurrence of the needle"""
+        (blob, offsets) = (self.blob, self.offsets) if match_case else (self.lower_blob, self.lower_offsets)
+        found = []
+        pos = blob.find(needle)
+        while pos >= 0:
+            text_id = bisect.bisect_right(offsets, pos) - 1
+            found.append((text_id, pos - offsets[text_id]))
+            pos = blob.find(needle, pos + len(needle))
+        return found
+
+class GridSearchIndex:
+    """
+    Search index of the TextGrid rows [first_row, end_row), built once,
+    eg. on the worker thread together with the preview.
+    Rows are numbered from 0 = `first_row`.
+    """
+
+    def __init__(self, grid: TextGrid, first_row: int = 0, end_row: Optional[int] = None):
+        rows = grid.rows_raw()[first_row:end_row]
+        self.nrows = len(rows)
+        self.columns: list[ColumnIndex] = []
+
+        for column in itertools.zip_longest(*rows, fillvalue=""):
+            if set(map(type, column)) != {str}:
+                column = map(TextGrid.format_cell, column)
+            self.columns.append(ColumnIndex(list(column)))
+
+    def find(self, needle: str, column: Optional[int] = None, match_case: bool = False) -> list[tuple[int, int, int]]:
+        """
+        Returns sorted (row, column, offset in the cell) of every occurrence of the needle;
+        column None - all the columns
+        """
+        if not needle or SEPARATOR in needle:
+            return []
+        if not match_case:
+            needle = needle.lower()
+
+        hits = []
+        columns = range(len(self.columns)) if column is None else (column,) if 0 <= column < len(self.columns) else ()
+        for c in columns:
+            col_index = self.columns[c]
+            for (text_id, offset) in col_index.find(needle, match_case):
+                hits.extend((r, c, offset) for r in col_index.rows_of_text(text_id))
+        hits.sort()
+        return hits
@@ -1,13 +1,32 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import time
+from typing import Optional, Union
 
 # -----------------------------------------------------------------------------
 
-# __logger = None
+# not configured yet: messages >= WARNING printed to stderr by the logging module
+__logger = logging.getLogger('__logger')
+# writes the queued records to the file and console, on a background thread
+__listener: Optional[logging.handlers.QueueListener] = None
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
 
 # -----------------------------------------------------------------------------
 
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Puts the records into the queue as they are: unlike the QueueHandler,
+    the 'msg % args' formatting is done by the listener thread, not by the caller.
+    Logged arguments must not be modified after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
 def __get_logs_directory() -> str:
     logs_path = os.path.dirname(__file__)
     logs_path = os.path.join(logs_path, "..")
@@ -15,8 +34,15 @@ def __get_logs_directory() -> str:
     logs_path = os.path.join(logs_path, "logs")
     return logs_path
 
-def config(use_color_logs: bool):
-    loger_fname = __get_logs_directory()
+def get_logs_directory() -> str:
+    return __get_logs_directory()
+
+def config(use_color_logs: bool, level: Union[int, str] = logging.DEBUG, logs_dir: str = ""):
+    """
+    Logs to the console and to the logs/<date>.log file;
+    the records are queued, and written by a background thread
+    """
+    loger_fname = logs_dir or __get_logs_directory()
     if not os.path.isdir(loger_fname):
         os.mkdir(loger_fname)
     loger_fname = os.path.join(loger_fname, time.strftime("%Y-%m-%d.log"))
@@ -25,7 +51,11 @@ def config(use_color_logs: bool):
     # Create a logger
     global __logger
     __logger = logging.getLogger('__logger')
-    __logger.setLevel(logging.DEBUG)
+    set_level(level)
+    # configured again: the previous listener flushed and replaced
+    shutdown()
+    for handler in list(__logger.handlers):
+        __logger.removeHandler(handler)
 
     # Create a file handler to write logs to a file
     file_formatter = logging.Formatter(fmt='%(asctime)s %(levelname)s: %(message)s', datefmt='%H:%M:%S')
@@ -40,9 +70,14 @@ def config(use_color_logs: bool):
     console_handler.setLevel(logging.DEBUG)  # You can set the desired log level for console output
     console_handler.setFormatter(console_formatter)
 
-    # Add the handlers to the logger
-    __logger.addHandler(file_handler)
-    __logger.addHandler(console_handler)
+    # The logger only puts the records into the queue, the handlers are called by the listener thread
+    log_queue = queue.SimpleQueue()
+    __logger.addHandler(DeferredQueueHandler(log_queue))
+    # not passed to the root logger handlers, formatting in the caller thread
+    __logger.propagate = False
+    global __listener
+    __listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    __listener.start()
 
     if use_color_logs:
         # logger config with dimmed time
@@ -78,6 +113,31 @@ def config(use_color_logs: bool):
 
     __logger.debug("----------------- STARTING -----------------")
 
+def shutdown():
+    """Writes all the queued records, stops the listener thread; called at exit"""
+    global __listener
+    if __listener is not None:
+        __listener.stop()
+        for handler in __listener.handlers:
+            handler.close()
+        __listener = None
+
+atexit.register(shutdown)
+
+def set_level(level: Union[int, str]):
+    """Changes the level at runtime: `logging.INFO` or "INFO"; disabled messages are not formatted at all"""
+    if isinstance(level, str):
+        level = logging.getLevelName(level.strip().upper())
+        if not isinstance(level, int):
+            raise ValueError(f"Unknown log level, expected one of {LEVELS}")
+    __logger.setLevel(level)
+
+def get_level() -> int:
+    return __logger.level
+
+def is_enabled_for(level: int) -> bool:
+    return __logger.isEnabledFor(level)
+
 # -----------------------------------------------------------------------------
 
 def debug(msg, *args, **kwargs):
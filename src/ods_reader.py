@@ -3,8 +3,15 @@
 #
 
 import logger
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Optional
 
-from odf import opendocument, table
+try:
+    # optional: the DOM-based reader engine
+    from odf import opendocument, table
+except ImportError:
+    opendocument = table = None
 
 # local copy of odf:
 # import os
@@ -12,24 +19,136 @@ from odf import opendocument, table
 # sys.path.append(os.path.join(os.path.dirname(__file__), "odfpy"))
 # from odfpy.odf import opendocument, table
 
-from text_grid import TextGrid
+from text_grid import TextGrid, ColumnarTextGrid, RowWindow
 
 # -----------------------------------------------------------------------------
 
+TABLE_NS = "urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+TAG_TABLE = f"{{{TABLE_NS}}}table"
+TAG_TABLE_ROW = f"{{{TABLE_NS}}}table-row"
+TAG_TABLE_CELL = f"{{{TABLE_NS}}}table-cell"
+ATTR_TABLE_NAME = f"{{{TABLE_NS}}}name"
+ATTR_COLUMNS_REPEATED = f"{{{TABLE_NS}}}number-columns-repeated"
+ATTR_ROWS_REPEATED = f"{{{TABLE_NS}}}number-rows-repeated"
+
+# limit of the repeated cells inside a row
+MAX_CELL_REPEATS = 25
+# limit of the repeated rows; the empty rows up to the sheet end are repeated ~1M times
+MAX_ROW_REPEATS = 25
+
 def __check_row_valid(row_cells: list[str]) -> bool:
     # ignore rows with empty cells 'A,B,C' or cell 'A' with a long horizontal line
     row_valid = (len(row_cells) > 3) and (row_cells[0] or row_cells[1] or row_cells[2])
     row_valid = row_valid and not row_cells[0].startswith("___")
     return row_valid
 
-def read_ods_sheet(path: str) -> TextGrid:
+def __read_row(row_elem: ET.Element, row_idx: int, max_len: Optional[int] = None) -> tuple[list[str], int]:
     """
-    Reads ODS/spreadsheet document, returning the first sheet
+    Returns the row cells, without the trailing empty cells, and the row length including them;
+    max_len: the cells after are not read
+    """
+    row_cells = []
+    row_len = 0
+    # number of empty cells not yet added to the `row_cells`
+    empty_cells = 0
+
+    for cell_elem in row_elem.iterfind(TAG_TABLE_CELL):
+        if row_len == max_len:
+            break
+        repeated = int(cell_elem.get(ATTR_COLUMNS_REPEATED, 1))
+        cell = "".join(cell_elem.itertext()).strip()
+
+        if repeated > MAX_CELL_REPEATS:
+            if cell:
+                logger.warning("Cell {ridx}:{cidx} repeated {rep} times".format(
+                               ridx=row_idx, cidx=row_len+1, rep=repeated))
+            repeated = MAX_CELL_REPEATS
+        if max_len is not None:
+            repeated = min(repeated, max_len - row_len)
+        row_len += repeated
+
+        if cell:
+            row_cells.extend("" for _ in range(empty_cells))
+            empty_cells = 0
+            row_cells.extend(cell for _ in range(repeated))
+        else:
+            empty_cells += repeated
+
+    return (row_cells, row_len)
+
+def __row_repeats(repeated: int, row_idx: int) -> int:
+    """Returns the number of the `repeated` row copies, limited to MAX_ROW_REPEATS"""
+    if repeated > MAX_ROW_REPEATS:
+        logger.warning("Row {ridx} repeated {rep} times".format(ridx=row_idx, rep=repeated))
+        repeated = MAX_ROW_REPEATS
+    return repeated
+
+def __read_content_stream(path: str, tg: TextGrid, window: RowWindow) -> int:
+    """Reads the first table of the content.xml, until the `window` end; returns the number of columns"""
+    max_cols = 0
+    end = window.end()
+
+    with zipfile.ZipFile(path) as odf_zip:
+        with odf_zip.open("mimetype") as f:
+            if "opendocument.spreadsheet" not in f.read().decode("utf-8"):
+                logger.error("File does not contain a spreadsheet document")
+                return max_cols
+
+        with odf_zip.open("content.xml") as f:
+            # currently open elements
+            parents: list[ET.Element] = []
+            in_table = False
+
+            for event, elem in ET.iterparse(f, events=("start", "end")):
+                if event == "start":
+                    parents.append(elem)
+                    if elem.tag == TAG_TABLE and not in_table:
+                        in_table = True
+                        logger.info(f"Reading sheet: {elem.get(ATTR_TABLE_NAME)}")
+                    continue
+
+                parents.pop()
+                if not in_table:
+                    continue
+
+                if elem.tag == TAG_TABLE_ROW:
+                    # before the window: only the first cells read
+                    skipped = len(tg.rows_raw()) < window.first
+                    row_cells, row_len = __read_row(elem, len(tg.rows_raw())+1,
+                                                    RowWindow.SKIPPED_ROW_CELLS if skipped else None)
+                    # the trailing empty cells are counted, but not stored
+                    row_valid = __check_row_valid(row_cells + [""] * (min(row_len, 4) - len(row_cells)))
+                    if row_valid:
+                        if not skipped:
+                            # the same as the odfpy engine: trailing empty cells added by the alignment
+                            max_cols = max(max_cols, row_len)
+                        repeated = __row_repeats(int(elem.get(ATTR_ROWS_REPEATED, 1)), len(tg.rows_raw())+1)
+                        if end is not None:
+                            repeated = min(repeated, end - len(tg.rows_raw()))
+                        tg.rows_raw().append(row_cells)
+                        for _ in range(repeated - 1):
+                            tg.rows_raw().append(list(row_cells))
+                        if len(tg.rows_raw()) == end:
+                            # the rest of the content.xml is not read
+                            logger.debug(f"  Last row {end} reached")
+                            break
+                    # free the memory: the row is processed
+                    elem.clear()
+                    parents[-1].remove(elem)
+                elif elem.tag == TAG_TABLE:
+                    # dont read any other sheets
+                    break
+
+    return max_cols
+
+def __read_content_odfpy(path: str, tg: TextGrid, window: RowWindow) -> int:
+    """
+    Reads the first table using the odfpy document model, until the `window` end;
+    returns the number of columns
     """
-    assert path is not None
-    logger.info(f"Reading file '{path}'")
     doc = opendocument.load(path)
-    tg = TextGrid()
+    max_cols = 0
+    end = window.end()
 
     # with open(path + "-dump.xml", "w") as f:
     #     f.write(str(doc.xml()))
@@ -38,37 +157,74 @@ def read_ods_sheet(path: str) -> TextGrid:
         for tab in doc.getElementsByType(table.Table):
             name = tab.getAttrNS(table.TABLENS, "name")
             logger.info(f"Reading sheet: {name}")
-            max_cols = 0
             REPEATS_ATTR = "number-columns-repeated".replace('-','')
+            ROW_REPEATS_ATTR = "number-rows-repeated".replace('-','')
 
             for tablerow in tab.getElementsByType(table.TableRow):
                 tablecells = tablerow.getElementsByType(table.TableCell)
                 row_cells = []
+                # before the window: only the first cells converted
+                skipped = len(tg.rows_raw()) < window.first
 
                 # when iterating through the row cells, take the "repeat" attribute into account
                 for cell in tablecells:
+                    if skipped and len(row_cells) >= RowWindow.SKIPPED_ROW_CELLS:
+                        break
                     rep_attr = cell.getAttribute(REPEATS_ATTR) or 1
                     repeated = int(rep_attr)
-                    if repeated > 25:
+                    if repeated > MAX_CELL_REPEATS:
                         logger.warning("Cell {ridx}:{cidx} repeated {rep} times".format(
                                        ridx=len(tg.rows_raw())+1, cidx=len(row_cells)+1, rep=repeated))
-                        repeated = 25
+                        repeated = MAX_CELL_REPEATS
                     cell = str(cell).strip()
 
                     for _ in range(repeated):
                         row_cells.append(cell)
 
                 if __check_row_valid(row_cells):
-                    max_cols = max(max_cols, len(row_cells))
-                    tg.rows_raw().append(row_cells)
-
-            tg.nrows = len(tg.rows_raw())
-            tg.ncols = max_cols
+                    repeated = __row_repeats(int(tablerow.getAttribute(ROW_REPEATS_ATTR) or 1),
+                                             len(tg.rows_raw())+1)
+                    if end is not None:
+                        repeated = min(repeated, end - len(tg.rows_raw()))
+                    if skipped:
+                        row_cells = row_cells[:RowWindow.SKIPPED_ROW_CELLS]
+                    else:
+                        max_cols = max(max_cols, len(row_cells))
+                    for _ in range(repeated):
+                        tg.rows_raw().append(list(row_cells))
+                    if len(tg.rows_raw()) == end:
+                        logger.debug(f"  Last row {end} reached")
+                        break
 
             # dont read any other sheets
             break
     else:
         logger.error("File does not contain a spreadsheet document")
 
+    return max_cols
+
+def read_ods_sheet(path: str, columnar: bool = False, engine: str = "stream",
+                   window: Optional[RowWindow] = None) -> TextGrid:
+    """
+    Reads ODS/spreadsheet document, returning the first sheet, or only its `window` rows
+    columnar=True: returns the memory-efficient ColumnarTextGrid
+    engine: "stream" - content.xml parsed as a stream, "odfpy" - using the odfpy document model
+    """
+    assert path is not None
+    logger.info(f"Reading file '{path}'")
+    tg = ColumnarTextGrid() if columnar else TextGrid()
+    window = window or RowWindow()
+
+    if engine == "stream":
+        max_cols = __read_content_stream(path, tg, window)
+    elif engine == "odfpy":
+        if opendocument is None:
+            raise RuntimeError("odfpy is not installed")
+        max_cols = __read_content_odfpy(path, tg, window)
+    else:
+        raise ValueError(f"Unknown ODS reader engine '{engine}'")
+
+    tg.nrows = len(tg.rows_raw())
+    tg.ncols = max_cols
     tg.align_number_of_columns()
     return tg
@@ -0,0 +1,156 @@
+#
+# 2026-10-18
+#
+# Timing of the stages, and counters, of a single cross-check run:
+#
+#   with perf.run("check") as stats:
+#       with perf.stage("load.bom"):
+#           ...
+#       perf.count("rows read", grid.nrows)
+#
+# Stages and counters outside of a run are not recorded.
+# The run summary is logged as a single "perf {json}" line.
+# BOOMER_PROFILE=<file.prof> environment variable: the first run in the process is profiled
+# with the cProfile, and the stats saved to the file (`python -m pstats <file.prof>` to view)
+
+import contextlib
+import cProfile
+import functools
+import json
+import logger
+import os
+import threading
+import time
+from typing import Callable, Iterator, Optional
+
+# -----------------------------------------------------------------------------
+
+PROFILE_ENV = "BOOMER_PROFILE"
+
+class PerfStats:
+    """Stages time [s] (accumulated when the stage is repeated) and counters of the run"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stages: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+        self.t_start = time.perf_counter()
+        # set when the run ends
+        self.total = 0.0
+
+    def add_time(self, stage: str, seconds: float):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def add_count(self, counter: str, n: int):
+        self.counters[counter] = self.counters.get(counter, 0) + n
+
+    def elapsed(self) -> float:
+        return self.total or (time.perf_counter() - self.t_start)
+
+    def to_dict(self) -> dict:
+        return {
+            "run": self.name,
+            "total_ms": round(self.elapsed() * 1000, 1),
+            "stages_ms": {stage: round(seconds * 1000, 1) for stage, seconds in self.stages.items()},
+            "counters": dict(self.counters),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    def format_table(self) -> str:
+        """Stages and counters as the plain text table"""
+        rows = [(stage, f"{seconds * 1000:.1f} ms") for stage, seconds in self.stages.items()]
+        rows.append(("total", f"{self.elapsed() * 1000:.1f} ms"))
+        rows.extend((counter, str(n)) for counter, n in self.counters.items())
+        name_w = max(len(row[0]) for row in rows)
+        value_w = max(len(row[1]) for row in rows)
+        return "\n".join(f"{name:{name_w}} : {value:>{value_w}}" for name, value in rows)
+
+# -----------------------------------------------------------------------------
+
+# the run of the current thread
+__local = threading.local()
+# only one run in the process is profiled
+__profiled = False
+
+def current() -> Optional[PerfStats]:
+    """Returns the stats of the run performed by the current thread"""
+    return getattr(__local, "stats", None)
+
+@contextlib.contextmanager
+def run(name: str) -> Iterator[PerfStats]:
+    """Records the stages performed inside; nested run is a part of the outer one"""
+    stats = current()
+    if stats is not None:
+        yield stats
+        return
+
+    stats = PerfStats(name)
+    __local.stats = stats
+    profiler = __start_profiler()
+    try:
+        yield stats
+    finally:
+        stats.total = time.perf_counter() - stats.t_start
+        __local.stats = None
+        if profiler:
+            __stop_profiler(profiler)
+        logger.info("perf %s", stats.to_json())
+
+@contextlib.contextmanager
+def stage(name: str) -> Iterator[None]:
+    stats = current()
+    if stats is None:
+        yield
+        return
+
+    t_start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.add_time(name, time.perf_counter() - t_start)
+
+def timed(name: str) -> Callable:
+    """Decorator: every call of the function is the stage"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def add_time(name: str, seconds: float):
+    """Stage time measured elsewhere, e.g. by the worker thread or process"""
+    stats = current()
+    if stats is not None:
+        stats.add_time(name, seconds)
+
+def count(counter: str, n: int = 1):
+    stats = current()
+    if stats is not None:
+        stats.add_count(counter, n)
+
+def __start_profiler() -> Optional[cProfile.Profile]:
+    global __profiled
+    if __profiled or not os.environ.get(PROFILE_ENV):
+        return None
+    __profiled = True
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as e:
+        # another profiler is active
+        logger.warning(f"cProfile: {e}")
+        return None
+    return profiler
+
+def __stop_profiler(profiler: cProfile.Profile):
+    profiler.disable()
+    path = os.environ.get(PROFILE_ENV, "")
+    try:
+        profiler.dump_stats(path)
+        logger.info(f"cProfile stats saved to '{path}'")
+    except OSError as e:
+        logger.warning(f"cProfile: cannot save '{path}': {e}")
@@ -16,6 +16,7 @@ class Profile:
         self.bom_first_row = 0 # 0-based
         self.bom_last_row = -1 # 0-based, not saved in config file
         self.bom_separator = "COMMA"
+        self.bom_quotechar = "" # detected by the CSV reader
         self.bom_designator_col = "?"
         self.bom_comment_col = "?"
 
@@ -24,6 +25,7 @@ class Profile:
         self.pnp_first_row = 0 # 0-based
         self.pnp_last_row = -1 # 0-based, not saved in config file
         self.pnp_separator = "COMMA"
+        self.pnp_quotechar = "" # detected by the CSV reader
         self.pnp_designator_col = "?"
         self.pnp_comment_col = "?"
         self.pnp_footprint_col = "?"
@@ -46,6 +48,7 @@ class Profile:
                 self.bom_first_row = int(section.get("bom_first_row", "0"))
                 self.bom_last_row = -1
                 self.bom_separator = section.get("bom_separator", "COMMA")
+                self.bom_quotechar = section.get("bom_quotechar", "")
                 self.bom_designator_col = section.get("bom_designator_col", "?")
                 self.bom_comment_col = section.get("bom_comment_col", "?")
                 if self.bom_has_column_headers == False:
@@ -56,6 +59,7 @@ class Profile:
                 self.pnp_first_row = int(section.get("pnp_first_row", "0"))
                 self.pnp_last_row = -1
                 self.pnp_separator = section.get("pnp_separator", "COMMA")
+                self.pnp_quotechar = section.get("pnp_quotechar", "")
                 self.pnp_designator_col = section.get("pnp_designator_col", "?")
                 self.pnp_comment_col = section.get("pnp_comment_col", "?")
                 self.pnp_footprint_col = section.get("pnp_footprint_col", "?")
@@ -82,12 +86,14 @@ class Profile:
             "bom_has_column_headers": self.bom_has_column_headers,
             "bom_first_row": self.bom_first_row,
             "bom_separator": self.bom_separator,
+            "bom_quotechar": self.bom_quotechar,
             "bom_designator_col": self.bom_designator_col,
             "bom_comment_col": self.bom_comment_col,
             #
             "pnp_has_column_headers": self.pnp_has_column_headers,
             "pnp_first_row": self.pnp_first_row,
             "pnp_separator": self.pnp_separator,
+            "pnp_quotechar": self.pnp_quotechar,
             "pnp_designator_col": self.pnp_designator_col,
             "pnp_comment_col": self.pnp_comment_col,
             "pnp_footprint_col": self.pnp_footprint_col,
@@ -125,7 +131,7 @@ class Profile:
 
     @staticmethod
     def get_separator_names() -> list[str]:
-        return ["COMMA", "SEMICOLON", "TAB", "SPACES", "FIXED-WIDTH", "REGEX"].copy()
+        return ["COMMA", "SEMICOLON", "TAB", "SPACES", "FIXED-WIDTH", "REGEX", "AUTO"].copy()
 
     @staticmethod
     def translate_separator(sep: str) -> str:
@@ -144,6 +150,8 @@ class Profile:
                 return "*fw"
             case "REGEX":
                 return "*re"
+            case "AUTO":
+                return "*auto"
             case _:
                 raise RuntimeError("Unknown CSV separator")
         """
@@ -160,6 +168,8 @@ class Profile:
             return "*fw"
         elif sep == "REGEX":
             return "*re"
+        elif sep == "AUTO":
+            return "*auto"
         else:
             raise RuntimeError("Unknown CSV separator")
 
@@ -219,6 +229,49 @@ class Project:
         section = self.get_section("common")
         section["color_logs"] = new_en
 
+    @property
+    def log_level(self) -> str:
+        """One of the `logger.LEVELS`"""
+        section = self.get_section("common")
+        return section.get("log_level", fallback="DEBUG")
+
+    @log_level.setter
+    def log_level(self, level: str):
+        section = self.get_section("common")
+        section["log_level"] = level
+
+    @property
+    def columnar_grids(self) -> bool:
+        """Files are loaded into the memory-efficient ColumnarTextGrid"""
+        section = self.get_section("common")
+        enabled = section.get("columnar_grids", fallback=False)
+        return enabled == "True"
+
+    @property
+    def grid_cache_store(self) -> bool:
+        """Loaded grids are also stored on disk, in the logs/grid_cache"""
+        section = self.get_section("common")
+        enabled = section.get("grid_cache_store", fallback=False)
+        return enabled == "True"
+
+    @property
+    def load_pool(self) -> str:
+        """Pool reading the BOM and PnP files at once, one of the `grid_loader.LOAD_POOLS`"""
+        section = self.get_section("common")
+        return section.get("load_pool", fallback="thread")
+
+    @property
+    def watch_files(self) -> bool:
+        """BOM/PnP files watched, changes cross-checked automatically"""
+        section = self.get_section("common")
+        enabled = section.get("watch_files", fallback=False)
+        return enabled == "True"
+
+    @watch_files.setter
+    def watch_files(self, enable: bool):
+        section = self.get_section("common")
+        section["watch_files"] = str(enable)
+
     def save(self):
         with open(Profile.CONFIG_FILE_NAME, 'w', encoding="utf-8") as f:
             self.__config.write(f)
@@ -234,7 +287,7 @@ class Project:
 
     # ---
 
-    def get_projects(self) -> list[str]:
+    def get_projects(self, remove_missing: bool = True) -> list[str]:
         projects = [
             sect.removeprefix("project.")
             for sect in self.__config.sections()
@@ -242,9 +295,12 @@ class Project:
         ]
         for prj_path in reversed(projects):
             if not os.path.exists(prj_path):
-                logger.info(f"Project '{prj_path}' not found - removed")
                 projects.remove(prj_path)
-                self.del_project(prj_path)
+                if remove_missing:
+                    logger.info(f"Project '{prj_path}' not found - removed")
+                    self.del_project(prj_path)
+                else:
+                    logger.warning(f"Project '{prj_path}' not found")
 
         projects.sort()
         return projects
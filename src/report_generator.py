@@ -1,14 +1,27 @@
 import time
 # import logger
 import difflib
+import functools
+import html
+import io
+import itertools
+import json
+import os
+import re
+from typing import Any, Iterator, Optional, Protocol
 
 from text_grid import *
 import cross_check
+import perf
 
 # -----------------------------------------------------------------------------
 
 EOL = '\n'
 PRE_EOL = '\n' # when \r\n, PRE block inserts empty lines when .html file is opened
+# rendered comment diffs remembered; boards use the same few passives many times
+DIFF_CACHE_SIZE = 1024
+# designator column width limit: grouped designators ("C1..C5, C9") may be long
+DESIGNATOR_MAX_W = 16
 
 def __html_title(content: str) -> str:
     # https://en.wikipedia.org/wiki/Web_colors
@@ -41,15 +54,19 @@ def __html_span_blue(content: str) -> str:
 def __html_span_gray(content: str) -> str:
     return f'<span style="color: Gray">{content}</span>'
 
-def __format_comment_diff(designator: str, designator_w: int, bom_cmnt: str, bom_w: int, pnp_cmnt: str, pnp_footprint: str) -> str:
+def __html_details_begin(summary: str) -> str:
+    # collapsed section
+    return f'<details>{EOL}<summary style="color: DimGray;">{summary}</summary>{EOL}'
+
+def __html_details_end() -> str:
+    return f'</details>{EOL}'
+
+@functools.lru_cache(maxsize=DIFF_CACHE_SIZE)
+def __diff_comments(bom_cmnt: str, pnp_cmnt: str) -> tuple[str, str]:
+    """Returns the html of the BOM and PnP comments with the differences highlighted"""
     bom_comment = ""
     pnp_comment = ""
 
-    # Prepend the PnP footprint to the BOM comment so comparisons include the footprint.
-    # Resulting string is "<footprint>_<bom_comment>", e.g. "C1206_100nF"
-    if pnp_footprint:
-        bom_cmnt = "_".join([pnp_footprint, bom_cmnt])
-
     # https://docs.python.org/3/library/difflib.html
     sm = difflib.SequenceMatcher(None, bom_cmnt, pnp_cmnt)
     for tag, i1, i2, j1, j2 in sm.get_opcodes():
@@ -67,7 +84,15 @@ def __format_comment_diff(designator: str, designator_w: int, bom_cmnt: str, bom
             # a[i1:i2] == b[j1:j2] (the sub-sequences are equal).
             bom_comment += bom_cmnt[i1:i2]
             pnp_comment += pnp_cmnt[j1:j2]
+    return (bom_comment, pnp_comment)
 
+def __format_comment_diff(designator: str, designator_w: int, bom_cmnt: str, bom_w: int, pnp_cmnt: str, pnp_footprint: str) -> str:
+    # Prepend the PnP footprint to the BOM comment so comparisons include the footprint.
+    # Resulting string is "<footprint>_<bom_comment>", e.g. "C1206_100nF"
+    if pnp_footprint:
+        bom_cmnt = "_".join([pnp_footprint, bom_cmnt])
+
+    (bom_comment, pnp_comment) = __diff_comments(bom_cmnt, pnp_cmnt)
     bom_comment += ' ' * max(0, bom_w - len(bom_cmnt))
 
     ### output:
@@ -82,6 +107,36 @@ def __format_comment_diff(designator: str, designator_w: int, bom_cmnt: str, bom
     # logger.debug(f"'{out}'")
     return out
 
+def __designators_ranges(designators: list[str]) -> str:
+    """C1, C2, C3, C7, R1 -> "C1..C3, C7, R1"; the designators are sorted naturally"""
+    # [[prefix, first number, last number, first designator, last designator], ...]
+    runs = []
+    for dsgn in designators:
+        m = re.fullmatch(r"(.*?)(\d+)", dsgn)
+        (prefix, number) = (m.group(1), int(m.group(2))) if m else (dsgn, None)
+        if number is not None and runs and runs[-1][0] == prefix and runs[-1][2] == number - 1:
+            runs[-1][2] = number
+            runs[-1][4] = dsgn
+        else:
+            runs.append([prefix, number, number, dsgn, dsgn])
+
+    ranges = []
+    for (_, first, last, first_dsgn, last_dsgn) in runs:
+        if first == last:
+            ranges.append(first_dsgn)
+        elif last == first + 1:
+            ranges.append(f"{first_dsgn}, {last_dsgn}")
+        else:
+            ranges.append(f"{first_dsgn}..{last_dsgn}")
+    return ", ".join(ranges)
+
+def __group_comment_mismatch(items: list[tuple[str, str, str, str]]) -> list[tuple[str, str, str, str]]:
+    """Parts with the same BOM comment, PnP comment and footprint merged into one item: (designators ranges, ...)"""
+    groups: dict[tuple[str, str, str], list[str]] = {}
+    for (designator, bom_cmnt, pnp_cmnt, pnp_footprint) in items:
+        groups.setdefault((bom_cmnt, pnp_cmnt, pnp_footprint), []).append(designator)
+    return [(__designators_ranges(designators), *key) for (key, designators) in groups.items()]
+
 def __format_distance(dsgn1: str, dsgn1_w: int, dsgn2: str, dsgn2_w: int, distance: float) -> str:
     ### output:
     # https://docs.python.org/3.9/library/string.html?=#format-specification-mini-language
@@ -98,82 +153,171 @@ def __format_distance(dsgn1: str, dsgn1_w: int, dsgn2: str, dsgn2_w: int, distan
 
 # -----------------------------------------------------------------------------
 
-def prepare_html_report(bom_name: str, pnp_names: tuple[str, str], min_distance: float, ccresult: cross_check.CrossCheckResult) -> str:
+# number of items of every section, shown in the summary-only report
+SUMMARY_MAX_ITEMS = 50
+
+class TextSink(Protocol):
+    """File, StringIO, socket wrapper: anything with `write(str)`"""
+    def write(self, text: str) -> Any: ...
+
+def __write_section(sink: TextSink, header: str, lines: Iterator[str], count: int, summary_only: bool,
+                    nlines: Optional[int] = None):
+    """
+    Writes the section header and the lines, one by one; summary_only: up to SUMMARY_MAX_ITEMS lines.
+    nlines: when the lines are not one per item, eg. grouped
+    """
+    if nlines is None:
+        nlines = count
+    sink.write(__html_header(f'{header}: {count}'))
+    sink.write(__html_section_begin())
+    if summary_only:
+        lines = itertools.islice(lines, SUMMARY_MAX_ITEMS)
+    for line in lines:
+        sink.write(line)
+    if summary_only and nlines > SUMMARY_MAX_ITEMS:
+        sink.write(__html_span_gray(f'... {nlines - SUMMARY_MAX_ITEMS} more in the report file') + PRE_EOL)
+    sink.write(__html_section_end())
+
+def write_html_report_header(sink: TextSink, bom_name: str, pnp_names: tuple[str, str]):
+    """Writes the report title, the file names and the "Generated" time"""
     # html/body tags not necessary, moreover disadviced when used with the `klembord`
-    output = __html_title(f'Cross-check report for: <em>{bom_name}</em>')
+    sink.write(__html_title(f'Cross-check report for: <em>{bom_name}</em>'))
 
     if pnp_names[1] == "":
-        output += __html_p(f"PnP: <em><b>{pnp_names[0]}</b></em>")
+        sink.write(__html_p(f"PnP: <em><b>{pnp_names[0]}</b></em>"))
     else:
-        output += __html_p(f"PnP 1: <em><b>{pnp_names[0]}</b></em>")
-        output += __html_p(f"PnP 2: <em><b>{pnp_names[1]}</b></em>")
+        sink.write(__html_p(f"PnP 1: <em><b>{pnp_names[0]}</b></em>"))
+        sink.write(__html_p(f"PnP 2: <em><b>{pnp_names[1]}</b></em>"))
 
     # https://docs.python.org/3/library/datetime.html#strftime-and-strptime-format-codes
-    output += __html_p(f"Generated: <b>{time.strftime('%Y-%m-%d, %H:%M:%S')}</b>")
+    sink.write(__html_p(f"Generated: <b>{time.strftime('%Y-%m-%d, %H:%M:%S')}</b>"))
 
+def write_html_report_sections(sink: TextSink, min_distance: float, ccresult: cross_check.CrossCheckResult,
+                               summary_only: bool = False):
+    """Writes the cross-check result sections; they depend only on the result"""
     ### 1st section:
-    section = __html_header(f'BOM parts missing in the PnP: {len(ccresult.bom_parst_missing_in_pnp)}')
-    section += __html_section_begin()
-    # determine columns width
-    dsgn1_w = 0
-    for item in ccresult.bom_parst_missing_in_pnp:
-        dsgn1_w = max(len(item[0]), dsgn1_w)
-    # format the output
-    for item in ccresult.bom_parst_missing_in_pnp:
-        section += '{desgn:{w}}: {cmnt}{eol}'.format(
-            desgn=item[0], w=dsgn1_w, cmnt=item[1], eol=PRE_EOL
-        )
-    section += __html_section_end()
-    output += section
+    items = ccresult.bom_parst_missing_in_pnp
+    dsgn1_w = max((len(item[0]) for item in items), default=0)
+    __write_section(sink, 'BOM parts missing in the PnP',
+                    (f'{item[0]:{dsgn1_w}}: {item[1]}{PRE_EOL}' for item in items),
+                    len(items), summary_only)
 
     ### 2nd section:
-    section = __html_header(f'PnP parts missing in the BOM: {len(ccresult.pnp_parst_missing_in_bom)}')
-    section += __html_section_begin()
-    # determine columns width
-    dsgn1_w = 0
-    for pnp_part in ccresult.pnp_parst_missing_in_bom:
-        dsgn1_w = max(len(pnp_part[0]), dsgn1_w)
-    # format the output
-    for pnp_part in ccresult.pnp_parst_missing_in_bom:
-        section += '{desgn:{w}}: {cmnt}{eol}'.format(
-            desgn=pnp_part[0], w=dsgn1_w, cmnt=pnp_part[1], eol=PRE_EOL
-        )
-    section += __html_section_end()
-    output += section
-
-    ### 3rd section:
-    section = __html_header(f'BOM and PnP comment mismatch: {len(ccresult.parts_comment_mismatch)}')
-    section += __html_section_begin()
-    # determine columns width
-    dsgn1_w = 0
-    bom_w = 0
-    for item in ccresult.parts_comment_mismatch:
-        dsgn1_w = max(len(item[0]), dsgn1_w)
-        bom_w = max(len(item[1]) + 2, bom_w)
-    # format the output
-    for item in ccresult.parts_comment_mismatch:
-        section += __format_comment_diff(item[0], dsgn1_w,
-                                    item[1], bom_w,
-                                    item[2],
-                                    item[3])
-    section += __html_section_end()
-    output += section
+    items = ccresult.pnp_parst_missing_in_bom
+    dsgn1_w = max((len(item[0]) for item in items), default=0)
+    __write_section(sink, 'PnP parts missing in the BOM',
+                    (f'{item[0]:{dsgn1_w}}: {item[1]}{PRE_EOL}' for item in items),
+                    len(items), summary_only)
+
+    ### 3rd section: the same difference of many parts shown once
+    items = ccresult.parts_comment_mismatch
+    groups = __group_comment_mismatch(items)
+    dsgn1_w = min(max((len(group[0]) for group in groups), default=0), DESIGNATOR_MAX_W)
+    bom_w = max((len(item[1]) + 2 for item in items), default=0)
+    __write_section(sink, 'BOM and PnP comment mismatch',
+                    (__format_comment_diff(group[0], dsgn1_w, group[1], bom_w, group[2], group[3]) for group in groups),
+                    len(items), summary_only, len(groups))
 
     ### 4th section:
-    section = __html_header(f'PnP overlapping components (distance between centers < {min_distance}mm): {len(ccresult.parts_coord_conflicts)}')
-    section += __html_section_begin()
-    # determine columns width
-    dsgn1_w = 0
-    dsgn2_w = 0
-    for item in ccresult.parts_coord_conflicts:
-        dsgn1_w = max(len(item[0]), dsgn1_w)
-        dsgn2_w = max(len(item[1]), dsgn2_w)
-    # format the output
-    for item in ccresult.parts_coord_conflicts:
-        section += __format_distance(item[0], dsgn1_w, item[1], dsgn2_w, item[2])
-
-    section += __html_section_end()
-    output += section
-
-    # html block is ready
-    return output
+    items = ccresult.parts_coord_conflicts
+    dsgn1_w = max((len(item[0]) for item in items), default=0)
+    dsgn2_w = max((len(item[1]) for item in items), default=0)
+    __write_section(sink, f'PnP overlapping components (distance between centers < {min_distance}mm)',
+                    (__format_distance(item[0], dsgn1_w, item[1], dsgn2_w, item[2]) for item in items),
+                    len(items), summary_only)
+
+def write_html_report_perf(sink: TextSink, perf_stats: Optional[perf.PerfStats]):
+    """Writes the collapsed "Performance" section"""
+    if perf_stats:
+        sink.write(__html_details_begin("Performance"))
+        sink.write(__html_section_begin())
+        sink.write(perf_stats.format_table().replace("\n", PRE_EOL) + PRE_EOL)
+        sink.write(__html_section_end())
+        sink.write(__html_details_end())
+
+@perf.timed("report.html")
+def write_html_report(sink: TextSink, bom_name: str, pnp_names: tuple[str, str], min_distance: float,
+                      ccresult: cross_check.CrossCheckResult, perf_stats: Optional[perf.PerfStats] = None,
+                      summary_only: bool = False):
+    """
+    Writes the report to the `sink` section by section, line by line, without building it in memory.
+    perf_stats: shown in the collapsed "Performance" section, at the end of the report;
+    summary_only: every section shows the number of items, but only the first SUMMARY_MAX_ITEMS of them
+    """
+    write_html_report_header(sink, bom_name, pnp_names)
+    write_html_report_sections(sink, min_distance, ccresult, summary_only)
+    write_html_report_perf(sink, perf_stats)
+
+def prepare_html_report(bom_name: str, pnp_names: tuple[str, str], min_distance: float, ccresult: cross_check.CrossCheckResult,
+                        perf_stats: Optional[perf.PerfStats] = None, summary_only: bool = False) -> str:
+    """Returns the html block written by the `write_html_report()`"""
+    output = io.StringIO()
+    write_html_report(output, bom_name, pnp_names, min_distance, ccresult, perf_stats, summary_only)
+    return output.getvalue()
+
+@perf.timed("report.json")
+def prepare_json_report(bom_name: str, pnp_names: tuple[str, str], min_distance: float, ccresult: cross_check.CrossCheckResult,
+                        perf_stats: Optional[perf.PerfStats] = None) -> str:
+    """Machine-readable counterpart of the `prepare_html_report()`"""
+    report = {
+        "bom": bom_name,
+        "pnp": [name for name in pnp_names if name != ""],
+        "generated": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "min_distance": min_distance,
+        "bom_parts_missing_in_pnp": [
+            {"designator": item[0], "comment": item[1]}
+            for item in ccresult.bom_parst_missing_in_pnp
+        ],
+        "pnp_parts_missing_in_bom": [
+            {"designator": item[0], "comment": item[1]}
+            for item in ccresult.pnp_parst_missing_in_bom
+        ],
+        "parts_comment_mismatch": [
+            {"designator": item[0], "bom_comment": item[1], "pnp_comment": item[2], "pnp_footprint": item[3]}
+            for item in ccresult.parts_comment_mismatch
+        ],
+        "parts_coord_conflicts": [
+            {"designator1": item[0], "designator2": item[1], "distance": round(item[2], 3)}
+            for item in ccresult.parts_coord_conflicts
+        ],
+    }
+    if perf_stats:
+        report["performance"] = perf_stats.to_dict()
+    return json.dumps(report, indent=2, ensure_ascii=False)
+
+def get_report_path(bom_path: str, ext: str) -> str:
+    """Report is saved next to the BOM file: <bom_name>_report<ext>"""
+    report_dir = os.path.dirname(bom_path)
+    report_fname = os.path.splitext(os.path.basename(bom_path))[0]
+    report_fname += "_report" + ext
+    return os.path.join(report_dir, report_fname)
+
+@perf.timed("report.save")
+def save_html_report(path: str, report_html: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<html>\n<body>\n')
+        f.write(report_html)
+        f.write('</body>\n</html>\n')
+
+@perf.timed("report.save")
+def write_html_report_file(path: str, bom_name: str, pnp_names: tuple[str, str], min_distance: float,
+                           ccresult: cross_check.CrossCheckResult, perf_stats: Optional[perf.PerfStats] = None):
+    """The full report streamed to the file, like the `save_html_report()` saves it"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<html>\n<body>\n')
+        write_html_report(f, bom_name, pnp_names, min_distance, ccresult, perf_stats)
+        f.write('</body>\n</html>\n')
+
+def read_html_report_file(path: str) -> str:
+    """Returns the report saved by the `save_html_report()` or `write_html_report_file()`, without the html/body tags"""
+    with open(path, 'r', encoding='utf-8') as f:
+        report_html = f.read()
+    report_html = report_html.removeprefix('<html>\n<body>\n')
+    return report_html.removesuffix('</body>\n</html>\n')
+
+def html_report_text(report_html: str) -> str:
+    """Plain text of the report: tags removed, paragraphs in separate lines, entities decoded"""
+    report_text = report_html.replace('</p>', EOL)
+    # the "<-->" and "< 3.0mm" are not the tags
+    report_text = re.sub(r"</?[a-zA-Z][^>]*>", "", report_text)
+    return html.unescape(report_text)
@@ -1,4 +1,11 @@
 
+import itertools
+import operator
+from array import array
+from typing import Iterator, Optional, Union
+
+# -----------------------------------------------------------------------------
+
 class TextGrid:
     """
     Represents data read from the XLS/XLSX/ODS/CSV
@@ -8,7 +15,11 @@ class TextGrid:
         self.nrows = 0
         self.ncols = 0
         # self.firstrow = 0
+        # source file dialect, set by the CSV reader
+        self.dialect = None
         self.__rows: list[list[str]] = []
+        # ((first_row, rows count, columns count), columns width)
+        self.__columns_width: tuple = (None, [])
 
     @staticmethod
     def format_cell(cell) -> str:
@@ -24,15 +35,22 @@ class TextGrid:
 
     def get_columns_width(self, first_row: int) -> list[int]:
         """
-        Returns a list of each column width, in chars
+        Returns a list of each column width, in chars;
+        cached until the number of rows or columns changes
+        """
+        key = (first_row, len(self.rows_raw()), self.ncols)
+        if self.__columns_width[0] != key:
+            self.__columns_width = (key, self.compute_columns_width(first_row))
+        return list(self.__columns_width[1])
+
+    def compute_columns_width(self, first_row: int) -> list[int]:
+        """
+        Returns a list of each column width, in chars, computed column by column
         """
         col_max_w = [0 for _ in range(self.ncols+1)]
-        for r, row in enumerate(self.__rows):
-            if r >= first_row:
-                for c, cell in enumerate(row):
-                    cell = self.format_cell(cell)
-                    cell_w = len(cell)
-                    col_max_w[c] = max(col_max_w[c], cell_w)
+        columns = itertools.zip_longest(*self.rows_raw()[first_row:], fillvalue="")
+        for c, column in enumerate(columns):
+            col_max_w[c] = max(map(len, map(self.format_cell, column)))
         return col_max_w
 
     def format_grid(self, first_row: int, last_row: int = -1) -> str:
@@ -40,19 +58,23 @@ class TextGrid:
         Create spreadsheet-like grid from the content
         """
         columns_width = self.get_columns_width(first_row)
-        grid_formatted = ""
-        last_row = len(self.__rows) if last_row == -1 else last_row
-        for r, row in enumerate(self.__rows):
-            if r >= first_row and r <= last_row:
-                row_formatted = "{:0>3} | ".format(r+1)
-                for c, cell in enumerate(row):
-                    cell = self.format_cell(cell)
-                    to_fill = max(columns_width[c] - len(cell), 0)
-                    fill = " " * to_fill
-                    cell += f"{fill} | "
-                    row_formatted += cell
-                grid_formatted += row_formatted + "\n"
-        return grid_formatted
+        last_row = len(self.rows_raw()) if last_row == -1 else last_row
+        lines = self.format_rows(first_row, last_row + 1, columns_width)
+        return "".join(line + "\n" for line in lines)
+
+    def format_rows(self, first_row: int, last_row: int, columns_width: list[int]) -> list[str]:
+        """
+        Returns the rows [first_row, last_row) formatted like in the `format_grid()`, without the new line
+        """
+        format_cell = self.format_cell
+        lines = []
+        for r, row in enumerate(self.rows_raw()[first_row:last_row], first_row):
+            if row:
+                cells = " | ".join(map(str.ljust, map(format_cell, row), columns_width))
+                lines.append(f"{r+1:0>3} | {cells} | ")
+            else:
+                lines.append(f"{r+1:0>3} | ")
+        return lines
 
     def align_number_of_columns(self):
         """
@@ -62,6 +84,42 @@ class TextGrid:
             cols_to_add = self.ncols - len(row)
             row.extend(("" for _ in range(cols_to_add)))
 
+    def append_column(self, text: str):
+        """
+        Adds a column with the same text in every row, eg. a PnP layer name
+        """
+        for row in self.__rows:
+            row.append(text)
+        self.ncols += 1
+
+    def extend(self, other: "TextGrid"):
+        """
+        Appends all rows of the other grid
+        """
+        self.__rows.extend(other.rows_raw())
+        self.nrows += other.nrows
+
+    def project_rows(self, columns: tuple[Optional[int], ...], first_row: int, last_row: int) -> Iterator[tuple[str, ...]]:
+        """
+        Yields tuples of the cells of given `columns` for rows [first_row, last_row);
+        cell of column None is ""
+        """
+        rows = self.__rows[first_row:last_row]
+        used = [col for col in columns if col is not None]
+        getter = operator.itemgetter(*used)
+        if len(used) == 1:
+            getter = lambda row, col=used[0]: (row[col],)
+
+        if len(used) == len(columns):
+            return map(getter, rows)
+
+        # put the "" (last item) in place of unused columns
+        reorder = []
+        for col in columns:
+            reorder.append(len(used) if col is None else len(reorder) - reorder.count(len(used)))
+        reorder = operator.itemgetter(*reorder)
+        return (reorder(getter(row) + ("",)) for row in rows)
+
     # def rows(self) -> list[list[str]]:
         """Returns the rows subset, skipping X first rows"""
         # return self.__rows[self.firstrow:]
@@ -70,6 +128,255 @@ class TextGrid:
         """Returns full rows: for editing, appending"""
         return self.__rows
 
+class StringTable:
+    """
+    Stores every distinct text once; the text is referenced by an index.
+    Index 0 is always an empty string.
+    """
+
+    def __init__(self):
+        self.__index: dict[str, int] = {"": 0}
+        self.__strings: list[str] = [""]
+        # packed form: all strings concatenated, string i is blob[offsets[i]:offsets[i+1]]
+        self.__blob = ""
+        self.__offsets = array('I')
+
+    def __len__(self) -> int:
+        return len(self.__offsets) - 1 if self.__offsets else len(self.__strings)
+
+    def __getitem__(self, idx: int) -> str:
+        if self.__offsets:
+            return self.__blob[self.__offsets[idx]:self.__offsets[idx+1]]
+        return self.__strings[idx]
+
+    def intern(self, text: str) -> int:
+        """Returns index of the text, adding it to the table if needed"""
+        if self.__offsets:
+            self.unpack()
+        idx = self.__index.get(text)
+        if idx is None:
+            idx = len(self.__strings)
+            self.__index[text] = idx
+            self.__strings.append(text)
+        return idx
+
+    def pack(self):
+        """Replaces the separate strings and the lookup dictionary with a single text block"""
+        if self.__offsets:
+            return
+        offsets = array('I', [0])
+        pos = 0
+        for text in self.__strings:
+            pos += len(text)
+            offsets.append(pos)
+        self.__blob = "".join(self.__strings)
+        self.__offsets = offsets
+        self.__index = {}
+        self.__strings = []
+
+    def unpack(self):
+        """Restores the lookup dictionary, so new strings can be added"""
+        if not self.__offsets:
+            return
+        self.__strings = [self[idx] for idx in range(len(self))]
+        self.__index = {text: idx for idx, text in enumerate(self.__strings)}
+        self.__blob = ""
+        self.__offsets = array('I')
+
+class ColumnarRows:
+    """
+    The `TextGrid.rows_raw()` compatible view of the `ColumnarTextGrid`:
+    rows are created on access, so modifying the returned row does not change the grid
+    """
+
+    def __init__(self, grid: "ColumnarTextGrid", strings: StringTable, columns: list[array]):
+        self.__grid = grid
+        self.__strings = strings
+        self.__columns = columns
+        self.__nrows = 0
+
+    def __len__(self) -> int:
+        return self.__nrows
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[r] for r in range(*idx.indices(self.__nrows))]
+        if idx < 0:
+            idx += self.__nrows
+        if not 0 <= idx < self.__nrows:
+            raise IndexError("row index out of range")
+
+        strings = self.__strings
+        # cells missing at the end of the column are empty
+        row = [strings[col[idx]] if idx < len(col) else "" for col in self.__columns]
+        row.extend("" for _ in range(self.__grid.ncols - len(row)))
+        return row
+
+    def __iter__(self):
+        for r in range(self.__nrows):
+            yield self[r]
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def append(self, row_cells: list[str]):
+        row_cells = [TextGrid.format_cell(cell) for cell in row_cells]
+        # trailing empty cells are not stored
+        ncells = len(row_cells)
+        while ncells > 0 and row_cells[ncells-1] == "":
+            ncells -= 1
+
+        for c in range(ncells):
+            if c == len(self.__columns):
+                self.__columns.append(array('I'))
+            col = self.__columns[c]
+            if len(col) < self.__nrows:
+                col.extend(0 for _ in range(self.__nrows - len(col)))
+            col.append(self.__strings.intern(row_cells[c]))
+        self.__nrows += 1
+
+    def extend(self, rows):
+        for row_cells in rows:
+            self.append(row_cells)
+
+    def clear(self):
+        self.__columns.clear()
+        self.__nrows = 0
+
+class ColumnarTextGrid(TextGrid):
+    """
+    Memory-efficient TextGrid: every column is an array of indexes into a table of distinct texts.
+    Non-string cells are stored as their `format_cell()` text.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__strings = StringTable()
+        self.__columns: list[array] = []
+        self.__rows = ColumnarRows(self, self.__strings, self.__columns)
+
+    def align_number_of_columns(self):
+        """
+        Missing cells are empty by design, so only the string table is packed
+        """
+        self.__strings.pack()
+
+    def append_column(self, text: str):
+        """
+        Adds a column with the same text in every row, eg. a PnP layer name
+        """
+        col = array('I', [self.__strings.intern(text)]) * len(self.__rows)
+        self.__columns.extend(array('I') for _ in range(self.ncols - len(self.__columns)))
+        self.__columns.append(col)
+        self.ncols += 1
+        self.__strings.pack()
+
+    def extend(self, other: TextGrid):
+        """
+        Appends all rows of the other grid
+        """
+        self.__rows.extend(other.rows_raw())
+        self.nrows += other.nrows
+        self.__strings.pack()
+
+    def compute_columns_width(self, first_row: int) -> list[int]:
+        """
+        Returns a list of each column width, in chars: only the distinct texts of every column are measured
+        """
+        col_max_w = [0 for _ in range(max(self.ncols+1, len(self.__columns)))]
+        strings = self.__strings
+        for c, col in enumerate(self.__columns):
+            col_max_w[c] = max((len(strings[idx]) for idx in set(col[first_row:])), default=0)
+        return col_max_w
+
+    def format_rows(self, first_row: int, last_row: int, columns_width: list[int]) -> list[str]:
+        """
+        Returns the rows [first_row, last_row) formatted like in the `format_grid()`, without the new line;
+        built column by column, every distinct text is padded once
+        """
+        nrows = len(self.__rows)
+        first_row, last_row, _ = slice(first_row, last_row).indices(nrows)
+        last_row = max(first_row, last_row)
+        ncells = max(len(self.__columns), self.ncols)
+        if ncells == 0:
+            return [f"{r+1:0>3} | " for r in range(first_row, last_row)]
+
+        strings = self.__strings
+        columns = []
+        for c in range(ncells):
+            col = self.__columns[c][first_row:last_row] if c < len(self.__columns) else array('I')
+            padded = {idx: strings[idx].ljust(columns_width[c]) for idx in set(col)}
+            cells = list(map(padded.__getitem__, col))
+            # cells missing at the end of the column are empty
+            cells.extend(itertools.repeat("".ljust(columns_width[c]), last_row - first_row - len(cells)))
+            columns.append(cells)
+
+        return [f"{r:0>3} | {' | '.join(row)} | " for r, row in zip(range(first_row+1, last_row+1), zip(*columns))]
+
+    def column_cells(self, col: int, first_row: int, last_row: int) -> list[str]:
+        """
+        Returns cells of the column `col` for rows [first_row, last_row)
+        """
+        nrows = len(self.__rows)
+        first_row, last_row, _ = slice(first_row, last_row).indices(nrows)
+        last_row = max(first_row, last_row)
+        if col < 0:
+            col += max(len(self.__columns), self.ncols)
+        if col < len(self.__columns):
+            cells = list(map(self.__strings.__getitem__, self.__columns[col][first_row:last_row]))
+        else:
+            cells = []
+        # cells missing at the end of the column are empty
+        cells.extend("" for _ in range(last_row - first_row - len(cells)))
+        return cells
+
+    def project_rows(self, columns: tuple[Optional[int], ...], first_row: int, last_row: int) -> Iterator[tuple[str, ...]]:
+        """
+        Yields tuples of the cells of given `columns` for rows [first_row, last_row);
+        cell of column None is ""
+        """
+        nrows = max(0, min(last_row, len(self.__rows)) - first_row)
+        return zip(*(
+            itertools.repeat("", nrows) if col is None else self.column_cells(col, first_row, last_row)
+            for col in columns
+        ))
+
+    def rows_raw(self) -> ColumnarRows:
+        """Returns the rows view: for reading and appending"""
+        return self.__rows
+
+class RowWindow:
+    """
+    Rows of the grid to be read by the readers: [first, last] (0-based; last=-1: to the end of file),
+    at most `max_rows` of them (-1: no limit); the reading stops after the window.
+    Rows before the `first` are not converted: only their first cells, needed to tell if the row is valid,
+    are stored - so the grid rows are numbered the same way as without the window
+    """
+
+    # cells of the rows before the window being converted
+    SKIPPED_ROW_CELLS = 4
+
+    def __init__(self, first: int = 0, last: int = -1, max_rows: int = -1):
+        self.first = max(first, 0)
+        self.last = last
+        self.max_rows = max_rows
+
+    def __repr__(self) -> str:
+        return f"RowWindow(first={self.first}, last={self.last}, max_rows={self.max_rows})"
+
+    def end(self) -> Optional[int]:
+        """Number of the grid rows, after which the reading stops; None - entire file"""
+        ends = []
+        if self.last >= 0:
+            ends.append(self.last + 1)
+        if self.max_rows > 0:
+            ends.append(self.first + self.max_rows)
+        return min(ends, default=None)
+
+    def key(self) -> tuple:
+        """For the cache keys"""
+        return (self.first, self.last, self.max_rows)
+
 class ConfiguredTextGrid:
     """
     Determines data range to be imported
@@ -87,3 +394,67 @@ class ConfiguredTextGrid:
         self.coord_y_col = ""
         self.layer_col = ""
         self.footprint_col = ""
+        # (text_grid, first_row, {header : column index})
+        self.__header_cache = (None, -1, {})
+
+    def header_index(self) -> dict[str, int]:
+        """
+        Returns the {column header : column index} map of the `first_row`;
+        for repeated header, the first column is used
+        """
+        cached_grid, cached_row, index = self.__header_cache
+        if cached_grid is not self.text_grid or cached_row != self.first_row:
+            index = {}
+            if self.first_row < len(self.text_grid.rows_raw()):
+                for c, header in enumerate(self.text_grid.rows_raw()[self.first_row][:self.text_grid.ncols]):
+                    index.setdefault(header, c)
+            self.__header_cache = (self.text_grid, self.first_row, index)
+        return index
+
+    def column_index(self, column: Union[str, int]) -> int:
+        """
+        Returns index of the column given by the header (or by index, if there are no headers);
+        -1 if not found
+        """
+        if self.has_column_headers:
+            return self.header_index().get(column, -1)
+        return column
+
+    def resolve_columns(self, placement: bool) -> tuple[int, int, Optional[int], Optional[int], Optional[int], Optional[int]]:
+        """
+        Returns indexes of the (Designator, Comment, Coord-X, Coord-Y, Layer, Footprint) columns.
+        None - column not used; Layer -1 - the last column (layer added when two PnP files merged).
+        placement=False: only the Designator and Comment columns are used (BOM)
+        """
+        designator_idx = self.column_index(self.designator_col)
+        comment_idx = self.column_index(self.comment_col)
+        if not placement:
+            return (designator_idx, comment_idx, None, None, None, None)
+
+        coord_x_idx = self.column_index(self.coord_x_col)
+        coord_y_idx = self.column_index(self.coord_y_col)
+        if coord_x_idx < 0 or coord_y_idx < 0:
+            coord_x_idx = coord_y_idx = None
+        # without headers: the layer is always the last column
+        layer_idx = self.column_index(self.layer_col) if self.has_column_headers else -1
+        footprint_idx = None
+        if self.footprint_col: # optional
+            footprint_idx = self.column_index(self.footprint_col)
+            if footprint_idx < 0:
+                footprint_idx = None
+        return (designator_idx, comment_idx, coord_x_idx, coord_y_idx, layer_idx, footprint_idx)
+
+    def data_rows_range(self) -> tuple[int, int]:
+        """
+        Returns the [first, last) range of rows with the data, excluding the header row
+        """
+        first_row = self.first_row + (1 if self.has_column_headers else 0)
+        last_row = self.text_grid.nrows if self.last_row == -1 else self.last_row
+        return (first_row, last_row)
+
+    def project_rows(self, columns: tuple[Optional[int], ...]) -> Iterator[tuple[str, ...]]:
+        """
+        Yields tuples of the cells of given `columns` for every data row; cell of column None is ""
+        """
+        first_row, last_row = self.data_rows_range()
+        return self.text_grid.project_rows(columns, first_row, max(first_row, last_row))
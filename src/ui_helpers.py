@@ -1,31 +1,225 @@
 import customtkinter
+import re
+import sys
 import tkinter
 from tkhtmlview import HTMLScrolledText
+from typing import Optional
 import logger
+from grid_preview import GridPreview
 
 # -----------------------------------------------------------------------------
 
-def textbox_find_text(textbox: customtkinter.CTkTextbox, needle: str) -> int:
-    """Search and highlight the text in the TextBox"""
+def textbox_find_text(textbox: tkinter.Text, needle: str) -> int:
+    """Search and highlight the text in the Text widget, using a single search for all occurrences"""
 
-    textbox.tag_delete("search")
     textbox.tag_config("search", background="yellow")
-    start = 1.0
-    pos = textbox.search(pattern=needle, index=start, stopindex=tkinter.END, nocase=True)
-    found_cnt = 0
-    length = len(needle)
-
-    if length > 0:
-        while pos:
-            found_cnt += 1
-            row, col = pos.split('.')
-            end = int(col) + length
-            end = f'{row}.{str(end)}'
-            textbox.tag_add("search", pos, end)
-            start = end
-            pos = textbox.search(pattern=needle, index=start, stopindex=tkinter.END, nocase=True)
-
-    return found_cnt
+    textbox.tag_remove("search", "1.0", tkinter.END)
+    if not needle:
+        return 0
+
+    found = textbox.tk.splitlist(
+        textbox.tk.call(str(textbox), "search", "-all", "-nocase", "--", needle, "1.0", tkinter.END))
+    if found:
+        ranges = []
+        for pos in found:
+            ranges.extend((pos, f"{pos}+{len(needle)}c"))
+        textbox.tag_add("search", *ranges)
+    return len(found)
+
+class GridPreviewBox(customtkinter.CTkFrame):
+    """
+    Shows the GridPreview: only the visible lines, and a few more, are inserted
+    into the text box; the vertical scrollbar represents the whole preview.
+    The search bar below uses the preview search index; only the rendered hits are tagged.
+    """
+
+    ALL_COLUMNS = "All columns"
+
+    # lines rendered below the visible ones
+    BUFFER_LINES = 5
+    # lines scrolled with the mouse wheel
+    WHEEL_LINES = 3
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.textbox = customtkinter.CTkTextbox(self,
+                                                font=customtkinter.CTkFont(size=12, family="Consolas"),
+                                                activate_scrollbars=False,
+                                                wrap='none')
+        self.textbox.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar_y = customtkinter.CTkScrollbar(self, orientation="vertical", command=self.yview)
+        self.scrollbar_y.grid(row=0, column=1, sticky="ns")
+        self.scrollbar_x = customtkinter.CTkScrollbar(self, orientation="horizontal", command=self.textbox.xview)
+        self.scrollbar_x.grid(row=1, column=0, sticky="ew")
+        self.textbox.configure(xscrollcommand=self.scrollbar_x.set, state=tkinter.DISABLED)
+        self.textbox.tag_config("search", background="yellow")
+        self.textbox.tag_config("search_current", background="orange")
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.search_bar = customtkinter.CTkFrame(self, fg_color="transparent")
+        self.search_bar.grid(row=2, column=0, columnspan=2, pady=(5, 0), sticky="we")
+        self.search_bar.grid_columnconfigure(0, weight=1)
+
+        self.entry_search = customtkinter.CTkEntry(self.search_bar, placeholder_text="search... or #row")
+        self.entry_search.grid(row=0, column=0, padx=5, sticky="we")
+        self.entry_search.bind("<Return>", lambda ev: self.find_event(1))
+        self.entry_search.bind("<Shift-Return>", lambda ev: self.find_event(-1))
+
+        self.btn_prev = customtkinter.CTkButton(self.search_bar, text="<", width=30, command=lambda: self.find_event(-1))
+        self.btn_prev.grid(row=0, column=1, padx=(5, 0))
+        self.btn_next = customtkinter.CTkButton(self.search_bar, text="Find", width=80, command=lambda: self.find_event(1))
+        self.btn_next.grid(row=0, column=2, padx=5)
+
+        self.opt_column = customtkinter.CTkOptionMenu(self.search_bar, values=[self.ALL_COLUMNS],
+                                                      command=lambda _: self.find_event(0))
+        self.opt_column.grid(row=0, column=3, padx=5)
+        self.chk_match_case = customtkinter.CTkCheckBox(self.search_bar, text="Aa", width=50,
+                                                        command=lambda: self.find_event(0))
+        self.chk_match_case.grid(row=0, column=4, padx=5)
+
+        self.lbl_occurences = customtkinter.CTkLabel(self.search_bar, text="Found: 0")
+        self.lbl_occurences.grid(row=0, column=5, padx=5)
+
+        self.preview: Optional[GridPreview] = None
+        self.top_line = 0
+        # updated after every render, from the text box height
+        self.visible_lines = 50
+        self.hits: list[tuple[int, int]] = []
+        self.hit_idx = -1
+        # (needle, column, match case) of the hits
+        self.hits_query: tuple = ("", None, False)
+
+        self.textbox.bind("<Configure>", self.render)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.textbox.bind(sequence, self.mousewheel_event)
+        self.textbox.bind("<Prior>", lambda ev: self.yview("scroll", -1, "pages") or "break")
+        self.textbox.bind("<Next>", lambda ev: self.yview("scroll", 1, "pages") or "break")
+        self.textbox.bind("<Control-Home>", lambda ev: self.scroll_to(0) or "break")
+        self.textbox.bind("<Control-End>", lambda ev: self.scroll_to(self.__total_lines()) or "break")
+
+    def set_preview(self, preview: Optional[GridPreview]):
+        self.preview = preview
+        self.top_line = 0
+        self.hits = []
+        self.hit_idx = -1
+        self.hits_query = ("", None, False)
+        columns = [] if preview is None else preview.column_names()
+        self.opt_column.configure(values=[self.ALL_COLUMNS] + [f"{c+1}: {name}" for c, name in enumerate(columns)])
+        self.opt_column.set(self.ALL_COLUMNS)
+        self.lbl_occurences.configure(text="Found: 0")
+        self.render()
+
+    def clear(self):
+        self.set_preview(None)
+
+    def render(self, *_args):
+        """Formats and shows the lines starting from the `top_line`"""
+        self.textbox.configure(state=tkinter.NORMAL)
+        self.textbox.delete("0.0", tkinter.END)
+        if self.preview is not None:
+            nlines = self.visible_lines + self.BUFFER_LINES
+            self.textbox.insert("0.0", "\n".join(self.preview.lines(self.top_line, nlines)))
+            self.__tag_hits(nlines)
+        self.textbox.configure(state=tkinter.DISABLED)
+        self.textbox.yview_moveto(0)
+
+        total = self.__total_lines()
+        if total:
+            self.scrollbar_y.set(self.top_line / total, min(1.0, (self.top_line + self.visible_lines) / total))
+        else:
+            self.scrollbar_y.set(0.0, 1.0)
+
+        line_info = self.textbox.dlineinfo("1.0")
+        if line_info and line_info[3] > 0:
+            self.visible_lines = max(1, self.textbox.winfo_height() // line_info[3])
+
+    def scroll_to(self, line: int):
+        line = self.__clamp_top_line(line)
+        if line != self.top_line:
+            self.top_line = line
+            self.render()
+
+    def yview(self, *args):
+        """Vertical scrollbar command: ("moveto", fraction) or ("scroll", n, "units"/"pages")"""
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * self.__total_lines()))
+        elif args[0] == "scroll":
+            n = int(args[1])
+            if args[2] == "pages":
+                n *= max(self.visible_lines - 1, 1)
+            self.scroll_to(self.top_line + n)
+
+    def mousewheel_event(self, event):
+        if sys.platform.startswith("win"):
+            delta = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -1 if event.num == 4 else 1
+        self.scroll_to(self.top_line + delta * self.WHEEL_LINES)
+        return "break"
+
+    def goto_line(self, line: int, col: int = 0):
+        """Scrolls the preview, so the line is in the middle of the view"""
+        self.top_line = self.__clamp_top_line(line - self.visible_lines // 2)
+        self.render()
+        self.textbox.see(f"{line - self.top_line + 1}.{col}")
+
+    def goto_row(self, row_number: int):
+        """Scrolls to the grid row of given number, as displayed"""
+        if self.preview is not None:
+            self.goto_line(self.preview.line_of_row(row_number))
+
+    def find(self, needle: str, column: Optional[int] = None, match_case: bool = False, step: int = 1) -> int:
+        """
+        Highlights the occurrences of the text and shows the next (step=1) or previous (step=-1) one;
+        returns the number of occurrences
+        """
+        if self.preview is None:
+            return 0
+        query = (needle, column, match_case)
+        if query != self.hits_query:
+            self.hits_query = query
+            self.hits = self.preview.find(needle, column, match_case)
+            self.hit_idx = -1 if step >= 0 else 0
+        if self.hits:
+            self.hit_idx = (self.hit_idx + (step or 1)) % len(self.hits)
+            self.goto_line(*self.hits[self.hit_idx])
+        else:
+            self.render()
+        return len(self.hits)
+
+    def find_event(self, step: int):
+        """Search bar: the text, or #row to jump to; step 0 - search options changed"""
+        txt = self.entry_search.get()
+        if re.fullmatch(r"#\d+", txt.strip()):
+            self.goto_row(int(txt.strip()[1:]))
+            return
+
+        logger.info(f"Find '{txt}'")
+        column = self.opt_column.cget("values").index(self.opt_column.get()) - 1
+        column = None if column < 0 else column
+        cnt = self.find(txt, column, bool(self.chk_match_case.get()), step)
+        if cnt:
+            self.lbl_occurences.configure(text=f"Found: {self.hit_idx + 1}/{cnt}")
+        else:
+            self.lbl_occurences.configure(text="Found: 0")
+
+    def __total_lines(self) -> int:
+        return 0 if self.preview is None else len(self.preview)
+
+    def __clamp_top_line(self, line: int) -> int:
+        return min(max(line, 0), max(self.__total_lines() - self.visible_lines, 0))
+
+    def __tag_hits(self, nlines: int):
+        """Tags only the hits in the rendered lines"""
+        length = len(self.hits_query[0])
+        for (idx, line, col) in GridPreview.hits_in_lines(self.hits, self.top_line, nlines):
+            row = line - self.top_line + 1
+            tag = "search_current" if idx == self.hit_idx else "search"
+            self.textbox.tag_add(tag, f"{row}.{col}", f"{row}.{col + length}")
 
 def window_set_centered(app: tkinter.Tk, wnd: tkinter.Toplevel, wnd_w: int, wnd_h: int):
     # set window size
@@ -3,66 +3,93 @@
 #
 
 import logger
+import re
+from typing import Optional
 
 # https://linuxhint.com/read-excel-file-python/
 # https://xlrd.readthedocs.io/en/latest/
 import xlrd
 
-from text_grid import TextGrid
+from text_grid import TextGrid, ColumnarTextGrid, RowWindow
 
 # -----------------------------------------------------------------------------
 
+# text accepted by the float(): "5.10", " -1_000 ", "1e3"; except the "nan", "inf"
+NUMERIC_TEXT_RE = re.compile(r"\s*[+-]?(?:\d(?:_?\d)*(?:\.(?:\d(?:_?\d)*)?)?|\.\d(?:_?\d)*)(?:[eE][+-]?\d(?:_?\d)*)?\s*")
+
 def __check_row_valid(row_cells: list[str]) -> bool:
     # ignore rows with empty cells 'A,B,C' or cell 'A' with a long horizontal line
     row_valid = (len(row_cells) > 3) and (row_cells[0] or row_cells[1] or row_cells[2])
     row_valid = row_valid and not row_cells[0].startswith("___")
     return row_valid
 
-def read_xls_sheet(path: str) -> TextGrid:
+def __format_cell(ctype: int, cell_val, datemode: int) -> str:
+    # https://xlrd.readthedocs.io/en/latest/api.html#xlrd.sheet.Cell
+    if ctype == xlrd.XL_CELL_NUMBER:
+        if int(cell_val) == cell_val:
+            # prevent the conversion of '100' to '100.0'
+            cell_val = int(cell_val)
+        cell_val = repr(cell_val)
+    elif ctype == xlrd.XL_CELL_TEXT:
+        # '5.00' is text; checking the format first is much faster than float() exception
+        if NUMERIC_TEXT_RE.fullmatch(cell_val):
+            try:
+                cell_val_fl = float(cell_val) # may rise exc. (eg. for '1e999')
+                if int(cell_val_fl) == cell_val_fl:
+                    # '90.00' -> 90
+                    cell_val = int(cell_val_fl)
+                else:
+                    # '5.10' -> 5.1
+                    cell_val = cell_val_fl
+                cell_val = repr(cell_val)
+            except Exception:
+                pass
+    elif ctype == xlrd.XL_CELL_DATE:
+        # like the XLSX reader
+        cell_val = str(xlrd.xldate.xldate_as_datetime(cell_val, datemode))
+    elif cell_val is None:
+        cell_val = ""
+    elif not isinstance(cell_val, str):
+        # boolean, error code
+        cell_val = repr(cell_val)
+
+    # change multiline cells into single-line
+    cell_val = cell_val.replace("\n", " ⏎ ")
+    return cell_val.strip()
+
+def read_xls_sheet(path: str, columnar: bool = False, window: Optional[RowWindow] = None) -> TextGrid:
     """
-    Reads entire sheet 0
+    Reads entire sheet 0, or only the `window` rows
+    columnar=True: returns the memory-efficient ColumnarTextGrid
     """
     assert path is not None
     logger.info(f"Reading file '{path}'")
-    book = xlrd.open_workbook(filename=path)
-    sheet = book.sheet_by_index(0)
-    tg = TextGrid()
+    window = window or RowWindow()
+    end = window.end()
+    # on_demand: only the sheet 0 is loaded
+    book = xlrd.open_workbook(filename=path, on_demand=True)
+    try:
+        sheet = book.sheet_by_index(0)
+        tg = ColumnarTextGrid() if columnar else TextGrid()
 
-    # Iterate the loop to read the cell values
-    for r_idx in range(sheet.nrows):
-        row_cells = []
-        for c_idx in range(sheet.ncols):
-            cellobj = sheet.cell(r_idx, c_idx)
-            cell_val = "" if (cellobj.value is None) else cellobj.value
+        # Iterate the loop to read the cell values
+        for r_idx in range(sheet.nrows):
+            # before the window: only the first cells converted
+            end_col = RowWindow.SKIPPED_ROW_CELLS if len(tg.rows_raw()) < window.first else None
+            row_cells = [
+                __format_cell(ctype, cell_val, book.datemode)
+                for (ctype, cell_val) in zip(sheet.row_types(r_idx, 0, end_col), sheet.row_values(r_idx, 0, end_col))
+            ]
+            if __check_row_valid(row_cells):
+                tg.rows_raw().append(row_cells)
+                if len(tg.rows_raw()) == end:
+                    logger.debug(f"  Last row {end} reached")
+                    break
 
-            # https://xlrd.readthedocs.io/en/latest/api.html#xlrd.sheet.Cell
-            if cellobj.ctype in (xlrd.XL_CELL_NUMBER, xlrd.XL_CELL_TEXT):
-                if isinstance(cell_val, float) and int(cell_val) == cell_val:
-                    # prevent the conversion of '100' to '100.0'
-                    cell_val = int(cell_val)
-                    cell_val = repr(cell_val)
-                elif isinstance(cell_val, float):
-                    cell_val = repr(cell_val)
-                elif isinstance(cell_val, str):
-                    # '5.00' is text
-                    try:
-                        cell_val_fl = float(cell_val) # may rise exc.
-                        if int(cell_val_fl) == cell_val_fl:
-                            # '90.00' -> 90
-                            cell_val = int(cell_val_fl)
-                        else:
-                            # '5.10' -> 5.1
-                            cell_val = cell_val_fl
-                        cell_val = repr(cell_val)
-                    except Exception:
-                        pass
-            # change multiline cells into single-line
-            cell_val = cell_val.replace("\n", " ⏎ ")
-            row_cells.append(cell_val.strip())
-        if __check_row_valid(row_cells):
-            tg.rows_raw().append(row_cells)
+        tg.nrows = len(tg.rows_raw())
+        tg.ncols = sheet.ncols
+    finally:
+        book.release_resources()
 
-    tg.nrows = len(tg.rows_raw())
-    tg.ncols = sheet.ncols
     tg.align_number_of_columns()
     return tg
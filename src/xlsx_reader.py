@@ -4,12 +4,13 @@
 
 import logger
 import datetime
+from typing import Optional
 
 # https://linuxhint.com/read-excel-file-python/
 # https://openpyxl.readthedocs.io/en/stable/tutorial.html
 import openpyxl
 
-from text_grid import TextGrid
+from text_grid import TextGrid, ColumnarTextGrid, RowWindow
 
 # -----------------------------------------------------------------------------
 
@@ -19,39 +20,60 @@ def __check_row_valid(row_cells: list[str]) -> bool:
     row_valid = row_valid and not row_cells[0].startswith("___")
     return row_valid
 
-def read_xlsx_sheet(path: str) -> TextGrid:
+def __format_cell(cell) -> str:
+    if cell is None:
+        return ""
+    if isinstance(cell, float) or isinstance(cell, int):
+        if isinstance(cell, float) and int(cell) == float(cell):
+            # prevent the conversion of '100' to '100.0'
+            cell = int(cell)
+        cell = repr(cell)
+    elif isinstance(cell, datetime.datetime):
+        cell = str(cell)
+    elif not isinstance(cell, str):
+        cell = str(cell)
+    # change multiline cells into single-line
+    return cell.replace("\n", " ⏎ ").strip()
+
+def read_xlsx_sheet(path: str, columnar: bool = False, window: Optional[RowWindow] = None) -> TextGrid:
     """
-    Reads entire sheet 0
+    Reads entire sheet 0, or only the `window` rows: the reading stops after the window
+    columnar=True: returns the memory-efficient ColumnarTextGrid
     """
     assert path is not None
     logger.info(f"Reading file '{path}'")
-    # Define variable to load the wookbook
-    workbook = openpyxl.load_workbook(path)
-    sheet = workbook.active
-    tg = TextGrid()
-
-    # Iterate the loop to read the cell values
-    for row in sheet.iter_rows(min_row=1, max_col=sheet.max_column, max_row=sheet.max_row, values_only=True):
-        row_cells = []
-        for cell in row:
-            if cell is None:
-                cell = ""
-            else:
-                if isinstance(cell, float) or isinstance(cell, int):
-                    if isinstance(cell, float) and int(cell) == float(cell):
-                        # prevent the conversion of '100' to '100.0'
-                        cell = int(cell)
-                    cell = repr(cell)
-                elif isinstance(cell, datetime.datetime):
-                    cell = str(cell)
-            # change multiline cells into single-line
-            cell = cell.replace("\n", " ⏎ ")
-            row_cells.append(cell.strip())
-
-        if __check_row_valid(row_cells):
-            tg.rows_raw().append(row_cells)
+    window = window or RowWindow()
+    end = window.end()
+    # read-only mode: rows are streamed from the file, without creating the cells and styles;
+    # data_only: formula cells give the last calculated value
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        tg = ColumnarTextGrid() if columnar else TextGrid()
+        max_cols = sheet.max_column or 0
+
+        # Iterate the loop to read the cell values
+        for row in sheet.iter_rows(min_row=1, values_only=True):
+            if len(tg.rows_raw()) < window.first:
+                # before the window: only the first cells converted
+                row_cells = [__format_cell(cell) for cell in row[:RowWindow.SKIPPED_ROW_CELLS]]
+                if __check_row_valid(row_cells):
+                    tg.rows_raw().append(row_cells)
+                continue
+
+            row_cells = [__format_cell(cell) for cell in row]
+
+            if __check_row_valid(row_cells):
+                max_cols = max(max_cols, len(row_cells))
+                tg.rows_raw().append(row_cells)
+                if len(tg.rows_raw()) == end:
+                    logger.debug(f"  Last row {end} reached")
+                    break
+    finally:
+        # read-only workbook keeps the file open
+        workbook.close()
 
     tg.nrows = len(tg.rows_raw())
-    tg.ncols = sheet.max_column
+    tg.ncols = max_cols
     tg.align_number_of_columns()
     return tg
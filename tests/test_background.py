@@ -0,0 +1,147 @@
+import pytest
+import sys
+import os
+import threading
+import time
+
+# adding src path to search list
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
+
+# tested module
+import background
+
+# -----------------------------------------------------------------------------
+
+class FakeMainLoop:
+    """Calls the scheduled functions, like the Tk mainloop does with `after()`"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms: int, fn):
+        self.scheduled.append(fn)
+
+    def run(self, timeout: float = 5.0):
+        t_end = time.perf_counter() + timeout
+        while self.scheduled and time.perf_counter() < t_end:
+            fn = self.scheduled.pop(0)
+            time.sleep(background.POLL_INTERVAL_MS / 1000)
+            fn()
+        assert not self.scheduled, "jobs not finished"
+
+@pytest.fixture
+def mainloop():
+    return FakeMainLoop()
+
+def test_jobs_in_order(mainloop):
+    runner = background.JobRunner(mainloop.after)
+    statuses = []
+    runner.on_status = statuses.append
+    results = []
+    ui_thread = threading.current_thread()
+
+    def done(value):
+        assert threading.current_thread() is ui_thread
+        results.append(value)
+
+    def work(n):
+        def fn(token, progress):
+            assert threading.current_thread() is not ui_thread
+            progress(f"step {n}")
+            return n
+        return fn
+
+    for n in range(3):
+        runner.submit(f"job {n}", work(n), done)
+    assert runner.busy
+    mainloop.run()
+    assert results == [0, 1, 2]
+    assert not runner.busy
+    assert statuses[0] == "job 0"
+    assert "step 2" in statuses
+    assert statuses[-1] == ""
+
+def test_error(mainloop):
+    runner = background.JobRunner(mainloop.after)
+    errors = []
+
+    def work(token, progress):
+        raise ValueError("bad file")
+
+    runner.submit("job", work, lambda value: None, errors.append)
+    # callback failing does not stop the runner
+    runner.submit("job", lambda token, progress: 1, lambda value: 1 / 0)
+    runner.submit("job", lambda token, progress: 2, errors.append)
+    mainloop.run()
+    assert isinstance(errors[0], ValueError)
+    assert errors[1] == 2
+
+def test_cancel(mainloop):
+    runner = background.JobRunner(mainloop.after)
+    started = threading.Event()
+    results = []
+
+    def work(token, progress):
+        started.set()
+        while True:
+            token.check()
+            time.sleep(0.001)
+
+    runner.submit("long job", work, results.append)
+    runner.submit("queued job", lambda token, progress: "queued", results.append)
+    started.wait(5)
+    runner.cancel()
+    # job submitted after the cancel is performed
+    runner.submit("next job", lambda token, progress: "next", results.append)
+    mainloop.run()
+    assert results == ["next"]
+
+def test_cancel_result_dropped(mainloop):
+    runner = background.JobRunner(mainloop.after)
+    results = []
+    # the job does not check the token: its result is dropped
+    runner.submit("job", lambda token, progress: time.sleep(0.05) or "late", results.append)
+    runner.cancel()
+    mainloop.run()
+    assert results == []
+
+def test_block_measured(mainloop):
+    runner = background.JobRunner(mainloop.after)
+    runner.submit("job", lambda token, progress: 0, lambda value: time.sleep(0.03))
+    mainloop.run()
+    assert runner.max_block_ms >= 30
+
+def test_block_budget(mainloop):
+    # [[results of the done callbacks] of every poll]
+    polls = []
+
+    def schedule(ms, poll):
+        def counted_poll():
+            polls.append([])
+            poll()
+        mainloop.after(ms, counted_poll)
+
+    def on_done(result):
+        polls[-1].append(result)
+        time.sleep(0.010)
+
+    runner = background.JobRunner(schedule)
+    for i in range(4):
+        runner.submit(f"job{i}", lambda token, progress, i=i: i, on_done)
+    # all the results are queued before the first poll
+    time.sleep(0.1)
+    mainloop.run()
+    assert [result for results in polls for result in results] == [0, 1, 2, 3]
+    # every poll stopped after exceeding the budget
+    assert all(len(results) <= 2 for results in polls)
+    assert len([results for results in polls if results]) >= 2
+
+def test_gc_enabled_in_job(mainloop):
+    import gc
+    runner = background.JobRunner(mainloop.after)
+    results = []
+    runner.submit("job", lambda token, progress: gc.isenabled(), results.append)
+    mainloop.run()
+    assert results == [True]
+    assert gc.isenabled()
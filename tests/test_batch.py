@@ -0,0 +1,175 @@
+import pytest
+import sys
+import os
+
+# adding src path to search list
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
+
+# tested module
+import batch
+import grid_cache
+import grid_loader
+
+# -----------------------------------------------------------------------------
+
+CONFIG = """
+[common]
+components_min_distance = 3.0
+
+[profile.test]
+bom_has_column_headers = True
+bom_first_row = 0
+bom_separator = COMMA
+bom_designator_col = Designator
+bom_comment_col = Comment
+pnp_has_column_headers = True
+pnp_first_row = 0
+pnp_separator = COMMA
+pnp_designator_col = Designator
+pnp_comment_col = Comment
+pnp_footprint_col = ?
+pnp_coord_x_col = X
+pnp_coord_y_col = Y
+pnp_layer_col = Layer
+pnp_coord_unit_mils = False
+"""
+
+BOM = "Designator,Comment,Footprint,Quantity\nR1,10k,0603,1\nC1,100n,0603,1\n"
+PNP = "Designator,Comment,Layer,Footprint,X,Y\nR1,10k,Top,0603,10,10\nC1,100n,Top,0603,50,50\n"
+PNP_BAD = "Designator,Comment,Layer,Footprint,X,Y\nR1,10k,Top,0603,10,10\nC1,100n,Top,0603,11,10\nC2,1u,Top,0603,80,80\n"
+
+@pytest.fixture
+def boards_dir(tmp_path):
+    (tmp_path / "boomer.ini").write_text(CONFIG)
+    for (board, pnp_fname, pnp) in (("b1", "Pick Place b1.csv", PNP), ("b2", "PnP_b2.csv", PNP_BAD), ("b3", "x.csv", PNP)):
+        (tmp_path / board).mkdir()
+        (tmp_path / board / f"BOM_{board}.csv").write_text(BOM)
+        (tmp_path / board / pnp_fname).write_text(pnp)
+    # b3: PnP ambiguous
+    (tmp_path / "b3" / "y.csv").write_text(PNP)
+    return tmp_path
+
+def test_guess_pnp_files():
+    examples_path = os.path.join(os.path.dirname(tests_path), "examples")
+    assert grid_loader.guess_pnp_files(f"{examples_path}/example1/Kaseta_2v1 BOM.xls") == \
+        ("Pick Place for Kaseta2v1(Standard).csv", "")
+    assert grid_loader.guess_pnp_files(f"{examples_path}/example4/BOM-cpu1-e4.ods") == \
+        ("PnP-cpu1-rev-E4-RB300.mnt", "PnP-cpu1-rev-E4-RB300.mnb")
+
+@pytest.mark.parametrize("max_jobs", [1, 2])
+def test_glob_batch(boards_dir, max_jobs):
+    config_path = str(boards_dir / "boomer.ini")
+    jobs = batch.glob_jobs(str(boards_dir / "**" / "BOM_*.csv"), "test")
+    assert [os.path.basename(job.bom_path) for job in jobs] == ["BOM_b1.csv", "BOM_b2.csv", "BOM_b3.csv"]
+    assert os.path.basename(jobs[0].pnp_path) == "Pick Place b1.csv"
+    assert jobs[2].error != ""
+
+    results = batch.run_batch(jobs, config_path, max_jobs)
+    assert [res.job.bom_path for res in results] == [job.bom_path for job in jobs]
+    assert results[0].error == "" and results[0].counts == (0, 0, 0, 0)
+    assert results[1].error == "" and results[1].counts == (0, 1, 0, 1)
+    assert results[2].error.startswith("Cannot select the PnP file")
+    assert (boards_dir / "b1" / "BOM_b1_report.html").is_file()
+    assert (boards_dir / "b2" / "BOM_b2_report.html").is_file()
+
+    summary = batch.format_summary(results, 1.0)
+    assert "Projects: 3, with problems: 1, failed: 1" in summary
+
+def test_configured_batch(boards_dir):
+    config_path = boards_dir / "boomer.ini"
+    with open(config_path, "a") as f:
+        f.write(f"\n[project.{boards_dir / 'b2' / 'BOM_b2.csv'}]\npnp = PnP_b2.csv\npnp2 = \nprofile = test\n")
+        f.write(f"\n[project.{boards_dir / 'b9' / 'BOM_b9.csv'}]\npnp = PnP_b9.csv\npnp2 = \nprofile = test\n")
+
+    jobs = batch.configured_jobs(str(config_path))
+    # missing project is skipped, but not removed from the config file
+    assert len(jobs) == 1
+    assert "b9" in config_path.read_text()
+
+    results = batch.run_batch(jobs, str(config_path))
+    assert results[0].counts == (0, 1, 0, 1)
+
+def test_unknown_profile(boards_dir):
+    jobs = batch.glob_jobs(str(boards_dir / "b1" / "BOM_*.csv"), "unknown")
+    results = batch.run_batch(jobs, str(boards_dir / "boomer.ini"))
+    assert "Profile 'unknown' not found" in results[0].error
+
+@pytest.mark.parametrize("pool", ["none", "thread", "process"])
+def test_load_files(boards_dir, pool):
+    proj = batch.load_project(str(boards_dir / "boomer.ini"), "test")
+    (boards_dir / "b1" / "pnp_bot.csv").write_text("Designator,Comment,Layer,Footprint,X,Y\nC2,1u,Bottom,0603,80,80\n")
+    paths = (str(boards_dir / "b1" / "BOM_b1.csv"), str(boards_dir / "b1" / "Pick Place b1.csv"),
+             str(boards_dir / "b1" / "pnp_bot.csv"))
+    executor = grid_loader.make_executor(pool)
+    try:
+        (bom_grid, pnp_grid) = grid_loader.load_files(*paths, proj.profile, executor=executor)
+        # PnP only
+        assert grid_loader.load_files("", paths[1], "", proj.profile, executor=executor)[0] is None
+    finally:
+        if executor:
+            executor.shutdown()
+
+    assert bom_grid.rows_raw() == grid_loader.load_bom(paths[0], proj.profile).rows_raw()
+    assert pnp_grid.rows_raw() == grid_loader.load_pnp(paths[1], paths[2], proj.profile).rows_raw()
+    assert [row[-1] for row in pnp_grid.rows_raw()] == ["top", "top", "top", "bot", "bot"]
+
+def test_load_quotechar_cached(boards_dir):
+    proj = batch.load_project(str(boards_dir / "boomer.ini"), "test")
+    path = str(boards_dir / "b1" / "BOM_b1.csv")
+    cache = grid_cache.GridCache()
+    proj.profile.bom_quotechar = ""
+    grid = grid_loader.load_bom(path, proj.profile, cache=cache)
+    detected = proj.profile.bom_quotechar
+    assert detected != ""
+    # the detected quotechar, remembered in the profile, reuses the grid
+    assert grid_loader.load_bom(path, proj.profile, cache=cache) is grid
+    # other quotechar: file read again
+    proj.profile.bom_quotechar = "'" if detected != "'" else '"'
+    assert grid_loader.load_bom(path, proj.profile, cache=cache) is not grid
+    assert (cache.hits, cache.misses) == (1, 2)
+
+def test_load_files_cached(boards_dir):
+    proj = batch.load_project(str(boards_dir / "boomer.ini"), "test")
+    paths = (str(boards_dir / "b2" / "BOM_b2.csv"), str(boards_dir / "b2" / "PnP_b2.csv"), "")
+    cache = grid_cache.GridCache()
+    with grid_loader.make_executor("thread") as executor:
+        grids = grid_loader.load_files(*paths, proj.profile, cache=cache, executor=executor)
+        assert (cache.hits, cache.misses) == (0, 2)
+        # PnP modified: only the PnP read again
+        (boards_dir / "b2" / "PnP_b2.csv").write_text(PNP)
+        grids2 = grid_loader.load_files(*paths, proj.profile, cache=cache, executor=executor)
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert grids2[0] is grids[0]
+        assert grids2[1].nrows == 3
+
+        ccresult = batch.check_files(proj, *paths, 3.0, executor)
+        assert ccresult.findings_count() == 0
+
+        with pytest.raises(FileNotFoundError):
+            grid_loader.load_files(paths[0], str(boards_dir / "b2" / "none.csv"), "", proj.profile, executor=executor)
+
+    with pytest.raises(ValueError):
+        grid_loader.make_executor("fibers")
+
+@pytest.mark.parametrize("pool", ["none", "thread"])
+def test_load_files_window(boards_dir, pool):
+    proj = batch.load_project(str(boards_dir / "boomer.ini"), "test")
+    proj.profile.pnp_last_row = 2
+    # the widest row after the profile last row
+    (boards_dir / "b1" / "pnp_top.csv").write_text(PNP + "C3,1u,Top,0603,20,20,note\n")
+    (boards_dir / "b1" / "pnp_bot.csv").write_text("Designator,Comment,Layer,Footprint,X,Y,\nC2,1u,Bottom,0603,80,80,note\n")
+    paths = (str(boards_dir / "b1" / "BOM_b1.csv"), str(boards_dir / "b1" / "pnp_top.csv"),
+             str(boards_dir / "b1" / "pnp_bot.csv"))
+    executor = grid_loader.make_executor(pool)
+    try:
+        (_, pnp_grid) = grid_loader.load_files(*paths, proj.profile, executor=executor)
+    finally:
+        if executor:
+            executor.shutdown()
+    assert (pnp_grid.nrows, pnp_grid.ncols) == (6, 8)
+    assert pnp_grid.rows_raw() == grid_loader.load_pnp(paths[1], paths[2], proj.profile).rows_raw()
+
+    # single file: read up to the last row
+    (_, pnp_grid) = grid_loader.load_files("", paths[1], "", proj.profile)
+    assert pnp_grid.nrows == 3
@@ -0,0 +1,89 @@
+import pytest
+import json
+import subprocess
+import sys
+import os
+
+# adding src path to search list
+tests_path = os.path.dirname(os.path.realpath(__file__))
+src_path = os.path.join(os.path.dirname(tests_path), "src")
+sys.path.append(src_path)
+
+# tested module
+import boomer
+
+# -----------------------------------------------------------------------------
+
+CONFIG = """
+[common]
+components_min_distance = 3.0
+
+[profile.test]
+bom_has_column_headers = True
+bom_first_row = 0
+bom_separator = COMMA
+bom_designator_col = Designator
+bom_comment_col = Comment
+pnp_has_column_headers = True
+pnp_first_row = 0
+pnp_separator = COMMA
+pnp_designator_col = Designator
+pnp_comment_col = Comment
+pnp_footprint_col = ?
+pnp_coord_x_col = X
+pnp_coord_y_col = Y
+pnp_layer_col = Layer
+pnp_coord_unit_mils = False
+"""
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "boomer.ini").write_text(CONFIG)
+    (tmp_path / "bom.csv").write_text("Designator,Comment,Footprint,Quantity\n"
+                                      "R1,10k,0603,1\n"
+                                      "C1,100n,0603,1\n")
+    (tmp_path / "pnp.csv").write_text("Designator,Comment,Layer,Footprint,X,Y\n"
+                                      "R1,10k,Top,0603,10,10\n"
+                                      "C1,100n,Top,0603,50,50\n")
+    (tmp_path / "pnp_bad.csv").write_text("Designator,Comment,Layer,Footprint,X,Y\n"
+                                          "R1,10k,Top,0603,10,10\n"
+                                          "C1,100n,Top,0603,11,10\n"
+                                          "C2,1u,Top,0603,80,80\n")
+    return tmp_path
+
+def test_check_ok(project_dir):
+    assert boomer.main(["check", "--bom", "bom.csv", "--pnp", "pnp.csv", "--profile", "test"]) == boomer.EXIT_OK
+    # default report location, like in the app
+    assert (project_dir / "bom_report.html").is_file()
+
+def test_check_findings(project_dir):
+    argv = ["check", "--bom", "bom.csv", "--pnp", "pnp_bad.csv", "--profile", "test", "--json", "report.json"]
+    assert boomer.main(argv) == boomer.EXIT_FINDINGS
+    assert not (project_dir / "bom_report.html").exists()
+
+    report = json.loads((project_dir / "report.json").read_text(encoding="utf-8"))
+    assert report["pnp"] == ["pnp_bad.csv"]
+    assert report["bom_parts_missing_in_pnp"] == []
+    assert report["pnp_parts_missing_in_bom"] == [{"designator": "C2", "comment": "1u"}]
+    assert report["parts_coord_conflicts"] == [{"designator1": "R1", "designator2": "C1", "distance": 1.0}]
+
+def test_check_errors(project_dir):
+    argv = ["check", "--bom", "bom.csv", "--pnp", "pnp.csv", "--profile", "unknown"]
+    assert boomer.main(argv) == boomer.EXIT_ERROR
+    argv = ["check", "--bom", "missing.csv", "--pnp", "pnp.csv", "--profile", "test"]
+    assert boomer.main(argv) == boomer.EXIT_ERROR
+    argv = ["check", "--bom", "bom.csv", "--pnp", "pnp.csv", "--profile", "test", "--config", "missing.ini"]
+    assert boomer.main(argv) == boomer.EXIT_ERROR
+
+def test_import_time():
+    # best of 3: measured in a fresh interpreter
+    import_us = []
+    for _ in range(3):
+        out = subprocess.run([sys.executable, "-X", "importtime", "-c", "import sys, boomer; print(sorted(sys.modules))"],
+                             cwd=src_path, capture_output=True, text=True, check=True)
+        assert "tkinter" not in out.stdout
+        # "import time: self [us] | cumulative | name"
+        boomer_line = [line for line in out.stderr.splitlines() if line.endswith("| boomer")][0]
+        import_us.append(int(boomer_line.split("|")[1]))
+    assert min(import_us) < 150_000
@@ -0,0 +1,146 @@
+import pytest
+import sys
+import os
+import configparser
+
+# adding src path to search list
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
+
+# tested module
+import check_pipeline
+import cross_check
+import grid_cache
+import grid_loader
+import perf
+import project
+import report_generator
+import text_grid
+
+# -----------------------------------------------------------------------------
+
+def __make_grid(rows: list[list[str]]) -> text_grid.TextGrid:
+    grid = text_grid.TextGrid()
+    grid.rows_raw().extend(rows)
+    grid.nrows = len(rows)
+    grid.ncols = len(rows[0])
+    return grid
+
+def __make_bom(rows: list[list[str]]) -> text_grid.ConfiguredTextGrid:
+    bom = text_grid.ConfiguredTextGrid()
+    bom.text_grid = __make_grid([["Designator", "Comment", "Value", ""]] + rows)
+    bom.designator_col = "Designator"
+    bom.comment_col = "Comment"
+    bom.last_row = -1
+    return bom
+
+def __make_pnp() -> text_grid.ConfiguredTextGrid:
+    pnp = text_grid.ConfiguredTextGrid()
+    pnp.text_grid = __make_grid([
+        ["Designator", "Comment", "Value", "X", "Y", "Layer"],
+        ["R1", "10k", "10k 1%", "10.0", "10.0", "top"],
+        ["R2", "10k", "10k 1%", "11.0", "10.0", "top"],
+        ["C1", "100n", "100n", "50.0", "50.0", "top"],
+        ["TP1", "", "", "90.0", "90.0", "top"],
+    ])
+    pnp.designator_col = "Designator"
+    pnp.comment_col = "Comment"
+    pnp.coord_x_col = "X"
+    pnp.coord_y_col = "Y"
+    pnp.layer_col = "Layer"
+    pnp.last_row = -1
+    return pnp
+
+def __results(ccr: cross_check.CrossCheckResult) -> tuple:
+    return (ccr.bom_parst_missing_in_pnp, ccr.pnp_parst_missing_in_bom, ccr.parts_comment_mismatch, ccr.parts_coord_conflicts)
+
+BOM_ROWS = [["R1", "10k", "10k 1%", ""], ["R2", "10k", "10k 1%", ""], ["C1", "100nF", "100n", ""]]
+
+def test_same_results():
+    pipeline = check_pipeline.CheckPipeline()
+    (bom, pnp) = (__make_bom(BOM_ROWS), __make_pnp())
+    ccr = pipeline.check(bom, pnp, 3.0, False)
+    assert __results(ccr) == __results(cross_check.compare(bom, pnp, 3.0, False))
+    assert ccr.parts_coord_conflicts == [("R1", "R2", 1.0)]
+    assert ccr.parts_comment_mismatch == [("C1", "100nF", "100n", "")]
+
+    # nothing changed: nothing computed again
+    assert __results(pipeline.check(bom, pnp, 3.0, False)) == __results(ccr)
+    assert set(pipeline.computed.values()) == {1}
+
+    with pytest.raises(ValueError):
+        pipeline.check(None, pnp)
+
+def test_bom_changed():
+    pipeline = check_pipeline.CheckPipeline()
+    pnp = __make_pnp()
+    pipeline.check(__make_bom(BOM_ROWS), pnp, 3.0, False)
+    # BOM file edited: new grid
+    ccr = pipeline.check(__make_bom(BOM_ROWS[:2]), pnp, 3.0, False)
+    assert ccr.pnp_parst_missing_in_bom == [("C1", "100n"), ("TP1", "")]
+    assert pipeline.computed == {"extract.bom": 2, "extract.pnp": 1, "missing": 2, "comments": 2, "distances": 1}
+
+def test_comment_column_changed():
+    pipeline = check_pipeline.CheckPipeline()
+    (bom, pnp) = (__make_bom(BOM_ROWS), __make_pnp())
+    pipeline.check(bom, pnp, 3.0, False)
+    bom.comment_col = "Value"
+    pnp.comment_col = "Value"
+    ccr = pipeline.check(bom, pnp, 3.0, False)
+    assert ccr.parts_comment_mismatch == []
+    assert pipeline.computed["extract.pnp"] == 2
+    assert pipeline.computed["distances"] == 1
+
+    # distances depend on the coordinates and the min. distance
+    pipeline.check(bom, pnp, 0.5, False)
+    assert pipeline.computed["distances"] == 2
+
+def test_report(tmp_path, monkeypatch):
+    pipeline = check_pipeline.CheckPipeline()
+    (bom, pnp) = (__make_bom(BOM_ROWS), __make_pnp())
+    path = str(tmp_path / "bom_report.html")
+    monkeypatch.setattr(report_generator.time, "strftime", lambda fmt: "2026-10-18, 12:00:00")
+    summary = pipeline.report(path, "bom.csv", ("pnp.csv", ""), 3.0, pipeline.check(bom, pnp, 3.0, False))
+    assert "PnP parts missing in the BOM: 1" in summary
+    assert os.path.isfile(path)
+
+    # the sections reused, the "Generated" time and the perf stats are current
+    monkeypatch.setattr(report_generator.time, "strftime", lambda fmt: "2026-10-18, 12:05:00")
+    with perf.run("cross-check") as stats:
+        perf.count("stages reused")
+    ccresult = pipeline.check(bom, pnp, 3.0, False)
+    summary2 = pipeline.report(path, "bom.csv", ("pnp.csv", ""), 3.0, ccresult, stats)
+    assert pipeline.computed["render"] == 1
+    assert summary2 == report_generator.prepare_html_report("bom.csv", ("pnp.csv", ""), 3.0, ccresult, stats,
+                                                            summary_only=True)
+    assert "12:05:00" in summary2 and "Performance" in summary2
+    report_html = report_generator.read_html_report_file(path)
+    assert "12:05:00" in report_html and "Performance" in report_html
+
+    # removed report is written again
+    os.remove(path)
+    pipeline.report(path, "bom.csv", ("pnp.csv", ""), 3.0, pipeline.check(bom, pnp, 3.0, False))
+    assert os.path.isfile(path)
+
+def test_profile_change_no_read(tmp_path):
+    (tmp_path / "bom.csv").write_text("Designator,Comment,Value,Quantity\nR1,10k,10k 1%,1\nR2,10k,10k 1%,1\n")
+    (tmp_path / "pnp.csv").write_text("Designator,Comment,Value,X,Y,Layer\nR1,10k,10k 1%,10,10,top\nR2,10k,10k,11,10,top\n")
+    profile = project.Profile(configparser.ConfigParser())
+    profile.bom_designator_col = profile.pnp_designator_col = "Designator"
+    profile.bom_comment_col = profile.pnp_comment_col = "Comment"
+    (profile.pnp_coord_x_col, profile.pnp_coord_y_col, profile.pnp_layer_col) = ("X", "Y", "Layer")
+    profile.pnp_footprint_col = ""
+    profile.pnp_coord_unit_mils = False
+    cache = grid_cache.GridCache()
+    pipeline = check_pipeline.CheckPipeline()
+
+    def check() -> cross_check.CrossCheckResult:
+        bom = grid_loader.load_bom(str(tmp_path / "bom.csv"), profile, cache=cache)
+        pnp = grid_loader.load_pnp(str(tmp_path / "pnp.csv"), "", profile, cache=cache)
+        return pipeline.check(grid_loader.configure_bom(bom, profile), grid_loader.configure_pnp(pnp, profile), 3.0, False)
+
+    assert check().parts_comment_mismatch == []
+    profile.bom_comment_col = profile.pnp_comment_col = "Value"
+    assert check().parts_comment_mismatch == [("R2", "10k 1%", "10k", "")]
+    assert cache.misses == 2
+    assert pipeline.computed["distances"] == 1
@@ -1,6 +1,9 @@
 import pytest
 import sys
 import os
+import math
+import random
+import natsort
 
 # adding src path to search list
 tests_path = os.path.dirname(os.path.realpath(__file__))
@@ -44,3 +47,156 @@ def test_no_pnp():
     with pytest.raises(ValueError):
         bom = text_grid.ConfiguredTextGrid()
         ccr = cross_check.compare(bom, None)
+
+def __make_pnp(parts: list[(str, float, float, str)]) -> text_grid.ConfiguredTextGrid:
+    pnp = text_grid.ConfiguredTextGrid()
+    pnp.text_grid.rows_raw().append(["Designator", "Comment", "X", "Y", "Layer"])
+    for (dsgn, x, y, layer) in parts:
+        pnp.text_grid.rows_raw().append([dsgn, "10k", f"{x:.3f}", f"{y:.3f}", layer])
+    pnp.text_grid.nrows = len(pnp.text_grid.rows_raw())
+    pnp.text_grid.ncols = 5
+    pnp.designator_col = "Designator"
+    pnp.comment_col = "Comment"
+    pnp.coord_x_col = "X"
+    pnp.coord_y_col = "Y"
+    pnp.layer_col = "Layer"
+    pnp.last_row = -1
+    return pnp
+
+def __make_bom(designators: list[str]) -> text_grid.ConfiguredTextGrid:
+    bom = text_grid.ConfiguredTextGrid()
+    bom.text_grid.rows_raw().append(["Designator", "Comment", "", ""])
+    for dsgn in designators:
+        bom.text_grid.rows_raw().append([dsgn, "10k", "", ""])
+    bom.text_grid.nrows = len(bom.text_grid.rows_raw())
+    bom.text_grid.ncols = 4
+    bom.designator_col = "Designator"
+    bom.comment_col = "Comment"
+    bom.last_row = -1
+    return bom
+
+def __reference_distances(parts: list[(str, float, float, str)], min_distance: float) -> list[(str, str, float)]:
+    """The plain N x N comparison"""
+    output = []
+    for a, (dsgn_a, xa, ya, layer_a) in enumerate(parts):
+        xa, ya = float(f"{xa:.3f}"), float(f"{ya:.3f}")
+        for (dsgn_b, xb, yb, layer_b) in parts[a+1:]:
+            xb, yb = float(f"{xb:.3f}"), float(f"{yb:.3f}")
+            if layer_a == layer_b:
+                dist = math.sqrt(((xa - xb)**2.0) + ((ya - yb)**2.0))
+                if dist < min_distance:
+                    output.append((dsgn_a, dsgn_b, dist))
+    return natsort.natsorted(output)
+
+@pytest.fixture(params=["numpy", "python"])
+def distances_engine(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        # pure-Python fallback
+        monkeypatch.setattr(cross_check, "numpy", None)
+    return request.param
+
+def test_distances(distances_engine):
+    parts = [
+        ("C1", 10.0, 10.0, "top"),
+        ("C2", 12.0, 10.0, "top"),   # 2mm from C1
+        ("C3", 10.0, 12.9, "top"),   # 2.9mm from C1
+        ("C4", 10.0, 13.0, "top"),   # exactly 3mm from C1 - not a conflict
+        ("R1", 12.0, 10.0, "bot"),   # same place as C2, other layer
+        ("R2", 14.5, 10.0, "bot"),
+    ]
+    bom = __make_bom([p[0] for p in parts])
+    ccr = cross_check.compare(bom, __make_pnp(parts), 3.0, False)
+    assert ccr.parts_coord_conflicts == __reference_distances(parts, 3.0)
+    assert [(a, b) for (a, b, _) in ccr.parts_coord_conflicts] == [
+        ("C1", "C2"), ("C1", "C3"), ("C3", "C4"), ("R1", "R2")
+    ]
+
+def test_distances_perf_counters(distances_engine):
+    import perf
+    parts = [
+        ("C1", 10.0, 10.0, "top"),
+        ("C2", 12.0, 10.0, "top"),   # 2mm from C1
+        ("C3", 50.0, 10.0, "top"),   # far away: not tested
+        ("R1", 10.0, 10.0, "bot"),
+    ]
+    with perf.run("test") as stats:
+        cross_check.compare(__make_bom([p[0] for p in parts]), __make_pnp(parts), 3.0, False)
+    assert stats.counters == {"bom parts": 4, "pnp parts": 4, "pairs tested": 1, "conflicts": 1}
+    assert {"check", "check.extract", "check.decode", "check.distances", "check.sort"} <= set(stats.stages)
+
+def test_distances_random(distances_engine):
+    rnd = random.Random(1234)
+    # ~2 parts per 3x3mm cell, some of them exactly on the cell border
+    parts = [
+        (f"U{n}", rnd.uniform(0, 120), rnd.choice((rnd.uniform(0, 120), 3.0 * rnd.randint(0, 40))), rnd.choice(("top", "bot")))
+        for n in range(800)
+    ]
+    bom = __make_bom([p[0] for p in parts])
+    for min_distance in (0.5, 3.0, 7.0):
+        ccr = cross_check.compare(bom, __make_pnp(parts), min_distance, False)
+        assert ccr.parts_coord_conflicts == __reference_distances(parts, min_distance)
+
+def test_distances_invalid_coords(distances_engine):
+    parts = [
+        ("C1", 1.0, 1.0, "top"),
+        ("C2", 50.0, 50.0, "top"),
+    ]
+    pnp = __make_pnp(parts)
+    # invalid coordinate is decoded as (0, 0)
+    pnp.text_grid.rows_raw()[2][2] = "1,5"
+    ccr = cross_check.compare(__make_bom(["C1", "C2"]), pnp, 3.0, False)
+    assert ccr.parts_coord_conflicts == [("C1", "C2", math.sqrt(2.0))]
+
+def test_distances_multiline_coords(distances_engine):
+    parts = [
+        ("C1", 1.0, 1.0, "top"),
+        ("C2", 50.0, 50.0, "top"),
+        ("C3", 51.0, 50.0, "top"),
+    ]
+    pnp = __make_pnp(parts)
+    # multi-line cell does not shift the coordinates of the next parts
+    pnp.text_grid.rows_raw()[1][2] = "1.000\nmm"
+    ccr = cross_check.compare(__make_bom(["C1", "C2", "C3"]), pnp, 3.0, False)
+    assert ccr.parts_coord_conflicts == [("C2", "C3", 1.0)]
+
+def test_distances_mils(distances_engine):
+    parts = [
+        ("C1", 1000.0, 1000.0, "top"),
+        ("C2", 1100.0, 1000.0, "top"), # 2.54mm
+        ("C3", 1200.0, 1000.0, "top"),
+    ]
+    ccr = cross_check.compare(__make_bom(["C1", "C2", "C3"]), __make_pnp(parts), 3.0, True)
+    assert [(a, b) for (a, b, _) in ccr.parts_coord_conflicts] == [("C1", "C2"), ("C2", "C3")]
+    assert ccr.parts_coord_conflicts[0][2] == pytest.approx(2.54)
+
+def test_natural_key():
+    assert cross_check.natural_key("R10") == ("R", 10)
+    assert cross_check.natural_key("C1A") == ("C", 1, "A")
+    assert cross_check.natural_key("10") == ("", 10)
+    assert cross_check.natural_key("FID") == ("FID",)
+    assert cross_check.natural_key("") == ()
+
+    rnd = random.Random(1234)
+    designators = list({
+        f"{rnd.choice(('R', 'C', 'U', 'TP', 'J', ''))}{rnd.randint(0, 3000)}{rnd.choice(('', '', 'A', 'B', '.1', '_2'))}"
+        for _ in range(5000)
+    })
+    assert sorted(designators, key=cross_check.natural_key) == natsort.natsorted(designators)
+
+def test_sorted_results():
+    parts = [
+        ("R10", 0.0, 0.0, "top"),
+        ("R2", 1.0, 0.0, "top"),
+        ("R1", 2.0, 0.0, "top"),
+        ("C10", 50.0, 0.0, "top"),
+        ("C9", 51.0, 0.0, "top"),
+    ]
+    bom = __make_bom(["R10", "R2", "R1", "C10", "C9", "U10", "U2"])
+    ccr = cross_check.compare(bom, __make_pnp(parts + [("TP10", 90.0, 0.0, "top"), ("TP9", 99.0, 0.0, "top")]), 3.0, False)
+    assert ccr.bom_parst_missing_in_pnp == natsort.natsorted(ccr.bom_parst_missing_in_pnp)
+    assert [d for (d, _) in ccr.bom_parst_missing_in_pnp] == ["U2", "U10"]
+    assert [d for (d, _) in ccr.pnp_parst_missing_in_bom] == ["TP9", "TP10"]
+    assert ccr.parts_coord_conflicts == natsort.natsorted(ccr.parts_coord_conflicts)
+    assert [(a, b) for (a, b, _) in ccr.parts_coord_conflicts] == [("C10", "C9"), ("R2", "R1"), ("R10", "R1"), ("R10", "R2")]
@@ -8,6 +8,7 @@ sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
 
 # tested module
 import csv_reader
+import text_grid
 
 # -----------------------------------------------------------------------------
 
@@ -39,3 +40,48 @@ def test_csv_tabs():
     assert grid.nrows == 21-2 # skip empty and lines that begins with '___'
     assert grid.ncols == 10
     assert grid.rows_raw()[-2][2] == "SOT23_S4C"
+
+def test_csv_columnar():
+    for (fname, delim) in (("comma.csv", ","), ("spaces.csv", "*sp"), ("tabs.csv", "\t")):
+        grid = csv_reader.read_csv(f"{tests_path}/assets/{fname}", delim)
+        cgrid = csv_reader.read_csv(f"{tests_path}/assets/{fname}", delim, columnar=True)
+        assert cgrid.nrows == grid.nrows
+        assert cgrid.ncols == grid.ncols
+        assert list(cgrid.rows_raw()) == grid.rows_raw()
+
+def test_sniff_dialect():
+    grid = csv_reader.read_csv(f"{tests_path}/assets/tabs.csv", "\t")
+    assert grid.dialect.delimiter == "\t"
+    assert grid.dialect.quotechar == '"'
+    assert grid.dialect.encoding == "utf-8"
+
+def test_apostrophe_quotechar(tmp_path):
+    path = tmp_path / "apostr.csv"
+    path.write_text("'Designator','Comment','X','Y'\n"
+                    "'R1','10k, 1%','1.0','2.0'\n"
+                    "'R2','22k, 1%','3.0','4.0'\n", encoding="utf-8")
+    grid = csv_reader.read_csv(str(path), ",")
+    assert grid.dialect.quotechar == "'"
+    assert grid.ncols == 4
+    assert grid.rows_raw()[1] == ["R1", "10k, 1%", "1.0", "2.0"]
+    # remembered quotechar skips the detection
+    grid = csv_reader.read_csv(str(path), ",", quotechar='"')
+    assert grid.dialect.quotechar == '"'
+    assert grid.ncols == 5
+
+def test_auto_delimiter_with_bom(tmp_path):
+    path = tmp_path / "semicolon.csv"
+    path.write_text("Designator;Comment;X;Y\nR1;10k;1.0;2.0\nR2;22k;3.0;4.0\n", encoding="utf-8-sig")
+    grid = csv_reader.read_csv(str(path), "*auto")
+    assert grid.dialect.delimiter == ";"
+    assert grid.dialect.encoding == "utf-8-sig"
+    assert grid.rows_raw()[0][0] == "Designator"
+    assert grid.nrows == 3
+
+@pytest.mark.parametrize("fname, delim", [("tabs.csv", "\t"), ("spaces.csv", "*sp")])
+def test_window(fname, delim):
+    grid = csv_reader.read_csv(f"{tests_path}/assets/{fname}", delim)
+    grid_part = csv_reader.read_csv(f"{tests_path}/assets/{fname}", delim, window=text_grid.RowWindow(first=1, last=4))
+    assert grid_part.nrows == 5
+    assert grid_part.rows_raw()[0][:4] == grid.rows_raw()[0][:4]
+    assert [row[:grid_part.ncols] for row in grid.rows_raw()[1:5]] == grid_part.rows_raw()[1:]
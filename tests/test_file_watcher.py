@@ -0,0 +1,92 @@
+import pytest
+import sys
+import os
+
+# adding src path to search list
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
+
+# tested module
+import file_watcher
+
+# -----------------------------------------------------------------------------
+
+class Watched:
+    def __init__(self, tmp_path, use_inotify: bool = False):
+        self.scheduled = []
+        self.changes = []
+        self.bom = tmp_path / "bom.csv"
+        self.pnp = tmp_path / "pnp.csv"
+        self.bom.write_text("Designator,Comment\n")
+        self.pnp.write_text("Designator,X,Y\n")
+        self.watcher = file_watcher.FileWatcher(lambda ms, fn: self.scheduled.append(fn), self.changes.append,
+                                                use_inotify=use_inotify, debounce_ms=500)
+        self.watcher.watch([str(self.bom), str(self.pnp), ""])
+
+    def write(self, path, text: str):
+        path.write_text(text)
+        # the mtime resolution of some filesystems is poor: size changed as well
+        os.utime(path, ns=(os.stat(path).st_mtime_ns + 10_000_000,) * 2)
+
+@pytest.fixture
+def watched(tmp_path):
+    w = Watched(tmp_path)
+    yield w
+    w.watcher.close()
+
+def test_debounce(watched):
+    assert watched.watcher.backend == "polling"
+    assert len(watched.watcher.paths) == 2
+    assert len(watched.scheduled) == 1
+    watched.watcher.check(now=0.0)
+    assert watched.changes == []
+
+    # burst of writes
+    watched.write(watched.bom, "Designator,Comment\nR1,10k\n")
+    watched.watcher.check(now=1.0)
+    watched.watcher.check(now=1.3)
+    watched.write(watched.bom, "Designator,Comment\nR1,10k\nR2,1k\n")
+    watched.watcher.check(now=1.4)
+    watched.watcher.check(now=1.8)
+    assert watched.changes == []
+    watched.watcher.check(now=2.0)
+    assert watched.changes == [[str(watched.bom)]]
+    # reported once
+    watched.watcher.check(now=3.0)
+    assert len(watched.changes) == 1
+
+def test_replaced_file(watched):
+    # editor: written to a temporary file, the original removed, the temporary renamed
+    tmp = watched.pnp.with_name("pnp.csv~")
+    tmp.write_text("Designator,X,Y\nR1,0,0\n")
+    watched.pnp.unlink()
+    watched.watcher.check(now=1.0)
+    watched.watcher.check(now=2.0)
+    assert watched.changes == []
+    tmp.rename(watched.pnp)
+    watched.watcher.check(now=2.1)
+    watched.watcher.check(now=2.7)
+    assert watched.changes == [[str(watched.pnp)]]
+
+def test_poll_stop(watched):
+    fn = watched.scheduled.pop()
+    fn()
+    assert len(watched.scheduled) == 1
+    watched.watcher.stop()
+    watched.scheduled.pop()()
+    assert watched.scheduled == []
+    assert watched.watcher.paths == []
+
+def test_inotify(tmp_path):
+    pytest.importorskip("inotify_simple")
+    w = Watched(tmp_path, use_inotify=True)
+    assert w.watcher.backend == "inotify"
+    w.watcher.check(now=0.0)
+    (tmp_path / "other.txt").write_text("not watched")
+    w.watcher.check(now=1.0)
+    w.watcher.check(now=2.0)
+    w.write(w.pnp, "Designator,X,Y\nR1,0,0\n")
+    w.watcher.check(now=3.0)
+    w.watcher.check(now=3.6)
+    assert w.changes == [[str(w.pnp)]]
+    w.watcher.close()
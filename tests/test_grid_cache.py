@@ -0,0 +1,101 @@
+import pytest
+import sys
+import os
+
+# adding src path to search list
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
+
+# tested module
+import grid_cache
+import csv_reader
+
+# -----------------------------------------------------------------------------
+
+def __write_csv(path, ncomponents: int):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Designator,Comment,X,Y\n")
+        for n in range(ncomponents):
+            f.write(f"R{n+1},10k,{n},{n}\n")
+
+def test_no_file():
+    cache = grid_cache.GridCache()
+    with pytest.raises(FileNotFoundError):
+        cache.load(("not-existing.csv",), (), lambda: None)
+
+def test_hit_and_invalidate(tmp_path):
+    path = str(tmp_path / "pnp.csv")
+    __write_csv(path, 3)
+    cache = grid_cache.GridCache()
+    read = lambda: csv_reader.read_csv(path, ",")
+
+    grid = cache.load((path,), (",",), read)
+    assert grid.nrows == 4
+    assert cache.load((path,), (",",), read) is grid
+    assert (cache.hits, cache.misses) == (1, 1)
+    # different reader options
+    assert cache.load((path,), (";",), read) is not grid
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # file modified
+    __write_csv(path, 5)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    grid = cache.load((path,), (",",), read)
+    assert grid.nrows == 6
+    assert (cache.hits, cache.misses) == (1, 3)
+
+def test_memory_lru(tmp_path):
+    paths = []
+    for n in range(3):
+        paths.append(str(tmp_path / f"pnp{n}.csv"))
+        __write_csv(paths[-1], n + 1)
+
+    cache = grid_cache.GridCache(max_entries=2)
+    for path in paths[:2]:
+        cache.load((path,), (), lambda: csv_reader.read_csv(path, ","))
+    # pnp0 used recently, so pnp1 is evicted
+    cache.load((paths[0],), (), lambda: None)
+    cache.load((paths[2],), (), lambda: csv_reader.read_csv(paths[2], ","))
+    assert cache.misses == 3
+    assert cache.get(cache.make_key((paths[0],), ())) is not None
+    assert cache.get(cache.make_key((paths[1],), ())) is None
+
+def test_store(tmp_path, monkeypatch):
+    path = str(tmp_path / "pnp.csv")
+    store_dir = str(tmp_path / "grid_cache")
+    __write_csv(path, 3)
+
+    cache = grid_cache.GridCache(store_dir=store_dir)
+    grid = cache.load((path,), (True,), lambda: csv_reader.read_csv(path, ",", columnar=True))
+
+    # new session
+    cache = grid_cache.GridCache(store_dir=store_dir)
+    grid_stored = cache.load((path,), (True,), lambda: None)
+    assert cache.hits == 1
+    assert grid_stored.nrows == grid.nrows
+    assert grid_stored.rows_raw() == list(grid.rows_raw())
+    assert grid_stored.dialect.delimiter == ","
+
+    # stored grids of another cache format are not read
+    assert [fname.endswith(f".v{grid_cache.CACHE_FORMAT_VERSION}.pickle") for fname in os.listdir(store_dir)] == [True]
+    monkeypatch.setattr(grid_cache, "CACHE_FORMAT_VERSION", grid_cache.CACHE_FORMAT_VERSION + 1)
+    cache = grid_cache.GridCache(store_dir=store_dir)
+    assert cache.get(cache.make_key((path,), (True,))) is None
+    monkeypatch.undo()
+
+    # corrupted file is dropped
+    for fname in os.listdir(store_dir):
+        with open(os.path.join(store_dir, fname), "wb") as f:
+            f.write(b"garbage")
+    cache = grid_cache.GridCache(store_dir=store_dir)
+    assert cache.get(cache.make_key((path,), (True,))) is None
+
+def test_store_lru(tmp_path):
+    store_dir = str(tmp_path / "grid_cache")
+    cache = grid_cache.GridCache(store_dir=store_dir, max_store_files=2)
+    for n in range(4):
+        path = str(tmp_path / f"pnp{n}.csv")
+        __write_csv(path, 1)
+        cache.load((path,), (), lambda: csv_reader.read_csv(path, ","))
+    assert len(os.listdir(store_dir)) == 2
@@ -0,0 +1,77 @@
+import pytest
+import sys
+import os
+
+# adding src path to search list
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
+
+# tested module
+from grid_preview import GridPreview
+from text_grid import ColumnarTextGrid, TextGrid
+
+# -----------------------------------------------------------------------------
+
+def __make_grid(grid_type: type, nrows: int) -> TextGrid:
+    tg = grid_type()
+    tg.rows_raw().append(["Designator", "Comment"])
+    for n in range(nrows):
+        tg.rows_raw().append([f"C{n+1}", "100nF" if n % 10 else "10uF"])
+    tg.nrows = nrows + 1
+    tg.ncols = 2
+    tg.align_number_of_columns()
+    return tg
+
+@pytest.mark.parametrize("grid_type", [TextGrid, ColumnarTextGrid])
+def test_lines(grid_type):
+    tg = __make_grid(grid_type, 100)
+    preview = GridPreview(tg, 0, -1)
+    assert len(preview) == 101
+    assert "\n".join(preview.lines(0, 1000)) + "\n" == tg.format_grid(0)
+    assert preview.lines(10, 2) == tg.format_grid(0).splitlines()[10:12]
+    assert preview.lines(100, 5) == ["101 | C100       | 100nF   | "]
+    assert preview.lines(200, 5) == []
+
+def test_rows_range():
+    tg = __make_grid(TextGrid, 100)
+    # last row is included, like in the format_grid()
+    preview = GridPreview(tg, 5, 9)
+    assert len(preview) == 5
+    assert preview.lines(0, 10) == tg.format_grid(5, 9).splitlines()
+    assert preview.line_of_row(6) == 0
+    assert preview.line_of_row(8) == 2
+    assert preview.line_of_row(1) == 0
+    assert preview.line_of_row(1000) == 4
+    assert len(GridPreview(tg, 500, -1)) == 0
+
+def test_find():
+    tg = __make_grid(TextGrid, 3000)
+    preview = GridPreview(tg, 0, -1)
+    hits = preview.find("10UF")
+    assert len(hits) == 300
+    assert hits[0] == (1, preview.lines(1, 1)[0].index("10uF"))
+    assert hits[-1][0] == 2991
+    assert len(preview.find("C2999")) == 1
+    assert preview.find("") == []
+    assert preview.find("xyz") == []
+    # only the given column
+    assert preview.find("c", column=1) == [(0, preview.lines(0, 1)[0].index("Comment"))]
+    assert preview.find("10uf", match_case=True) == []
+
+def test_find_position():
+    tg = __make_grid(TextGrid, 1200)
+    preview = GridPreview(tg, 0, -1)
+    # row numbers longer than 3 digits
+    for (line, pos) in preview.find("C1100") + preview.find("100nF")[-3:]:
+        text = preview.lines(line, 1)[0]
+        assert text[pos:pos+5].lower() in ("c1100", "100nf")
+
+def test_hits_in_lines():
+    preview = GridPreview(__make_grid(TextGrid, 100), 0, -1)
+    hits = preview.find("10uF")
+    assert len(hits) == 10
+    # lines 1, 11, 21...
+    assert GridPreview.hits_in_lines(hits, 5, 20) == [(1, 11, hits[1][1]), (2, 21, hits[2][1])]
+    assert GridPreview.hits_in_lines(hits, 0, 2) == [(0, 1, hits[0][1])]
+    assert GridPreview.hits_in_lines(hits, 95, 10) == []
+    assert GridPreview.hits_in_lines([], 0, 10) == []
@@ -0,0 +1,71 @@
+import pytest
+import sys
+import os
+
+# adding src path to search list
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
+
+# tested module
+from grid_search import GridSearchIndex
+from text_grid import ColumnarTextGrid, TextGrid
+
+# -----------------------------------------------------------------------------
+
+ROWS = (
+    ["Designator", "Comment", "Footprint"],
+    ["C1", "100nF", "0402"],
+    ["C2", "100nF", "0603"],
+    ["R1", "10k", "0402"],
+    ["R2", "1k0", None],
+    ["U1", "STM32 MCU", 1.5],
+    ["C100", "1uF"],
+)
+
+@pytest.mark.parametrize("grid_type", [TextGrid, ColumnarTextGrid])
+def test_find(grid_type):
+    tg = grid_type()
+    tg.rows_raw().extend(list(row) for row in ROWS)
+    tg.nrows = len(ROWS)
+    tg.ncols = 3
+    index = GridSearchIndex(tg)
+    assert index.nrows == len(ROWS)
+
+    # sorted by row, then by column
+    assert index.find("c") == [(0, 1, 0), (1, 0, 0), (2, 0, 0), (5, 1, 7), (6, 0, 0)]
+    assert index.find("C", match_case=True) == [(0, 1, 0), (1, 0, 0), (2, 0, 0), (5, 1, 7), (6, 0, 0)]
+    assert index.find("c", column=0) == [(1, 0, 0), (2, 0, 0), (6, 0, 0)]
+    assert index.find("c", column=5) == []
+    # every occurrence in the cell
+    assert index.find("0", column=2) == [(1, 2, 0), (1, 2, 2), (2, 2, 0), (2, 2, 2), (3, 2, 0), (3, 2, 2)]
+    assert index.find("10", column=0) == [(6, 0, 1)]
+    assert index.find("00", column=0) == [(6, 0, 2)]
+    # non-string cells
+    assert index.find("1.5") == [(5, 2, 0)]
+    assert index.find("none") == []
+    # the needle never spans over the cells
+    assert index.find("nF0") == []
+    assert index.find("") == []
+    assert index.find("\0") == []
+
+def test_rows_range():
+    tg = TextGrid()
+    tg.rows_raw().extend(list(row) for row in ROWS)
+    tg.nrows = len(ROWS)
+    tg.ncols = 3
+    # rows numbered from the first_row
+    index = GridSearchIndex(tg, 1, 4)
+    assert index.nrows == 3
+    assert index.find("R") == [(2, 0, 0)]
+    assert index.find("C1") == [(0, 0, 0)]
+
+def test_lower_changes_length():
+    tg = TextGrid()
+    # "İ".lower() is 2 characters long
+    tg.rows_raw().extend([["İİ", "x"], ["ab", "y"]])
+    tg.nrows = 2
+    tg.ncols = 2
+    index = GridSearchIndex(tg)
+    assert index.find("ab") == [(1, 0, 0)]
+    assert index.find("AB") == [(1, 0, 0)]
+    assert index.find("y") == [(1, 1, 0)]
@@ -0,0 +1,75 @@
+import pytest
+import sys
+import os
+import logging
+import threading
+
+# adding src path to search list
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
+
+# tested module
+import logger
+
+# -----------------------------------------------------------------------------
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    yield tmp_path
+    # back to the not configured logger
+    logger.shutdown()
+    log = getattr(logger, "__logger")
+    for handler in list(log.handlers):
+        log.removeHandler(handler)
+    logger.set_level(logging.NOTSET)
+    log.propagate = True
+
+def __read_log(logs_dir) -> str:
+    (log_fname,) = os.listdir(logs_dir)
+    with open(logs_dir / log_fname, encoding="utf-8") as f:
+        return f.read()
+
+class Formatted:
+    """Records the thread formatting the message"""
+
+    def __init__(self):
+        self.threads = []
+
+    def __str__(self):
+        self.threads.append(threading.current_thread())
+        return "formatted"
+
+def test_queued(logs_dir):
+    logger.config(False, "INFO", str(logs_dir))
+    assert logger.get_level() == logging.INFO
+
+    arg = Formatted()
+    logger.debug("debug %s", arg)
+    logger.info("info %s", arg)
+    logger.set_level(logging.DEBUG)
+    assert logger.is_enabled_for(logging.DEBUG)
+    logger.debug("debug %d", 2)
+    logger.shutdown()
+
+    log = __read_log(logs_dir)
+    assert "debug formatted" not in log
+    assert "info formatted" in log
+    assert "debug 2" in log
+    # formatted by the listener, not by the caller
+    assert arg.threads
+    assert threading.current_thread() not in arg.threads
+
+def test_config_again(logs_dir):
+    logger.config(False, logging.DEBUG, str(logs_dir))
+    logger.info("first")
+    logger.config(False, logging.DEBUG, str(logs_dir))
+    logger.info("second")
+    logger.shutdown()
+    log = __read_log(logs_dir)
+    assert log.count("first") == 1
+    assert log.count("second") == 1
+    assert log.index("first") < log.index("second")
+
+def test_set_level_invalid():
+    with pytest.raises(ValueError):
+        logger.set_level("verbose")
@@ -8,6 +8,7 @@ sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
 
 # tested module
 import ods_reader
+import text_grid
 
 # -----------------------------------------------------------------------------
 
@@ -22,3 +23,45 @@ def test_bom():
     assert grid.rows_raw()[-3][2] == "100n"
     # check if empty cells were appended
     assert grid.rows_raw()[0][14] == ""
+
+def test_bom_engines():
+    grid = ods_reader.read_ods_sheet(f"{tests_path}/assets/bom.ods")
+    grid_odfpy = ods_reader.read_ods_sheet(f"{tests_path}/assets/bom.ods", engine="odfpy")
+    assert (grid.nrows, grid.ncols) == (grid_odfpy.nrows, grid_odfpy.ncols)
+    assert grid.rows_raw() == grid_odfpy.rows_raw()
+
+@pytest.mark.parametrize("engine", ["stream", "odfpy"])
+def test_rows_repeated(engine, tmp_path):
+    from odf import opendocument, table, text
+    doc = opendocument.OpenDocumentSpreadsheet()
+    tab = table.Table(name="BOM")
+    for cells, repeated in ((["Designator", "Comment", "Footprint", "Qty"], 1),
+                            (["R1", "10k", "0603", "1"], 3),
+                            (["C1", "100n", "0402", "1"], 1_000_000)):
+        tr = table.TableRow(numberrowsrepeated=repeated)
+        for cell in cells:
+            tc = table.TableCell()
+            tc.addElement(text.P(text=cell))
+            tr.addElement(tc)
+        tab.addElement(tr)
+    doc.spreadsheet.addElement(tab)
+    doc.save(str(tmp_path / "rows.ods"))
+
+    grid = ods_reader.read_ods_sheet(str(tmp_path / "rows.ods"), engine=engine)
+    assert grid.nrows == 1 + 3 + ods_reader.MAX_ROW_REPEATS
+    assert grid.rows_raw()[1:4] == [["R1", "10k", "0603", "1"]] * 3
+    assert grid.rows_raw()[-1] == ["C1", "100n", "0402", "1"]
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        ods_reader.read_ods_sheet(f"{tests_path}/assets/bom.ods", engine="dom")
+
+@pytest.mark.parametrize("engine", ["stream", "odfpy"])
+def test_bom_window(engine):
+    grid = ods_reader.read_ods_sheet(f"{tests_path}/assets/bom.ods", engine=engine)
+    window = text_grid.RowWindow(first=2, last=9, max_rows=5)
+    grid_part = ods_reader.read_ods_sheet(f"{tests_path}/assets/bom.ods", engine=engine, window=window)
+    assert window.end() == 7
+    assert grid_part.nrows == 7
+    assert [row[:4] for row in grid_part.rows_raw()[:2]] == [row[:4] for row in grid.rows_raw()[:2]]
+    assert [row[:grid_part.ncols] for row in grid.rows_raw()[2:7]] == grid_part.rows_raw()[2:]
@@ -0,0 +1,101 @@
+import pytest
+import sys
+import os
+import json
+import pstats
+import re
+
+# adding src path to search list
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
+
+# tested module
+import perf
+import cross_check
+import report_generator
+
+# -----------------------------------------------------------------------------
+
+def test_outside_run():
+    assert perf.current() is None
+    with perf.stage("stage"):
+        perf.count("counter")
+    assert perf.current() is None
+
+def test_stages_and_counters():
+    with perf.run("test") as stats:
+        assert perf.current() is stats
+        for _ in range(3):
+            with perf.stage("a"):
+                perf.count("items", 2)
+        with perf.stage("b"):
+            perf.count("other")
+    assert perf.current() is None
+
+    assert list(stats.stages) == ["a", "b"]
+    assert stats.counters == {"items": 6, "other": 1}
+    assert stats.total >= stats.stages["a"] + stats.stages["b"]
+
+def test_stage_exception():
+    with perf.run("test") as stats:
+        with pytest.raises(ValueError):
+            with perf.stage("failed"):
+                raise ValueError()
+    assert "failed" in stats.stages
+
+def test_nested_run():
+    with perf.run("outer") as outer:
+        with perf.run("inner") as inner:
+            perf.count("items")
+        assert perf.current() is outer
+    assert inner is outer
+    assert outer.counters == {"items": 1}
+
+def test_timed():
+    @perf.timed("double")
+    def double(n: int) -> int:
+        return 2 * n
+
+    with perf.run("test") as stats:
+        assert double(2) == 4
+    assert double.__name__ == "double"
+    assert "double" in stats.stages
+
+def test_json_line():
+    with perf.run("test") as stats:
+        with perf.stage("a"):
+            perf.count("items", 5)
+    line = stats.to_json()
+    assert "\n" not in line
+    data = json.loads(line)
+    assert data["run"] == "test"
+    assert list(data["stages_ms"]) == ["a"]
+    assert data["counters"] == {"items": 5}
+
+def test_report_section():
+    with perf.run("test") as stats:
+        perf.count("pairs tested", 123)
+    ccr = cross_check.CrossCheckResult()
+    html = report_generator.prepare_html_report("bom.csv", ("pnp.csv", ""), 1.0, ccr, stats)
+    assert "<summary" in html and "Performance" in html
+    assert re.search(r"pairs tested : +123\n", html)
+    assert "Performance" not in report_generator.prepare_html_report("bom.csv", ("pnp.csv", ""), 1.0, ccr)
+
+    report = json.loads(report_generator.prepare_json_report("bom.csv", ("pnp.csv", ""), 1.0, ccr, stats))
+    assert report["performance"]["counters"] == {"pairs tested": 123}
+
+def test_profile_once(tmp_path, monkeypatch):
+    prof_path = tmp_path / "run.prof"
+    monkeypatch.setenv(perf.PROFILE_ENV, str(prof_path))
+    monkeypatch.setattr(perf, "__profiled", False)
+
+    with perf.run("profiled"):
+        sum(range(1000))
+    assert prof_path.exists()
+    assert pstats.Stats(str(prof_path)).total_calls > 0
+
+    # only the first run is profiled
+    os.remove(prof_path)
+    with perf.run("not profiled"):
+        pass
+    assert not prof_path.exists()
@@ -0,0 +1,100 @@
+import pytest
+import sys
+import os
+
+# adding src path to search list
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
+
+# tested module
+import report_generator
+import cross_check
+
+# -----------------------------------------------------------------------------
+
+@pytest.fixture
+def ccresult(monkeypatch):
+    # the same "Generated" time in every report
+    monkeypatch.setattr(report_generator.time, "strftime", lambda fmt: "2026-10-18, 12:00:00")
+    ccr = cross_check.CrossCheckResult()
+    ccr.bom_parst_missing_in_pnp = [(f"R{n}", "10k") for n in range(1, 121)]
+    ccr.pnp_parst_missing_in_bom = [("FID1", "Fiducial")]
+    ccr.parts_comment_mismatch = [("C1", "100n", "100nF", "0603")]
+    ccr.parts_coord_conflicts = [("C1", "R10", 1.25)]
+    return ccr
+
+class Sink:
+    """Records every write"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, text: str):
+        self.chunks.append(text)
+
+def test_write_sections(ccresult):
+    sink = Sink()
+    report_generator.write_html_report(sink, "bom.csv", ("pnp.csv", ""), 3.0, ccresult)
+    # written piece by piece, never as a whole
+    assert len(sink.chunks) > 120
+    html = "".join(sink.chunks)
+    assert html == report_generator.prepare_html_report("bom.csv", ("pnp.csv", ""), 3.0, ccresult)
+
+    assert "BOM parts missing in the PnP: 120" in html
+    assert "R120: 10k\n" in html
+    assert "PnP parts missing in the BOM: 1" in html
+    assert "FID1: Fiducial\n" in html
+    assert "BOM and PnP comment mismatch: 1" in html
+    assert "PnP overlapping components (distance between centers < 3.0mm): 1" in html
+    assert "C1 <--> R10 = 1.2" in html
+
+def test_summary_only(ccresult):
+    html = report_generator.prepare_html_report("bom.csv", ("pnp.csv", ""), 3.0, ccresult, summary_only=True)
+    # the counts are complete
+    assert "BOM parts missing in the PnP: 120" in html
+    # designators column: 4 chars wide
+    assert f"{'R' + str(report_generator.SUMMARY_MAX_ITEMS):4}: 10k\n" in html
+    assert f"{'R' + str(report_generator.SUMMARY_MAX_ITEMS + 1):4}: 10k\n" not in html
+    assert f"... {120 - report_generator.SUMMARY_MAX_ITEMS} more in the report file" in html
+    # short sections not truncated
+    assert "FID1: Fiducial\n" in html
+    assert html.count("more in the report file") == 1
+
+def test_write_file(ccresult, tmp_path):
+    report_html = report_generator.prepare_html_report("bom.csv", ("pnp.csv", "pnp2.csv"), 3.0, ccresult)
+    report_generator.save_html_report(tmp_path / "saved.html", report_html)
+    report_generator.write_html_report_file(tmp_path / "streamed.html", "bom.csv", ("pnp.csv", "pnp2.csv"), 3.0, ccresult)
+    assert (tmp_path / "streamed.html").read_text(encoding="utf-8") == (tmp_path / "saved.html").read_text(encoding="utf-8")
+
+def test_read_file(ccresult, tmp_path):
+    report_generator.write_html_report_file(tmp_path / "report.html", "bom.csv", ("pnp.csv", ""), 3.0, ccresult)
+    # the full report, copied to the clipboard, not the summary
+    report_html = report_generator.read_html_report_file(tmp_path / "report.html")
+    assert report_html == report_generator.prepare_html_report("bom.csv", ("pnp.csv", ""), 3.0, ccresult)
+    text = report_generator.html_report_text(report_html)
+    assert "R120: 10k\n" in text
+    assert "C1 <--> R10 = 1.2" in text
+    assert "distance between centers < 3.0mm" in text
+    assert "<pre" not in text and "</span>" not in text
+    assert "PnP: pnp.csv\nGenerated: 2026-10-18, 12:00:00\n" in text
+
+def test_designators_ranges():
+    ranges = getattr(report_generator, "__designators_ranges")
+    assert ranges(["C1"]) == "C1"
+    assert ranges(["C1", "C2"]) == "C1, C2"
+    assert ranges(["C1", "C2", "C3", "C7", "C9", "C10", "C11", "R4", "R5", "R6", "X"]) == "C1..C3, C7, C9..C11, R4..R6, X"
+
+def test_comment_mismatch_grouped(ccresult):
+    diff_comments = getattr(report_generator, "__diff_comments")
+    diff_comments.cache_clear()
+    ccresult.parts_comment_mismatch = [(f"C{n}", "100nF", "100n", "C0603") for n in range(1, 201)]
+    ccresult.parts_comment_mismatch.insert(5, ("C5A", "1u", "1uF", "C0603"))
+    html = report_generator.prepare_html_report("bom.csv", ("pnp.csv", ""), 3.0, ccresult)
+
+    assert "BOM and PnP comment mismatch: 201" in html
+    lines = [line for line in html.splitlines() if "BOM=" in line]
+    assert len(lines) == 2
+    assert lines[0].startswith("C1..C200: ")
+    assert lines[1].startswith("C5A     : ")
+    # every distinct comments pair compared once
+    assert diff_comments.cache_info().misses == 2
@@ -1,6 +1,8 @@
 import pytest
 import sys
 import os
+import random
+import tracemalloc
 
 # adding src path to search list
 tests_path = os.path.dirname(os.path.realpath(__file__))
@@ -47,4 +49,166 @@ def test_full_features():
     actual_lines = formatted.splitlines()
     for (act, exp) in zip(actual_lines, expected_lines):
         assert act == exp
+    # only the requested rows
+    assert tg.format_rows(3, 5, tg.get_columns_width(1)) == list(expected_lines[2:4])
 
+def test_append_column_extend():
+    tg = TextGrid()
+    tg.rows_raw().append(["R1", "10k", "0603"])
+    tg.nrows = 1
+    tg.ncols = 3
+    tg2 = TextGrid()
+    tg2.rows_raw().append(["R2", "1k", "0402"])
+    tg2.nrows = 1
+    tg2.ncols = 3
+
+    tg.append_column("top")
+    tg2.append_column("bot")
+    tg.extend(tg2)
+    assert tg.nrows == 2
+    assert tg.ncols == 4
+    assert tg.rows_raw() == [["R1", "10k", "0603", "top"], ["R2", "1k", "0402", "bot"]]
+
+def test_columnar_default():
+    tg = ColumnarTextGrid()
+    assert tg.nrows == 0
+    assert tg.ncols == 0
+    assert len(tg.rows_raw()) == 0
+    assert list(tg.rows_raw()) == []
+
+def test_columnar_full_features():
+    rows = (
+        ["List of materials"],
+        ["ID", "Val", "Comment"],
+        ["#", None, ""],
+        ["R1", "15k", "resistor"],
+        ["R3", "1.2", None],
+        ["Jumper", ""],
+        ["U1", "STM32F12345678", "4321"],
+    )
+    tg = TextGrid()
+    ctg = ColumnarTextGrid()
+    for row in rows:
+        tg.rows_raw().append(list(row))
+        ctg.rows_raw().append(list(row))
+    tg.nrows = ctg.nrows = len(rows)
+    tg.ncols = ctg.ncols = 3
+    tg.align_number_of_columns()
+    ctg.align_number_of_columns()
+
+    assert ctg.rows_raw()[0] == ["List of materials", "", ""]
+    assert ctg.rows_raw()[-1] == ["U1", "STM32F12345678", "4321"]
+    assert ctg.rows_raw()[2:4] == [["#", "", ""], ["R1", "15k", "resistor"]]
+    # non-string cells are stored as text
+    assert list(ctg.rows_raw()) == [[TextGrid.format_cell(cell) for cell in row] for row in tg.rows_raw()]
+    assert ctg.format_grid(1) == tg.format_grid(1)
+    with pytest.raises(IndexError):
+        ctg.rows_raw()[len(rows)]
+
+    # rows added after the string table was packed
+    ctg.append_column("top")
+    ctg2 = ColumnarTextGrid()
+    ctg2.rows_raw().append(["R4", "15k"])
+    ctg2.nrows = 1
+    ctg2.ncols = 3
+    ctg2.append_column("bot")
+    ctg.extend(ctg2)
+    assert ctg.nrows == len(rows) + 1
+    assert ctg.rows_raw()[0] == ["List of materials", "", "", "top"]
+    assert ctg.rows_raw()[-1] == ["R4", "15k", "", "bot"]
+    # widths recomputed after the grid was changed
+    tg.append_column("top")
+    assert ctg.format_grid(0) != tg.format_grid(0)
+    tg.extend(ctg2)
+    assert ctg.format_grid(0) == tg.format_grid(0)
+    assert ctg.format_rows(5, 100, ctg.get_columns_width(0)) == tg.format_rows(5, 100, tg.get_columns_width(0))
+
+def test_columns_width_cache():
+    tg = TextGrid()
+    tg.rows_raw().extend([["R1", "10k"], ["R2", "1k"]])
+    tg.nrows = 2
+    tg.ncols = 2
+    assert tg.get_columns_width(0) == [2, 3, 0]
+    # returned list is a copy
+    tg.get_columns_width(0).clear()
+    assert tg.get_columns_width(0) == [2, 3, 0]
+    tg.rows_raw().append(["R100", "4.7k"])
+    assert tg.get_columns_width(0) == [4, 4, 0]
+    assert tg.get_columns_width(2) == [4, 4, 0]
+    assert tg.get_columns_width(0) == [4, 4, 0]
+
+def __pnp_lines(nrows: int) -> list[str]:
+    """CSV lines of a typical PnP export"""
+    rnd = random.Random(0)
+    comments = [f"{v}{u}" for v in (1, 2.2, 4.7, 10, 22, 47, 100) for u in ("R", "k", "nF", "uF")]
+    footprints = ["0402", "0603", "0805", "1206", "SOT23", "SOIC8", "QFN32"]
+    lines = []
+    for n in range(nrows):
+        lines.append(",".join((
+            f"C{n+1}", rnd.choice(comments), rnd.choice(("TopLayer", "BottomLayer")), rnd.choice(footprints),
+            f"{rnd.uniform(0, 300):.4f}", f"{rnd.uniform(0, 200):.4f}", rnd.choice(("0", "90", "180", "270")),
+            "Standard", "", ""
+        )))
+    return lines
+
+def __traced_grid_size(grid_type: type, lines: list[str]) -> int:
+    tracemalloc.start()
+    tg = grid_type()
+    for line in lines:
+        tg.rows_raw().append(line.split(","))
+    tg.nrows = len(lines)
+    tg.ncols = 10
+    tg.align_number_of_columns()
+    size = tracemalloc.take_snapshot().statistics("filename")
+    tracemalloc.stop()
+    # keep the grid alive until measured
+    assert tg.nrows == len(lines)
+    return sum(stat.size for stat in size)
+
+def test_columnar_memory():
+    NROWS = 20_000
+    lines = __pnp_lines(NROWS)
+    ncells = NROWS * 10
+    list_size = __traced_grid_size(TextGrid, lines)
+    columnar_size = __traced_grid_size(ColumnarTextGrid, lines)
+    assert columnar_size > 0
+    # list: a str object per cell; columnar: 4-byte string index per cell, repeated strings stored once
+    assert columnar_size / ncells < 16
+    assert columnar_size * 4 <= list_size
+
+def test_configured_project_rows():
+    for grid_type in (TextGrid, ColumnarTextGrid):
+        cfg = ConfiguredTextGrid()
+        cfg.text_grid = grid_type()
+        cfg.text_grid.rows_raw().append(["Report"])
+        cfg.text_grid.rows_raw().append(["Dsgn", "Cmnt", "X", "Y", "Layer", "X"])
+        cfg.text_grid.rows_raw().append(["R1", "10k", "1.0", "2.0", "Top", "9.9"])
+        cfg.text_grid.rows_raw().append(["R2", "1k", "3.0", "4.0", "Bot", "9.9"])
+        cfg.text_grid.rows_raw().append(["notes", "", "", "", "", ""])
+        cfg.text_grid.nrows = 5
+        cfg.text_grid.ncols = 6
+        cfg.text_grid.align_number_of_columns()
+        cfg.first_row = 1
+        cfg.last_row = 4
+        cfg.designator_col = "Dsgn"
+        cfg.comment_col = "Cmnt"
+        cfg.coord_x_col = "X"
+        cfg.coord_y_col = "Y"
+        cfg.layer_col = "Layer"
+        cfg.footprint_col = "Footprint"
+
+        # repeated header: the first column is used
+        assert cfg.header_index()["X"] == 2
+        assert cfg.column_index("Footprint") == -1
+        assert cfg.resolve_columns(False) == (0, 1, None, None, None, None)
+        columns = cfg.resolve_columns(True)
+        assert columns == (0, 1, 2, 3, 4, None)
+        assert list(cfg.project_rows(columns)) == [
+            ("R1", "10k", "1.0", "2.0", "Top", ""),
+            ("R2", "1k", "3.0", "4.0", "Bot", ""),
+        ]
+        assert list(cfg.project_rows((1, None, 0))) == [("10k", "", "R1"), ("1k", "", "R2")]
+
+        # header map refreshed when the first row changes
+        cfg.first_row = 2
+        assert cfg.column_index("R1") == 0
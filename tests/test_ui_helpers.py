@@ -0,0 +1,42 @@
+import pytest
+import sys
+import os
+
+# adding src path to search list
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
+
+customtkinter = pytest.importorskip("customtkinter")
+import tkinter
+
+# tested module
+import ui_helpers
+from grid_preview import GridPreview
+from text_grid import TextGrid
+
+# -----------------------------------------------------------------------------
+
+@pytest.fixture
+def root():
+    try:
+        root = customtkinter.CTk()
+    except tkinter.TclError as e:
+        pytest.skip(f"no display: {e}")
+    yield root
+    root.destroy()
+
+def test_render_with_hits(root):
+    tg = TextGrid()
+    tg.rows_raw().append(["Designator", "Comment"])
+    for n in range(200):
+        tg.rows_raw().append([f"C{n+1}", "100nF" if n % 10 else "10uF"])
+    (tg.nrows, tg.ncols) = (201, 2)
+
+    box = ui_helpers.GridPreviewBox(root)
+    box.set_preview(GridPreview(tg))
+    assert box.find("10uF") == 20
+    box.render()
+    ranges = box.textbox.tag_ranges("search_current")
+    assert len(ranges) == 2
+    assert box.textbox.get(ranges[0], ranges[1]) == "10uF"
+    assert len(box.textbox.tag_ranges("search")) > 0
@@ -9,6 +9,7 @@ sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
 
 # tested module
 import xls_reader
+import text_grid
 
 # -----------------------------------------------------------------------------
 
@@ -24,3 +25,21 @@ def test_bom():
     assert grid.rows_raw()[-1][2] == "HC-49U"
     # check if empty cells were appended
     assert grid.rows_raw()[1][9] == ""
+
+def test_bom_columnar():
+    grid = xls_reader.read_xls_sheet(f"{tests_path}/assets/bom.xls")
+    grid_col = xls_reader.read_xls_sheet(f"{tests_path}/assets/bom.xls", columnar=True)
+    assert grid_col.nrows == grid.nrows
+    assert grid_col.ncols == grid.ncols
+    assert grid_col.rows_raw() == grid.rows_raw()
+
+def test_date_cell():
+    grid = xls_reader.read_xls_sheet(f"{tests_path}/../examples/example4/BOM-cpu1-e4.xls")
+    assert any("2023-04-14 00:00:00" in row for row in grid.rows_raw())
+
+def test_bom_window():
+    grid = xls_reader.read_xls_sheet(f"{tests_path}/assets/bom.xls")
+    grid_part = xls_reader.read_xls_sheet(f"{tests_path}/assets/bom.xls", window=text_grid.RowWindow(first=2, last=9))
+    assert grid_part.nrows == 10
+    assert [row[:4] for row in grid_part.rows_raw()[:2]] == [row[:4] for row in grid.rows_raw()[:2]]
+    assert grid_part.rows_raw()[2:] == grid.rows_raw()[2:10]
@@ -8,6 +8,7 @@ sys.path.append(os.path.join(os.path.dirname(tests_path), "src"))
 
 # tested module
 import xlsx_reader
+import text_grid
 
 # -----------------------------------------------------------------------------
 
@@ -22,3 +23,19 @@ def test_bom():
     assert grid.rows_raw()[-1][3] == "MURA-BLM18PG_KG-CHIP-2_V1"
     # check if empty cell was appended
     assert grid.rows_raw()[1][7] == ""
+
+def test_bom_last_row():
+    grid = xlsx_reader.read_xlsx_sheet(f"{tests_path}/assets/bom.xlsx")
+    grid_part = xlsx_reader.read_xlsx_sheet(f"{tests_path}/assets/bom.xlsx", window=text_grid.RowWindow(last=4))
+    assert grid_part.nrows == 5
+    assert grid_part.ncols == grid.ncols
+    assert grid_part.rows_raw() == grid.rows_raw()[:5]
+
+def test_bom_window():
+    grid = xlsx_reader.read_xlsx_sheet(f"{tests_path}/assets/bom.xlsx")
+    grid_part = xlsx_reader.read_xlsx_sheet(f"{tests_path}/assets/bom.xlsx", window=text_grid.RowWindow(first=3, max_rows=5))
+    assert grid_part.nrows == 3 + 5
+    # rows before the window are numbered, but not converted
+    assert len(grid_part.rows_raw()[0]) == grid.ncols
+    assert grid_part.rows_raw()[0][:4] == grid.rows_raw()[0][:4]
+    assert grid_part.rows_raw()[3:] == grid.rows_raw()[3:8]